@@ -0,0 +1,129 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+import timeit
+import logging
+import resource
+import multiprocessing
+from concurrent import futures
+import grpc
+import numpy as np
+from src.orderbook_server import OrderBookServer
+from src.async_orderbook_server import AsyncOrderBookServer
+from src.orderbook_service_pb2 import SubscriptionRequest, Order
+from src.orderbook_service_pb2_grpc import OrderBookServiceStub, add_OrderBookServiceServicer_to_server
+from src.orderbook_logger import configure_logging, TextLogSink
+
+SEED = 42
+rng = np.random.default_rng(SEED)
+
+STREAMS_PER_CHANNEL = 100
+
+def run_server(mode, config, ports, stop):
+    configure_logging(TextLogSink(open(os.devnull, 'w')), level=logging.WARNING)
+    if mode == "async":
+        async def main():
+            server = grpc.aio.server()
+            add_OrderBookServiceServicer_to_server(AsyncOrderBookServer(config), server)
+            ports.put(server.add_insecure_port('127.0.0.1:0'))
+            await server.start()
+            await asyncio.get_running_loop().run_in_executor(None, stop.wait)
+            await server.stop(None)
+        asyncio.run(main())
+    else:
+        servicer = OrderBookServer(config)
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=config['max_workers']))
+        add_OrderBookServiceServicer_to_server(servicer, server)
+        ports.put(server.add_insecure_port('127.0.0.1:0'))
+        server.start()
+        stop.wait()
+        server.stop(None)
+        servicer.close()
+
+async def open_subscribers(port, symbols, num_subscribers, timeout):
+    channels = [grpc.aio.insecure_channel(f'127.0.0.1:{port}', options=[('grpc.use_local_subchannel_pool', 1)])
+                for _ in range((num_subscribers + STREAMS_PER_CHANNEL - 1) // STREAMS_PER_CHANNEL)]
+    streams = []
+    for index in range(num_subscribers):
+        call = OrderBookServiceStub(channels[index // STREAMS_PER_CHANNEL]).SubscribeOrderBook()
+        await call.write(SubscriptionRequest(symbol=symbols[index % len(symbols)], subscribe=True))
+        streams.append(call)
+    try:
+        await asyncio.wait_for(asyncio.gather(*(call.read() for call in streams)), timeout)
+    except asyncio.TimeoutError:
+        pass
+    return channels, streams
+
+async def close_stream(call, symbol):
+    try:
+        await call.write(SubscriptionRequest(symbol=symbol, subscribe=False))
+        await call.done_writing()
+        while await call.read() != grpc.aio.EOF:
+            pass
+    except (grpc.aio.AioRpcError, asyncio.InvalidStateError):
+        pass
+
+async def drive(port, symbols, num_subscribers, num_orders, timeout):
+    channels, streams = await open_subscribers(port, symbols, num_subscribers, timeout)
+    order_channel = grpc.aio.insecure_channel(f'127.0.0.1:{port}', options=[('grpc.use_local_subchannel_pool', 1)])
+    stub = OrderBookServiceStub(order_channel)
+    subscribers = {symbol: [call for index, call in enumerate(streams) if index % len(symbols) == position]
+                   for position, symbol in enumerate(symbols)}
+    place_latencies, fan_out_latencies = [], []
+    try:
+        for order_id in range(num_orders):
+            symbol = symbols[order_id % len(symbols)]
+            side = "buy" if rng.random() < 0.5 else "sell"
+            price = f"{rng.integers(9900, 10100) / 100:.2f}"
+            start = timeit.default_timer()
+            await asyncio.wait_for(stub.PlaceOrder(Order(symbol=symbol, order_id=str(order_id), side=side, type="limit",
+                                                         price=price, quantity=int(rng.integers(1, 101)))), timeout)
+            place_latencies.append(timeit.default_timer() - start)
+            await asyncio.wait_for(asyncio.gather(*(call.read() for call in subscribers[symbol])), timeout)
+            fan_out_latencies.append(timeit.default_timer() - start)
+    except asyncio.TimeoutError:
+        place_latencies = None
+    try:
+        await asyncio.wait_for(asyncio.gather(*(close_stream(call, symbols[index % len(symbols)])
+                                                for index, call in enumerate(streams))), timeout)
+    except asyncio.TimeoutError:
+        for call in streams:
+            call.cancel()
+    for channel in channels + [order_channel]:
+        await channel.close()
+    return place_latencies, fan_out_latencies
+
+def run_load_test():
+    configure_logging(TextLogSink(open(os.devnull, 'w')), level=logging.WARNING)
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    symbols = [f"SYM{i}" for i in range(10)]
+    config = {"server_port": 0, "max_workers": 10, "instruments": {symbol: {"tick_size": "0.01"} for symbol in symbols}}
+    num_orders = 200
+    context = multiprocessing.get_context("spawn")
+
+    print(f"{'Server':<22} {'Subscribers':<12} {'Place p50 (ms)':<16} {'Place p99 (ms)':<16} {'Fan-out p50 (ms)':<18} {'Fan-out p99 (ms)':<18}")
+    print("-" * 104)
+    for mode, num_subscribers in (("sync, 10 workers", 5), ("sync, 10 workers", 11), ("async", 1000), ("async", 5000)):
+        ports = context.Queue()
+        stop = context.Event()
+        process = context.Process(target=run_server, args=(mode.split(",")[0], config, ports, stop), daemon=True)
+        process.start()
+        try:
+            place, fan_out = asyncio.run(drive(ports.get(timeout=30), symbols, num_subscribers, num_orders, timeout=5))
+        finally:
+            stop.set()
+            process.join(timeout=10)
+            if process.is_alive():
+                process.kill()
+        if place is None:
+            print(f"{mode:<22} {num_subscribers:<12} {'blocked: PlaceOrder timed out after 5 s'}")
+            continue
+        place_p50, place_p99 = np.percentile(place, [50, 99]) * 1e3
+        fan_p50, fan_p99 = np.percentile(fan_out, [50, 99]) * 1e3
+        print(f"{mode:<22} {num_subscribers:<12} {place_p50:<16.2f} {place_p99:<16.2f} {fan_p50:<18.2f} {fan_p99:<18.2f}")
+
+if __name__ == "__main__":
+    run_load_test()
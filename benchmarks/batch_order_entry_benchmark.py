@@ -0,0 +1,93 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import timeit
+import logging
+from decimal import Decimal
+from src.orderbook import Orderbook
+from src.order import Order
+from src.order_batch import OrderBatch
+from src.ticker import Ticker
+from src.orderbook_logger import configure_logging, TextLogSink
+import numpy as np
+
+SEED = 42
+rng = np.random.default_rng(SEED)
+
+def generate_flow(num_orders, min_tick, max_tick):
+    mid_tick = (min_tick + max_tick) // 2
+    sides = rng.choice(["buy", "sell"], size=num_orders)
+    ticks = np.where(sides == "buy",
+                     rng.integers(min_tick, mid_tick + 20, size=num_orders),
+                     rng.integers(mid_tick - 20, max_tick, size=num_orders))
+    types = np.where(rng.random(num_orders) < 0.05, "market", "limit")
+    quantities = rng.integers(1, 101, size=num_orders)
+    return np.arange(num_orders), types, sides, ticks, quantities
+
+def setup_orderbook(ticker, num_initial_orders, min_tick, max_tick):
+    orderbook = Orderbook(ticker)
+    mid_tick = (min_tick + max_tick) // 2
+    for i in range(num_initial_orders):
+        side = "buy" if i % 2 == 0 else "sell"
+        tick = rng.integers(min_tick, mid_tick) if side == "buy" else rng.integers(mid_tick + 1, max_tick)
+        orderbook.add_order(Order(-1 - i, "limit", side, ticker.to_price(int(tick)), 100, "TEST"))
+    return orderbook
+
+def run_single(orderbook, ticker, flow, batch_size):
+    ids, types, sides, ticks, quantities = (column.tolist() for column in flow)
+    prices = [ticker.to_price(tick) if order_type == "limit" else None for order_type, tick in zip(types, ticks)]
+    start = timeit.default_timer()
+    for i in range(len(ids)):
+        orderbook.add_order(Order(ids[i], types[i], sides[i], prices[i], quantities[i], "TEST"))
+    return timeit.default_timer() - start
+
+def run_order_batches(orderbook, ticker, flow, batch_size):
+    ids, types, sides, ticks, quantities = (column.tolist() for column in flow)
+    prices = [ticker.to_price(tick) if order_type == "limit" else None for order_type, tick in zip(types, ticks)]
+    start = timeit.default_timer()
+    for offset in range(0, len(ids), batch_size):
+        end = offset + batch_size
+        orderbook.add_orders([Order(*params, "TEST") for params in
+                              zip(ids[offset:end], types[offset:end], sides[offset:end], prices[offset:end], quantities[offset:end])])
+    return timeit.default_timer() - start
+
+def run_columnar_batches(orderbook, ticker, flow, batch_size):
+    ids, types, sides, ticks, quantities = flow
+    start = timeit.default_timer()
+    for offset in range(0, len(ids), batch_size):
+        end = offset + batch_size
+        orderbook.add_orders(OrderBatch(ids[offset:end], types[offset:end], sides[offset:end],
+                                        quantities[offset:end], ticks=ticks[offset:end]))
+    return timeit.default_timer() - start
+
+def run_benchmarks():
+    configure_logging(TextLogSink(open(os.devnull, 'w')), level=logging.WARNING)
+    ticker = Ticker("TEST", Decimal('0.01'))
+    min_tick, max_tick = 9000, 11000
+    num_initial_orders = 10**4
+    num_orders = 2**17
+    batch_sizes = [1, 64, 1024, 65536]
+    paths = [
+        ("add_order", run_single),
+        ("add_orders(orders)", run_order_batches),
+        ("add_orders(columns)", run_columnar_batches),
+    ]
+
+    flow = generate_flow(num_orders, min_tick, max_tick)
+    initial_state = rng.bit_generator.state
+
+    print(f"{'Batch size':<12} {'Path':<22} {'Per order (μs)':<16} {'Orders/sec':<14} {'Speedup':<10}")
+    print("-" * 75)
+    for batch_size in batch_sizes:
+        baseline = None
+        for label, run in paths:
+            rng.bit_generator.state = initial_state
+            orderbook = setup_orderbook(ticker, num_initial_orders, min_tick, max_tick)
+            elapsed = run(orderbook, ticker, flow, batch_size)
+            per_order = elapsed / num_orders
+            baseline = baseline or per_order
+            print(f"{batch_size:<12} {label:<22} {per_order * 1e6:<16.2f} {1 / per_order:<14.0f} {baseline / per_order:<10.2f}")
+
+if __name__ == "__main__":
+    run_benchmarks()
@@ -0,0 +1,71 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gc
+import tempfile
+import timeit
+import logging
+from decimal import Decimal
+from src.orderbook import Orderbook
+from src.compact_orderbook import CompactOrderbook
+from src.checkpoint import write_checkpoint, read_checkpoint
+from src.order import Order
+from src.ticker import Ticker
+from src.orderbook_logger import configure_logging, TextLogSink
+import numpy as np
+
+SEED = 42
+rng = np.random.default_rng(SEED)
+
+def build_orderbook(book_class, ticker, num_orders, min_tick, max_tick):
+    mid_tick = (min_tick + max_tick) // 2
+    sides = rng.choice(["buy", "sell"], size=num_orders).tolist()
+    bid_ticks = rng.integers(min_tick, mid_tick, size=num_orders).tolist()
+    ask_ticks = rng.integers(mid_tick + 1, max_tick, size=num_orders).tolist()
+    quantities = rng.integers(1, 1001, size=num_orders).tolist()
+    prices = {tick: ticker.to_price(tick) for tick in range(min_tick, max_tick)}
+
+    orderbook = book_class(ticker)
+    start = timeit.default_timer()
+    for i in range(num_orders):
+        tick = bid_ticks[i] if sides[i] == "buy" else ask_ticks[i]
+        orderbook.add_order(Order(i, "limit", sides[i], prices[tick], quantities[i], "TEST"))
+    return orderbook, timeit.default_timer() - start
+
+def run_benchmarks():
+    configure_logging(TextLogSink(open(os.devnull, 'w')), level=logging.WARNING)
+    min_tick, max_tick = 9000, 11000
+    configurations = [
+        ("Tree", Orderbook, None),
+        ("Ladder", Orderbook, (Decimal("90"), Decimal("110"))),
+        ("Compact ladder", CompactOrderbook, (Decimal("90"), Decimal("110"))),
+    ]
+
+    print(f"{'Book side':<18} {'Orders':<10} {'Rebuild (s)':<14} {'Write (s)':<12} {'Size (MB)':<12} {'Restore (s)':<14} {'Speedup':<10}")
+    print("-" * 95)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "book.ckpt")
+        for num_orders in (10**5, 10**6):
+            for label, book_class, price_band in configurations:
+                ticker = Ticker("TEST", Decimal("0.01"), price_band)
+                orderbook, rebuild_time = build_orderbook(book_class, ticker, num_orders, min_tick, max_tick)
+
+                start = timeit.default_timer()
+                write_checkpoint(path, {"TEST": orderbook})
+                write_time = timeit.default_timer() - start
+                size_mb = os.path.getsize(path) / 2**20
+
+                del orderbook
+                gc.collect()
+                start = timeit.default_timer()
+                restored, _ = read_checkpoint(path)
+                restore_time = timeit.default_timer() - start
+                assert len(restored["TEST"].orders) == num_orders
+                del restored
+                gc.collect()
+
+                print(f"{label:<18} {num_orders:<10} {rebuild_time:<14.2f} {write_time:<12.2f} {size_mb:<12.1f} {restore_time:<14.3f} {rebuild_time / restore_time:<10.1f}")
+
+if __name__ == "__main__":
+    run_benchmarks()
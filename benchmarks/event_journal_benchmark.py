@@ -0,0 +1,83 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+import threading
+import timeit
+import logging
+from decimal import Decimal
+from src.orderbook_manager import OrderBookManager
+from src.event_journal import EventJournal
+from src.order import Order
+from src.orderbook_logger import configure_logging, TextLogSink
+import numpy as np
+
+SEED = 42
+rng = np.random.default_rng(SEED)
+
+def generate_orders(num_orders, num_threads, min_tick, max_tick):
+    mid_tick = (min_tick + max_tick) // 2
+    sides = rng.choice(["buy", "sell"], size=num_orders).tolist()
+    ticks = np.where(np.array(sides) == "buy",
+                     rng.integers(min_tick, mid_tick + 5, size=num_orders),
+                     rng.integers(mid_tick - 5, max_tick, size=num_orders)).tolist()
+    quantities = rng.integers(1, 101, size=num_orders).tolist()
+    orders = [(i, sides[i], Decimal(ticks[i]) / 100, quantities[i]) for i in range(num_orders)]
+    return [orders[thread::num_threads] for thread in range(num_threads)]
+
+def run_workload(journal_dir, sync, commit_delay, streams):
+    manager = OrderBookManager()
+    manager.create_order_book("TEST", Decimal("0.01"))
+    journal = None
+    if sync is not None:
+        journal = EventJournal(os.path.join(journal_dir, f"{sync}-{commit_delay}-{len(streams)}.wal"), sync, commit_delay)
+        manager.attach_journal(journal)
+    latencies = [[] for _ in streams]
+
+    def submit(thread, orders):
+        timer = timeit.default_timer
+        record = latencies[thread].append
+        for order_id, side, price, quantity in orders:
+            start = timer()
+            manager.process_order(Order(order_id, "limit", side, price, quantity, "TEST"))
+            record(timer() - start)
+
+    threads = [threading.Thread(target=submit, args=(thread, orders)) for thread, orders in enumerate(streams)]
+    start = timeit.default_timer()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = timeit.default_timer() - start
+    commits = 0
+    if journal is not None:
+        journal.close()
+        commits = journal.commits
+    return elapsed, np.concatenate(latencies) * 1e6, commits
+
+def run_benchmarks():
+    configure_logging(TextLogSink(open(os.devnull, 'w')), level=logging.WARNING)
+    min_tick, max_tick = 9000, 11000
+    num_orders = 20000
+    configurations = [
+        ("no journal", None, 0.0),
+        ("sync=none", "none", 0.0),
+        ("sync=flush", "flush", 0.0),
+        ("sync=fsync", "fsync", 0.0),
+        ("sync=fsync +200μs", "fsync", 0.0002),
+        ("sync=fsync +1ms", "fsync", 0.001),
+    ]
+
+    print(f"{'Configuration':<20} {'Threads':<9} {'Orders/sec':<12} {'Median (μs)':<13} {'99th % (μs)':<13} {'Records/commit':<15}")
+    print("-" * 85)
+    with tempfile.TemporaryDirectory() as journal_dir:
+        for num_threads in (1, 8, 32):
+            streams = generate_orders(num_orders, num_threads, min_tick, max_tick)
+            for label, sync, commit_delay in configurations:
+                elapsed, times_us, commits = run_workload(journal_dir, sync, commit_delay, streams)
+                per_commit = f"{(num_orders + 1) / commits:.1f}" if commits else "-"
+                print(f"{label:<20} {num_threads:<9} {num_orders / elapsed:<12.0f} {np.median(times_us):<13.2f} {np.percentile(times_us, 99):<13.2f} {per_commit:<15}")
+
+if __name__ == "__main__":
+    run_benchmarks()
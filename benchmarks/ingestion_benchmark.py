@@ -0,0 +1,130 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+import tempfile
+import timeit
+import tracemalloc
+import logging
+from decimal import Decimal
+from src.orderbook import Orderbook
+from src.ingest import read_csv, write_binary, read_binary, read_ahead, feed, EVENT_DTYPE
+from src.event_journal import OP_LIMIT, OP_MARKET, OP_CANCEL, OP_MODIFY
+from src.ticker import Ticker
+from src.orderbook_logger import configure_logging, TextLogSink
+import numpy as np
+
+SEED = 42
+rng = np.random.default_rng(SEED)
+
+def generate_chunks(num_events, chunk_size, min_tick, max_tick):
+    mid_tick = (min_tick + max_tick) // 2
+    for start in range(0, num_events, chunk_size):
+        size = min(chunk_size, num_events - start)
+        events = np.zeros(size, dtype=EVENT_DTYPE)
+        events['op'] = rng.choice([OP_LIMIT, OP_MARKET, OP_CANCEL, OP_MODIFY], size=size, p=[0.7, 0.05, 0.2, 0.05])
+        events['side'] = rng.integers(0, 2, size=size)
+        order_ids = np.arange(start, start + size)
+        is_reference = events['op'] >= OP_CANCEL
+        events['order_id'] = np.where(is_reference, np.maximum(order_ids - rng.integers(1, 5000, size=size), 0), order_ids)
+        events['tick'] = np.where(events['side'] == 0, rng.integers(min_tick, mid_tick + 5, size=size),
+                                  rng.integers(mid_tick - 5, max_tick, size=size))
+        events['tick'][events['op'] != OP_LIMIT] = 0
+        events['quantity'] = np.where(events['op'] == OP_CANCEL, 0, rng.integers(1, 101, size=size))
+        events['timestamp'] = (start + np.arange(size)) * 1e-6
+        yield events
+
+def write_csv(path, ticker, chunks):
+    ops = np.array(["", "limit", "market", "cancel", "modify"])
+    sides = np.array(["buy", "sell"])
+    with open(path, 'w') as stream:
+        stream.write("timestamp,op,side,order_id,price,quantity\n")
+        for chunk in chunks:
+            prices = [str(ticker.to_price(tick)) if tick else "" for tick in chunk['tick'].tolist()]
+            stream.writelines(f"{timestamp:.6f},{op},{side},{order_id},{price},{quantity}\n" for timestamp, op, side, order_id, price, quantity in
+                              zip(chunk['timestamp'].tolist(), ops[chunk['op']].tolist(), sides[chunk['side']].tolist(),
+                                  chunk['order_id'].tolist(), prices, chunk['quantity'].tolist()))
+
+def write_json(path, ticker, chunks):
+    events = []
+    for chunk in chunks:
+        events.extend({"op": int(op), "side": int(side), "id": order_id, "price": str(ticker.to_price(tick)), "quantity": quantity}
+                      for op, side, order_id, tick, quantity in zip(chunk['op'].tolist(), chunk['side'].tolist(),
+                                                                     chunk['order_id'].tolist(), chunk['tick'].tolist(),
+                                                                     chunk['quantity'].tolist()))
+    with open(path, 'w') as stream:
+        json.dump({"events": events}, stream)
+
+def measure_read(read):
+    start = timeit.default_timer()
+    count = read()
+    elapsed = timeit.default_timer() - start
+    tracemalloc.start()
+    read()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+def count_events(chunks):
+    return sum(len(chunk) for chunk in chunks)
+
+def load_json(path):
+    with open(path) as stream:
+        return len(json.load(stream)["events"])
+
+def run_benchmarks():
+    configure_logging(TextLogSink(open(os.devnull, 'w')), level=logging.WARNING)
+    ticker = Ticker("TEST", Decimal('0.01'))
+    min_tick, max_tick = 9000, 11000
+    chunk_size = 65536
+    feed_events = 500000
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        print(f"{'Reader':<22} {'Events':<10} {'Events/sec':<14} {'Peak memory (MB)':<18}")
+        print("-" * 66)
+        for num_events in (10**6, 4 * 10**6):
+            csv_path = os.path.join(data_dir, f"{num_events}.csv")
+            binary_path = os.path.join(data_dir, f"{num_events}.bin")
+            rng.bit_generator.state = np.random.default_rng(SEED).bit_generator.state
+            write_csv(csv_path, ticker, generate_chunks(num_events, chunk_size, min_tick, max_tick))
+            rng.bit_generator.state = np.random.default_rng(SEED).bit_generator.state
+            write_binary(binary_path, ticker, generate_chunks(num_events, chunk_size, min_tick, max_tick))
+            readers = [
+                ("CSV chunks", lambda: count_events(read_csv(csv_path, ticker, chunk_size))),
+                ("Binary memmap chunks", lambda: count_events(read_binary(binary_path, chunk_size))),
+            ]
+            if num_events == 10**6:
+                json_path = os.path.join(data_dir, "events.json")
+                rng.bit_generator.state = np.random.default_rng(SEED).bit_generator.state
+                write_json(json_path, ticker, generate_chunks(num_events, chunk_size, min_tick, max_tick))
+                readers.insert(0, ("JSON document", lambda: load_json(json_path)))
+            for label, read in readers:
+                count, elapsed, peak = measure_read(read)
+                print(f"{label:<22} {count:<10} {count / elapsed:<14.0f} {peak / 2**20:<18.1f}")
+
+        print()
+        print(f"{'Feed into Orderbook':<22} {'Events':<10} {'Events/sec':<14} {'Rejected':<10}")
+        print("-" * 60)
+        csv_path = os.path.join(data_dir, "feed.csv")
+        binary_path = os.path.join(data_dir, "feed.bin")
+        rng.bit_generator.state = np.random.default_rng(SEED).bit_generator.state
+        write_csv(csv_path, ticker, generate_chunks(feed_events, chunk_size, min_tick, max_tick))
+        rng.bit_generator.state = np.random.default_rng(SEED).bit_generator.state
+        write_binary(binary_path, ticker, generate_chunks(feed_events, chunk_size, min_tick, max_tick))
+        sources = [
+            ("CSV", lambda: read_csv(csv_path, ticker, chunk_size), False),
+            ("CSV + read-ahead", lambda: read_csv(csv_path, ticker, chunk_size), True),
+            ("Binary", lambda: read_binary(binary_path, chunk_size), False),
+            ("Binary + read-ahead", lambda: read_binary(binary_path, chunk_size), True),
+        ]
+        for label, source, ahead in sources:
+            orderbook = Orderbook(ticker)
+            chunks = read_ahead(source()) if ahead else source()
+            start = timeit.default_timer()
+            result = feed(orderbook, chunks)
+            elapsed = timeit.default_timer() - start
+            print(f"{label:<22} {result.events:<10} {result.events / elapsed:<14.0f} {result.rejected:<10}")
+
+if __name__ == "__main__":
+    run_benchmarks()
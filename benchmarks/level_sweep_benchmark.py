@@ -0,0 +1,70 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import timeit
+import logging
+from decimal import Decimal
+from src.orderbook import Orderbook
+from src.compact_orderbook import CompactOrderbook
+from src.order import Order
+from src.ticker import Ticker
+from src.orderbook_logger import configure_logging, TextLogSink
+import numpy as np
+
+SEED = 42
+rng = np.random.default_rng(SEED)
+
+class WalkingOrderbook(Orderbook):
+    def _match_orders_at_level(self, level, quantity, filled_orders):
+        return self._walk_level(level, quantity, filled_orders)
+
+class WalkingCompactOrderbook(CompactOrderbook):
+    def _match_orders_at_level(self, level, quantity, filled_orders):
+        return self._walk_level(level, quantity, filled_orders)
+
+def setup_orderbook(book_class, ticker, num_levels, orders_per_level):
+    orderbook = book_class(ticker)
+    quantities = rng.integers(1, 101, size=num_levels * orders_per_level).tolist()
+    order_id = 0
+    for level in range(num_levels):
+        price = ticker.to_price(10000 + level)
+        for _ in range(orders_per_level):
+            orderbook.add_order(Order(order_id, "limit", "sell", price, quantities[order_id], "TEST"))
+            order_id += 1
+    return orderbook
+
+def measure_sweeps(book_class, ticker, swept_levels, orders_per_level, repeats):
+    latencies = []
+    for _ in range(repeats):
+        orderbook = setup_orderbook(book_class, ticker, swept_levels + 1, orders_per_level)
+        quantity = sum(level[1] for level in orderbook.get_order_book_snapshot(swept_levels)["asks"])
+        order = Order(-1, "market", "buy", None, quantity, "TEST")
+        start = timeit.default_timer()
+        orderbook.add_order(order)
+        latencies.append(timeit.default_timer() - start)
+        assert len(orderbook.asks) == 1
+    return np.array(latencies) * 1e6
+
+def run_benchmarks():
+    configure_logging(TextLogSink(open(os.devnull, 'w')), level=logging.WARNING)
+    ticker = Ticker("TEST", Decimal('0.01'))
+    repeats = 50
+    configurations = [
+        ("Orderbook (walk)", WalkingOrderbook),
+        ("Orderbook (sweep)", Orderbook),
+        ("Compact (walk)", WalkingCompactOrderbook),
+        ("Compact (sweep)", CompactOrderbook),
+    ]
+
+    print(f"{'Configuration':<22} {'Levels':<8} {'Orders/level':<14} {'Mean (μs)':<12} {'Median (μs)':<12} {'Per order (μs)':<16}")
+    print("-" * 90)
+    for swept_levels in (10, 100):
+        for orders_per_level in (10, 100):
+            for label, book_class in configurations:
+                times_us = measure_sweeps(book_class, ticker, swept_levels, orders_per_level, repeats)
+                per_order = np.median(times_us) / (swept_levels * orders_per_level)
+                print(f"{label:<22} {swept_levels:<8} {orders_per_level:<14} {np.mean(times_us):<12.2f} {np.median(times_us):<12.2f} {per_order:<16.3f}")
+
+if __name__ == "__main__":
+    run_benchmarks()
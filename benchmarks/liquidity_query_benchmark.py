@@ -0,0 +1,83 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import copy
+import timeit
+import logging
+from decimal import Decimal
+from src.orderbook import Orderbook
+from src.order import Order
+from src.ticker import Ticker
+from src.orderbook_logger import configure_logging, TextLogSink
+import numpy as np
+
+SEED = 42
+rng = np.random.default_rng(SEED)
+
+def generate_resting_orders(num_orders, min_tick, max_tick):
+    mid_tick = (min_tick + max_tick) // 2
+    sides = rng.choice(["buy", "sell"], size=num_orders).tolist()
+    bid_ticks = rng.integers(min_tick, mid_tick, size=num_orders).tolist()
+    ask_ticks = rng.integers(mid_tick + 1, max_tick, size=num_orders).tolist()
+    quantities = rng.integers(1, 1001, size=num_orders).tolist()
+    return [(i, sides[i], bid_ticks[i] if sides[i] == "buy" else ask_ticks[i], quantities[i]) for i in range(num_orders)]
+
+def build_orderbook(ticker, resting_orders, depth_index):
+    orderbook = Orderbook(ticker, depth_index=depth_index)
+    start = timeit.default_timer()
+    for order_id, side, tick, quantity in resting_orders:
+        orderbook.add_order(Order(order_id, "limit", side, ticker.to_price(tick), quantity, "TEST"))
+    return orderbook, (timeit.default_timer() - start) / len(resting_orders)
+
+def time_query(query, num_queries):
+    latencies = []
+    for _ in range(num_queries):
+        start = timeit.default_timer()
+        query()
+        latencies.append(timeit.default_timer() - start)
+    return np.array(latencies) * 1e6
+
+def run_benchmarks():
+    configure_logging(TextLogSink(open(os.devnull, 'w')), level=logging.WARNING)
+    ticker = Ticker("TEST", Decimal('0.01'))
+    min_tick, max_tick = 9000, 11000
+    num_queries = 2000
+    batch_size = 10000
+
+    print(f"{'Query':<32} {'Orders':<10} {'Index':<8} {'Mean (μs)':<12} {'Median (μs)':<12} {'99th % (μs)':<12}")
+    print("-" * 90)
+    for num_orders in (10**4, 10**5):
+        resting_orders = generate_resting_orders(num_orders, min_tick, max_tick)
+        for depth_index in (False, True):
+            orderbook, add_latency = build_orderbook(ticker, resting_orders, depth_index)
+            large_quantity = orderbook.available_volume("buy") // 2
+            batch_quantities = rng.integers(1, large_quantity, size=batch_size)
+            queries = [
+                ("Add limit order (per order)", None),
+                ("Volume within 50 ticks", lambda: orderbook.available_volume("buy", within_ticks=50)),
+                ("Volume to limit price", lambda: orderbook.available_volume("sell", Decimal("95.00"))),
+                ("Price for 5,000 lot", lambda: orderbook.price_for_quantity("buy", 5000)),
+                ("Price for half the side", lambda: orderbook.price_for_quantity("buy", large_quantity)),
+                ("Fill-or-kill check", lambda: orderbook.can_fill("sell", large_quantity, Decimal("98.00"))),
+                ("Estimate 5,000 lot", lambda: orderbook.estimate_fill("buy", 5000)),
+                ("Estimate half the side", lambda: orderbook.estimate_fill("buy", large_quantity)),
+                ("Estimate to limit price", lambda: orderbook.estimate_fill_to_price("sell", Decimal("95.00"))),
+                ("Batch estimate (per quantity)", lambda: orderbook.estimate_fills("buy", batch_quantities)),
+            ]
+            label = "yes" if depth_index else "no"
+            if not depth_index:
+                times_us = time_query(lambda: copy.deepcopy(orderbook).add_order(
+                    Order(-1, "market", "buy", None, large_quantity, "TEST")), 3)
+                print(f"{'Deepcopy + market order':<32} {num_orders:<10} {label:<8} {np.mean(times_us):<12.2f} {np.median(times_us):<12.2f} {np.percentile(times_us, 99):<12.2f}")
+            for name, query in queries:
+                if query is None:
+                    times_us = np.array([add_latency * 1e6])
+                elif name.startswith("Batch"):
+                    times_us = time_query(query, num_queries // 100) / batch_size
+                else:
+                    times_us = time_query(query, num_queries)
+                print(f"{name:<32} {num_orders:<10} {label:<8} {np.mean(times_us):<12.2f} {np.median(times_us):<12.2f} {np.percentile(times_us, 99):<12.2f}")
+
+if __name__ == "__main__":
+    run_benchmarks()
@@ -1,12 +1,14 @@
 import sys
 import os
-import copy
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import timeit
 import time
+import logging
 from decimal import Decimal
 from src.orderbook import Orderbook
+from src.orderbook_manager import OrderBookManager
+from src.sharded_orderbook_manager import ShardedOrderBookManager
 from src.order import Order
 from src.ticker import Ticker
 import numpy as np
@@ -258,7 +260,7 @@ def run_benchmarks():
         print("-" * 85)
 
         for operation in operations:
-            orderbooks = copy.deepcopy(initial_orderbooks)
+            orderbooks = [orderbook.clone() for orderbook in initial_orderbooks]
 
             if operation == "Add limit order":
                 params = iter(zip(*generate_limit_order_params(num_operations, min_price, max_price, tick_size, orderbooks)))
@@ -283,5 +285,66 @@ def run_benchmarks():
         print("\nBenchmark Summary:")
         print(f.read())
 
+def generate_sharded_flow(symbols, num_orders, min_tick, max_tick, first_id=0):
+    mid_tick = (min_tick + max_tick) // 2
+    symbol_indices = rng.integers(0, len(symbols), size=num_orders).tolist()
+    sides = rng.choice(["buy", "sell"], size=num_orders).tolist()
+    ticks = np.where(np.array(sides) == "buy", rng.integers(min_tick, mid_tick + 5, size=num_orders),
+                     rng.integers(mid_tick - 5, max_tick, size=num_orders)).tolist()
+    types = np.where(rng.random(num_orders) < 0.05, "market", "limit").tolist()
+    quantities = rng.integers(1, 101, size=num_orders).tolist()
+    return [(first_id + i, types[i], sides[i], Decimal(ticks[i]) / 100 if types[i] == "limit" else None, quantities[i], symbols[symbol_indices[i]])
+            for i in range(num_orders)]
+
+def run_sharded_flow(manager, flow, batch_size):
+    start = timeit.default_timer()
+    for offset in range(0, len(flow), batch_size):
+        manager.process_orders([Order(*fields) for fields in flow[offset:offset + batch_size]])
+    return timeit.default_timer() - start
+
+def run_shard_scaling_benchmark():
+    tick_size = Decimal('0.01')
+    min_tick, max_tick = 9000, 11000
+    symbols = [f"TEST{i}" for i in range(100)]
+    num_initial_orders = 100000
+    num_orders = 200000
+    batch_size = 2048
+    num_round_trips = 2000
+
+    initial_flow = generate_sharded_flow(symbols, num_initial_orders, min_tick, max_tick)
+    flow = generate_sharded_flow(symbols, num_orders, min_tick, max_tick, num_initial_orders)
+    print(f"\nShard scaling: {len(symbols)} symbols, {num_orders} orders in batches of {batch_size}, {os.cpu_count()} CPUs")
+    print(f"{'Manager':<22} {'Orders/sec':<14} {'Speedup':<10} {'Round trip (μs)':<16}")
+    print("-" * 65)
+    baseline = None
+    for num_shards in (0, 1, 2, 4, 8):
+        if num_shards:
+            manager = ShardedOrderBookManager(num_shards, log_level=logging.WARNING)
+            label = f"{num_shards} shard{'s' if num_shards > 1 else ''}"
+        else:
+            logging.getLogger("orderbook").setLevel(logging.WARNING)
+            manager = OrderBookManager()
+            label = "in-process"
+        for symbol in symbols:
+            manager.create_order_book(symbol, tick_size)
+        run_sharded_flow(manager, initial_flow, batch_size)
+        elapsed = run_sharded_flow(manager, flow, batch_size)
+
+        round_trips = []
+        for i in range(num_round_trips):
+            order = Order(num_initial_orders + num_orders + i, "limit", "buy", Decimal(min_tick) / 100, 1, symbols[i % len(symbols)])
+            start = timeit.default_timer()
+            manager.process_order(order)
+            round_trips.append(timeit.default_timer() - start)
+        if num_shards:
+            manager.close()
+
+        throughput = num_orders / elapsed
+        baseline = baseline or throughput
+        print(f"{label:<22} {throughput:<14.0f} {throughput / baseline:<10.2f} {np.median(round_trips) * 1e6:<16.2f}")
+
 if __name__ == "__main__":
-    run_benchmarks()
\ No newline at end of file
+    if "--shards" in sys.argv:
+        run_shard_scaling_benchmark()
+    else:
+        run_benchmarks()
\ No newline at end of file
@@ -0,0 +1,118 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import timeit
+import logging
+import multiprocessing
+from concurrent import futures
+import grpc
+import numpy as np
+from src.orderbook_server import OrderBookServerV2
+from src.orderbook_client import OrderEntrySession
+from src import orderbook_service_v2_pb2 as pb2_v2
+from src.orderbook_service_v2_pb2_grpc import OrderBookServiceStub, add_OrderBookServiceServicer_to_server
+from src.orderbook_logger import configure_logging, TextLogSink
+
+SEED = 42
+rng = np.random.default_rng(SEED)
+
+def run_server(config, ports, stop):
+    configure_logging(TextLogSink(open(os.devnull, 'w')), level=logging.WARNING)
+    servicer = OrderBookServerV2(config)
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=16))
+    add_OrderBookServiceServicer_to_server(servicer, server)
+    ports.put(server.add_insecure_port('127.0.0.1:0'))
+    server.start()
+    stop.wait()
+    server.stop(None)
+    servicer.close()
+
+def generate_orders(num_orders, first_id, min_tick, max_tick):
+    mid_tick = (min_tick + max_tick) // 2
+    sides = rng.choice(["buy", "sell"], size=num_orders)
+    ticks = np.where(sides == "buy", rng.integers(min_tick, mid_tick + 5, size=num_orders),
+                     rng.integers(mid_tick - 5, max_tick, size=num_orders))
+    quantities = rng.integers(1, 101, size=num_orders)
+    return [(first_id + i, str(side), int(tick), int(quantity)) for i, (side, tick, quantity) in enumerate(zip(sides, ticks, quantities))]
+
+def unary_orders(stub, symbol, orders):
+    for order_id, side, tick, quantity in orders:
+        stub.PlaceOrder(pb2_v2.Order(symbol=symbol, order_id=order_id, side=pb2_v2.BUY if side == "buy" else pb2_v2.SELL,
+                                     type=pb2_v2.LIMIT, price_ticks=tick, quantity=quantity))
+
+def streamed_orders(session, symbol, orders):
+    pending = [session.place_order(symbol, order_id, side, "limit", tick, quantity) for order_id, side, tick, quantity in orders]
+    for future in pending:
+        future.result()
+
+def requote_streamed(session, symbol, quotes, resting):
+    pending = [session.cancel_order(symbol, order_id) for order_id in resting]
+    pending += [session.place_order(symbol, order_id, side, "limit", tick, quantity) for order_id, side, tick, quantity in quotes]
+    for future in pending:
+        future.result()
+
+def run_benchmarks():
+    configure_logging(TextLogSink(open(os.devnull, 'w')), level=logging.WARNING)
+    config = {"server_port": 0, "instruments": {"TEST": {"tick_size": "0.01"}, "MM": {"tick_size": "0.01"}}}
+    num_unary = 3000
+    num_streamed = 50000
+    quote_size = 200
+    num_cycles = 20
+    context = multiprocessing.get_context("spawn")
+    ports = context.Queue()
+    stop = context.Event()
+    process = context.Process(target=run_server, args=(config, ports, stop), daemon=True)
+    process.start()
+    try:
+        channel = grpc.insecure_channel(f'127.0.0.1:{ports.get(timeout=30)}')
+        grpc.channel_ready_future(channel).result(timeout=10)
+        stub = OrderBookServiceStub(channel)
+
+        print(f"{'Order entry':<30} {'Orders':<10} {'Orders/sec':<14} {'Speedup':<10}")
+        print("-" * 66)
+        orders = generate_orders(num_unary, 0, 9000, 11000)
+        start = timeit.default_timer()
+        unary_orders(stub, "TEST", orders)
+        unary_rate = num_unary / (timeit.default_timer() - start)
+        print(f"{'Unary PlaceOrder':<30} {num_unary:<10} {unary_rate:<14.0f} {1.0:<10.2f}")
+
+        for max_batch in (64, 512):
+            orders = generate_orders(num_streamed, num_unary + max_batch * num_streamed, 9000, 11000)
+            with OrderEntrySession(stub, max_batch=max_batch) as session:
+                start = timeit.default_timer()
+                streamed_orders(session, "TEST", orders)
+                rate = num_streamed / (timeit.default_timer() - start)
+            label = f"OrderEntry stream, batch {max_batch}"
+            print(f"{label:<30} {num_streamed:<10} {rate:<14.0f} {rate / unary_rate:<10.2f}")
+
+        print()
+        print(f"Requote {quote_size} bids per cycle (the stream also cancels the previous {quote_size})")
+        print(f"{'Order entry':<30} {'Cycles':<10} {'ms/cycle':<14} {'Speedup':<10}")
+        print("-" * 66)
+        results = {}
+        for label, first_id in (("Unary PlaceOrder", 10**9), ("OrderEntry stream", 2 * 10**9)):
+            session = OrderEntrySession(stub) if label == "OrderEntry stream" else None
+            resting = []
+            elapsed = 0.0
+            for cycle in range(num_cycles):
+                quotes = [(order_id, "buy", tick, quantity)
+                          for order_id, _, tick, quantity in generate_orders(quote_size, first_id + cycle * quote_size, 9000, 9100)]
+                start = timeit.default_timer()
+                if session is None:
+                    unary_orders(stub, "MM", quotes)
+                else:
+                    requote_streamed(session, "MM", quotes, resting)
+                elapsed += timeit.default_timer() - start
+                resting = [order_id for order_id, _, _, _ in quotes]
+            if session is not None:
+                session.close()
+            results[label] = elapsed / num_cycles * 1e3
+            print(f"{label:<30} {num_cycles:<10} {results[label]:<14.2f} {results['Unary PlaceOrder'] / results[label]:<10.2f}")
+        channel.close()
+    finally:
+        stop.set()
+        process.join()
+
+if __name__ == "__main__":
+    run_benchmarks()
@@ -0,0 +1,70 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gc
+import time
+import logging
+import tracemalloc
+from decimal import Decimal
+from src.orderbook import Orderbook
+from src.compact_orderbook import CompactOrderbook
+from src.order import Order
+from src.ticker import Ticker
+import numpy as np
+
+SEED = 42
+rng = np.random.default_rng(SEED)
+
+def generate_resting_orders(num_orders, min_price, max_price, tick_size):
+    num_ticks = int((max_price - min_price) / tick_size)
+    mid_tick = num_ticks // 2
+    sides = rng.choice(["buy", "sell"], size=num_orders).tolist()
+    bid_ticks = rng.integers(0, mid_tick, size=num_orders).tolist()
+    ask_ticks = rng.integers(mid_tick + 1, num_ticks + 1, size=num_orders).tolist()
+    quantities = rng.integers(1, 1001, size=num_orders).tolist()
+    prices = [min_price + tick_size * tick for tick in range(num_ticks + 1)]
+    for i in range(num_orders):
+        side = sides[i]
+        tick = bid_ticks[i] if side == "buy" else ask_ticks[i]
+        yield i, side, prices[tick], quantities[i]
+
+def measure_bytes_per_order(book_class, num_orders, min_price, max_price, tick_size, price_band=None):
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+
+    orderbook = book_class(Ticker("TEST", str(tick_size), price_band))
+    for order_id, side, price, quantity in generate_resting_orders(num_orders, min_price, max_price, tick_size):
+        orderbook.add_order(Order(order_id, "limit", side, price, quantity, "TEST"))
+
+    with_changes, _ = tracemalloc.get_traced_memory()
+    orderbook.clear_changes()
+    gc.collect()
+    resting, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return len(orderbook.orders), (resting - baseline) / num_orders, (with_changes - resting) / num_orders
+
+def run_benchmarks():
+    logging.disable(logging.CRITICAL)
+    tick_size = Decimal('0.01')
+    min_price = Decimal('90')
+    max_price = Decimal('110')
+    num_orders = 10**6
+
+    print(f"{'Book side':<25} {'Resting':<12} {'Bytes/order':<14} {'Journal bytes/order':<20} {'Time (s)':<12}")
+    print("-" * 85)
+    configurations = [
+        ("Tree", Orderbook, None),
+        ("Ladder", Orderbook, (min_price, max_price)),
+        ("Compact ladder", CompactOrderbook, (min_price, max_price)),
+    ]
+    for label, book_class, price_band in configurations:
+        start_time = time.time()
+        resting, bytes_per_order, journal_bytes = measure_bytes_per_order(book_class, num_orders, min_price, max_price, tick_size, price_band)
+        elapsed = time.time() - start_time
+        print(f"{label:<25} {resting:<12} {bytes_per_order:<14.1f} {journal_bytes:<20.1f} {elapsed:<12.2f}")
+
+if __name__ == "__main__":
+    run_benchmarks()
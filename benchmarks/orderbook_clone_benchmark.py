@@ -0,0 +1,63 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gc
+import copy
+import timeit
+import logging
+from decimal import Decimal
+from src.orderbook import Orderbook
+from src.compact_orderbook import CompactOrderbook
+from src.order import Order
+from src.ticker import Ticker
+from src.orderbook_logger import configure_logging, TextLogSink
+import numpy as np
+
+SEED = 42
+rng = np.random.default_rng(SEED)
+
+def setup_orderbook(book_class, ticker, num_orders, min_tick, max_tick):
+    orderbook = book_class(ticker)
+    mid_tick = (min_tick + max_tick) // 2
+    sides = rng.choice(["buy", "sell"], size=num_orders).tolist()
+    bid_ticks = rng.integers(min_tick, mid_tick, size=num_orders).tolist()
+    ask_ticks = rng.integers(mid_tick + 1, max_tick, size=num_orders).tolist()
+    quantities = rng.integers(1, 1001, size=num_orders).tolist()
+    for i in range(num_orders):
+        tick = bid_ticks[i] if sides[i] == "buy" else ask_ticks[i]
+        orderbook.add_order(Order(i, "limit", sides[i], ticker.to_price(tick), quantities[i], "TEST"))
+    return orderbook
+
+def time_copies(copy_book, repeats):
+    latencies = []
+    for _ in range(repeats):
+        gc.collect()
+        start = timeit.default_timer()
+        copy_book()
+        latencies.append(timeit.default_timer() - start)
+    return np.array(latencies) * 1e3
+
+def run_benchmarks():
+    configure_logging(TextLogSink(open(os.devnull, 'w')), level=logging.WARNING)
+    sys.setrecursionlimit(100000)
+    min_tick, max_tick = 9000, 11000
+    configurations = [
+        ("Tree", Orderbook, None),
+        ("Ladder", Orderbook, (Decimal("90"), Decimal("110"))),
+        ("Compact ladder", CompactOrderbook, (Decimal("90"), Decimal("110"))),
+    ]
+
+    print(f"{'Book side':<18} {'Orders':<10} {'Method':<10} {'Mean (ms)':<12} {'Median (ms)':<12} {'Speedup':<10}")
+    print("-" * 75)
+    for num_orders in (10**4, 10**5):
+        for label, book_class, price_band in configurations:
+            ticker = Ticker("TEST", Decimal("0.01"), price_band)
+            orderbook = setup_orderbook(book_class, ticker, num_orders, min_tick, max_tick)
+            deepcopy_ms = time_copies(lambda: copy.deepcopy(orderbook), 3)
+            clone_ms = time_copies(orderbook.clone, 10)
+            print(f"{label:<18} {num_orders:<10} {'deepcopy':<10} {np.mean(deepcopy_ms):<12.2f} {np.median(deepcopy_ms):<12.2f} {1.0:<10.2f}")
+            print(f"{label:<18} {num_orders:<10} {'clone':<10} {np.mean(clone_ms):<12.2f} {np.median(clone_ms):<12.2f} {np.median(deepcopy_ms) / np.median(clone_ms):<10.2f}")
+
+if __name__ == "__main__":
+    run_benchmarks()
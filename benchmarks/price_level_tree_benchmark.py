@@ -0,0 +1,77 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import timeit
+from decimal import Decimal
+from src.price_level import PriceLevel, PriceLevelTree
+import numpy as np
+
+NUM_LEVELS = 100000
+BUCKET_SIZE = 10000
+
+def ladder_prices(num_levels, start_price, tick_size):
+    return [start_price + i * tick_size for i in range(num_levels)]
+
+def time_operation(operation, prices):
+    latencies = []
+    for price in prices:
+        start_time = timeit.default_timer()
+        operation(price)
+        end_time = timeit.default_timer()
+        latencies.append(end_time - start_time)
+    return latencies
+
+def tree_height(tree):
+    height = 0
+    stack = [(tree.root, 1)] if tree.root else []
+    while stack:
+        node, depth = stack.pop()
+        height = max(height, depth)
+        if node.left_child:
+            stack.append((node.left_child, depth + 1))
+        if node.right_child:
+            stack.append((node.right_child, depth + 1))
+    return height
+
+def print_bucket_stats(operation, latencies):
+    print(f"\n{operation}")
+    print(f"{'Levels':<25} {'Mean (μs)':<12} {'Median (μs)':<12} {'95th % (μs)':<12} {'99th % (μs)':<12} {'Ops/sec':<12}")
+    print("-" * 85)
+    for start in range(0, len(latencies), BUCKET_SIZE):
+        bucket = latencies[start:start + BUCKET_SIZE]
+        times_us = np.array(bucket) * 1e6
+        label = f"{start}-{start + len(bucket)}"
+        print(f"{label:<25} {np.mean(times_us):<12.2f} {np.median(times_us):<12.2f} "
+              f"{np.percentile(times_us, 95):<12.2f} {np.percentile(times_us, 99):<12.2f} "
+              f"{len(bucket) / sum(bucket):<12.2f}")
+
+def run_benchmarks():
+    tick_size = Decimal('0.01')
+    start_price = Decimal('90')
+    prices = ladder_prices(NUM_LEVELS, start_price, tick_size)
+
+    print(f"Monotonic ladder of {NUM_LEVELS} price levels")
+
+    tree = PriceLevelTree()
+    insert_latencies = time_operation(lambda price: tree.insert(PriceLevel(price)), prices)
+    print(f"Tree height after ascending inserts: {tree_height(tree)}")
+    print_bucket_stats("Insert (ascending)", insert_latencies)
+
+    find_latencies = time_operation(tree.find, prices)
+    print_bucket_stats("Find", find_latencies)
+
+    min_latencies = time_operation(lambda price: tree.min(), prices)
+    print_bucket_stats("Best level (min)", min_latencies)
+
+    delete_latencies = time_operation(tree.delete, prices)
+    print_bucket_stats("Delete (ascending)", delete_latencies)
+
+    tree = PriceLevelTree()
+    descending = list(reversed(prices))
+    insert_latencies = time_operation(lambda price: tree.insert(PriceLevel(price)), descending)
+    print(f"\nTree height after descending inserts: {tree_height(tree)}")
+    print_bucket_stats("Insert (descending)", insert_latencies)
+
+if __name__ == "__main__":
+    run_benchmarks()
@@ -0,0 +1,111 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+import timeit
+import logging
+import multiprocessing
+from concurrent import futures
+from decimal import Decimal
+import grpc
+import numpy as np
+from src.orderbook_server import OrderBookServer
+from src.orderbook_service_pb2 import Order
+from src.orderbook_service_pb2_grpc import OrderBookServiceStub, add_OrderBookServiceServicer_to_server
+from src.orderbook_logger import configure_logging, TextLogSink
+
+SEED = 42
+rng = np.random.default_rng(SEED)
+
+class GlobalLockServer(OrderBookServer):
+    def __init__(self, config):
+        super().__init__(config)
+        self.close()
+        self.lanes = {}
+        self._global_lock = threading.Lock()
+
+    def _on_lane(self, symbol, function, *args):
+        with self._global_lock:
+            return function(*args)
+
+def run_server(mode, config, max_workers, ports, stop):
+    configure_logging(TextLogSink(open(os.devnull, 'w')), level=logging.WARNING)
+    servicer = OrderBookServer(config) if mode == "lanes" else GlobalLockServer(config)
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+    add_OrderBookServiceServicer_to_server(servicer, server)
+    ports.put(server.add_insecure_port('127.0.0.1:0'))
+    server.start()
+    stop.wait()
+    server.stop(None)
+    servicer.close()
+
+def generate_flows(num_clients, orders_per_client, symbols, min_tick, max_tick):
+    mid_tick = (min_tick + max_tick) // 2
+    flows = []
+    for client in range(num_clients):
+        sides = rng.choice(["buy", "sell"], size=orders_per_client)
+        ticks = np.where(sides == "buy", rng.integers(min_tick, mid_tick + 5, size=orders_per_client),
+                         rng.integers(mid_tick - 5, max_tick, size=orders_per_client))
+        quantities = rng.integers(1, 101, size=orders_per_client)
+        order_symbols = rng.choice(symbols, size=orders_per_client)
+        flows.append([Order(symbol=str(symbol), order_id=str(client * orders_per_client + i), side=str(side), type="limit",
+                            price=str(Decimal(int(tick)) / 100), quantity=int(quantity))
+                      for i, (symbol, side, tick, quantity) in enumerate(zip(order_symbols, sides, ticks, quantities))])
+    return flows
+
+def run_clients(port, flows):
+    channel = grpc.insecure_channel(f'127.0.0.1:{port}')
+    grpc.channel_ready_future(channel).result(timeout=10)
+    stub = OrderBookServiceStub(channel)
+    latencies = [[] for _ in flows]
+    barrier = threading.Barrier(len(flows) + 1)
+
+    def client(index):
+        place, record = stub.PlaceOrder, latencies[index].append
+        barrier.wait()
+        for order in flows[index]:
+            start = timeit.default_timer()
+            place(order)
+            record(timeit.default_timer() - start)
+
+    threads = [threading.Thread(target=client, args=(index,)) for index in range(len(flows))]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = timeit.default_timer()
+    for thread in threads:
+        thread.join()
+    elapsed = timeit.default_timer() - start
+    channel.close()
+    return elapsed, np.concatenate([np.array(values) for values in latencies])
+
+def run_load_test():
+    configure_logging(TextLogSink(open(os.devnull, 'w')), level=logging.WARNING)
+    symbols = [f"SYM{i}" for i in range(10)]
+    config = {"server_port": 0, "instruments": {symbol: {"tick_size": "0.01"} for symbol in symbols}}
+    num_clients = 50
+    orders_per_client = 400
+    max_workers = 64
+    flows = generate_flows(num_clients, orders_per_client, symbols, 9000, 11000)
+    context = multiprocessing.get_context("spawn")
+
+    print(f"Load test: {num_clients} clients, {num_clients * orders_per_client} PlaceOrder calls over {len(symbols)} symbols, "
+          f"{max_workers} server workers, {os.cpu_count()} CPUs")
+    print(f"{'Server':<14} {'Orders/sec':<12} {'p50 (ms)':<10} {'p99 (ms)':<10} {'max (ms)':<10}")
+    print("-" * 58)
+    for mode in ("global lock", "lanes"):
+        ports = context.Queue()
+        stop = context.Event()
+        process = context.Process(target=run_server, args=(mode, config, max_workers, ports, stop), daemon=True)
+        process.start()
+        try:
+            elapsed, latencies = run_clients(ports.get(timeout=30), flows)
+        finally:
+            stop.set()
+            process.join()
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1e3
+        print(f"{mode:<14} {len(latencies) / elapsed:<12.0f} {p50:<10.2f} {p99:<10.2f} {latencies.max() * 1e3:<10.2f}")
+
+if __name__ == "__main__":
+    run_load_test()
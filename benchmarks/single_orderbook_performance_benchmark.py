@@ -1,14 +1,15 @@
 import sys
 import os
-import copy
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import timeit
 import time
+import logging
 from decimal import Decimal
 from src.orderbook import Orderbook
 from src.order import Order
 from src.ticker import Ticker
+from src.orderbook_logger import configure_logging, TextLogSink, LOGGER_NAME
 import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -105,7 +106,7 @@ def run_single_operation_benchmark(orderbook, num_operations, operation, params=
     
     for _ in range(num_operations):
         start_time = timeit.default_timer()
-        if operation == "Add limit order":
+        if operation in ("Add limit order", "Add limit order (logging)"):
             benchmark_add_limit_order(orderbook, params)
         elif operation == "Cancel order":
             benchmark_cancel_order(orderbook)
@@ -213,6 +214,7 @@ def save_results(all_latencies):
     return results_dir
 
 def run_benchmarks():
+    configure_logging(TextLogSink(open(os.devnull, 'w')), level=logging.WARNING)
     tick_size = Decimal('0.01')
     min_price = Decimal('90')
     max_price = Decimal('110')
@@ -233,6 +235,7 @@ def run_benchmarks():
         
         operations = [
             "Add limit order",
+            "Add limit order (logging)",
             "Cancel order",
             "Process market order",
             "Get best bid ask",
@@ -243,16 +246,19 @@ def run_benchmarks():
         print("-" * 85)
 
         for operation in operations:
-            orderbook = copy.deepcopy(initial_orderbook)
+            orderbook = initial_orderbook.clone()
 
-            if operation == "Add limit order":
+            if operation in ("Add limit order", "Add limit order (logging)"):
                 params = iter(zip(*generate_limit_order_params(num_operations, min_price, max_price, tick_size, orderbook)))
             elif operation == "Process market order":
                 params = iter(zip(*generate_market_order_params(num_operations, orderbook)))
             else:
                 params = None
 
+            log_level = logging.INFO if operation == "Add limit order (logging)" else logging.WARNING
+            logging.getLogger(LOGGER_NAME).setLevel(log_level)
             latencies = run_single_operation_benchmark(orderbook, num_operations, operation, params)
+            logging.getLogger(LOGGER_NAME).setLevel(logging.WARNING)
             size_latencies[operation] = latencies
             print_latency_stats(operation, latencies)
 
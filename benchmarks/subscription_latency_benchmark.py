@@ -0,0 +1,112 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import queue
+import threading
+import timeit
+import logging
+from concurrent import futures
+from decimal import Decimal
+import grpc
+import numpy as np
+from src.orderbook_manager import OrderBookManager
+from src.orderbook_server import OrderBookServer
+from src.update_publisher import Subscription
+from src.order import Order
+from src.orderbook_service_pb2 import SubscriptionRequest, Order as OrderMessage
+from src.orderbook_service_pb2_grpc import OrderBookServiceStub, add_OrderBookServiceServicer_to_server
+from src.orderbook_logger import configure_logging, TextLogSink
+
+SEED = 42
+rng = np.random.default_rng(SEED)
+
+def generate_orders(num_orders, min_tick, max_tick):
+    sides = rng.choice(["buy", "sell"], size=num_orders)
+    ticks = rng.integers(min_tick, max_tick, size=num_orders)
+    quantities = rng.integers(1, 101, size=num_orders)
+    return [(str(side), Decimal(int(tick)) / 100, int(quantity)) for side, tick, quantity in zip(sides, ticks, quantities)]
+
+def measure_in_process(num_subscribers, orders):
+    manager = OrderBookManager()
+    manager.create_order_book("TEST", Decimal('0.01'))
+    sent = [0.0]
+    received = [[] for _ in range(num_subscribers)]
+    ready = threading.Barrier(num_subscribers + 1)
+
+    def subscriber(index):
+        subscription = Subscription()
+        manager.publisher.subscribe("TEST", subscription)
+        cursor = 0
+        ready.wait()
+        while cursor < len(orders):
+            _, symbols = subscription.wait()
+            if symbols:
+                _, cursor = manager.get_updates_since("TEST", cursor)
+                received[index].append(timeit.default_timer() - sent[0])
+            ready.wait()
+
+    threads = [threading.Thread(target=subscriber, args=(index,)) for index in range(num_subscribers)]
+    for thread in threads:
+        thread.start()
+    ready.wait()
+    for order_id, (side, price, quantity) in enumerate(orders):
+        sent[0] = timeit.default_timer()
+        manager.process_order(Order(order_id, "limit", side, price, quantity, "TEST"))
+        ready.wait()
+    for thread in threads:
+        thread.join()
+    return np.concatenate([np.array(latencies) for latencies in received])
+
+def measure_grpc(num_subscribers, orders):
+    config = {"server_port": 0, "instruments": {"TEST": {"tick_size": "0.01"}}}
+    servicer = OrderBookServer(config)
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=num_subscribers + 8))
+    add_OrderBookServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port('127.0.0.1:0')
+    server.start()
+    channel = grpc.insecure_channel(f'127.0.0.1:{port}')
+    stub = OrderBookServiceStub(channel)
+
+    streams = []
+    for _ in range(num_subscribers):
+        requests = queue.Queue()
+        requests.put(SubscriptionRequest(symbol="TEST", subscribe=True))
+        responses = stub.SubscribeOrderBook(iter(requests.get, None))
+        next(responses)
+        streams.append((requests, responses))
+
+    latencies = []
+    for order_id, (side, price, quantity) in enumerate(orders):
+        start = timeit.default_timer()
+        stub.PlaceOrder(OrderMessage(symbol="TEST", order_id=str(order_id), side=side, type="limit", price=str(price), quantity=quantity))
+        for _, responses in streams:
+            while next(responses).version < order_id + 1:
+                pass
+        latencies.append(timeit.default_timer() - start)
+
+    for requests, responses in streams:
+        responses.cancel()
+        requests.put(None)
+    channel.close()
+    server.stop(None)
+    servicer.close()
+    return np.array(latencies)
+
+def run_benchmarks():
+    configure_logging(TextLogSink(open(os.devnull, 'w')), level=logging.WARNING)
+    orders = generate_orders(2000, 9900, 10100)
+
+    print(f"{'Path':<34} {'Subscribers':<12} {'p50 (μs)':<10} {'p99 (μs)':<10}")
+    print("-" * 68)
+    for num_subscribers in (1, 10, 50):
+        latencies = measure_in_process(num_subscribers, orders)
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1e6
+        print(f"{'order -> subscriber wake':<34} {num_subscribers:<12} {p50:<10.1f} {p99:<10.1f}")
+    for num_subscribers in (1, 10):
+        latencies = measure_grpc(num_subscribers, orders[:500])
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1e6
+        print(f"{'gRPC PlaceOrder -> all streams':<34} {num_subscribers:<12} {p50:<10.1f} {p99:<10.1f}")
+
+if __name__ == "__main__":
+    run_benchmarks()
@@ -0,0 +1,71 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import logging
+from decimal import Decimal
+from src.orderbook_server import OrderBookServer, OrderBookServerV2
+from src.order import Order
+from src.orderbook_service_pb2 import SubscriptionRequest
+from src.update_publisher import Subscription
+from src.orderbook_logger import configure_logging, TextLogSink
+import numpy as np
+
+SEED = 42
+rng = np.random.default_rng(SEED)
+
+def generate_orders(num_orders, first_id, min_tick, max_tick):
+    mid_tick = (min_tick + max_tick) // 2
+    sides = rng.choice(["buy", "sell"], size=num_orders)
+    ticks = np.where(sides == "buy", rng.integers(min_tick, mid_tick, size=num_orders),
+                     rng.integers(mid_tick + 1, max_tick, size=num_orders))
+    quantities = rng.integers(1, 101, size=num_orders)
+    return [Order(first_id + i, "limit", str(side), Decimal(int(tick)) / 100, int(quantity), "TEST")
+            for i, (side, tick, quantity) in enumerate(zip(sides, ticks, quantities))]
+
+def fan_out(servicer, orders, num_subscribers, changes_per_update):
+    encode_updates = servicer.encode_updates
+    manager = servicer.order_book_manager
+    request = SubscriptionRequest(symbol="TEST", subscribe=True)
+    subscribers = []
+    for _ in range(num_subscribers):
+        cursors = {}
+        servicer._handle_subscription_request(request, Subscription(), cursors)
+        subscribers.append(cursors)
+    elapsed = 0.0
+    total_bytes = 0
+    for start in range(0, len(orders), changes_per_update):
+        for order in orders[start:start + changes_per_update]:
+            manager.process_order(order, False)
+        begin = time.process_time()
+        for cursors in subscribers:
+            response = servicer._next_update("TEST", cursors)
+            total_bytes += len(response if encode_updates else response.SerializeToString())
+        elapsed += time.process_time() - begin
+    return elapsed / (len(orders) // changes_per_update) * 1e6, total_bytes
+
+def run_benchmarks():
+    configure_logging(TextLogSink(open(os.devnull, 'w')), level=logging.WARNING)
+    config = {"server_port": 0, "instruments": {"TEST": {"tick_size": "0.01"}}}
+    num_updates = 200
+    changes_per_update = 5
+
+    print(f"Fan-out CPU per book update ({changes_per_update} changes each, {num_updates} updates)")
+    print(f"{'Schema':<8} {'Subscribers':<12} {'Encode each (us)':<18} {'Cached (us)':<14} {'us/subscriber':<15} {'Speedup':<10}")
+    print("-" * 80)
+    for label, factory in (("v1", OrderBookServer), ("v2", OrderBookServerV2)):
+        for num_subscribers in (1, 10, 100, 1000):
+            orders = generate_orders(num_updates * changes_per_update, 0, 9000, 11000)
+            results = []
+            for encode_updates in (False, True):
+                servicer = factory(config, lanes=False)
+                servicer.encode_updates = encode_updates
+                results.append(fan_out(servicer, orders, num_subscribers, changes_per_update))
+                servicer.close()
+            (uncached, uncached_bytes), (cached, cached_bytes) = results
+            assert uncached_bytes == cached_bytes
+            print(f"{label:<8} {num_subscribers:<12} {uncached:<18.1f} {cached:<14.1f} {cached / num_subscribers:<15.2f} {uncached / cached:<10.2f}")
+
+if __name__ == "__main__":
+    run_benchmarks()
@@ -0,0 +1,111 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import timeit
+import logging
+from decimal import Decimal
+from src.orderbook_server import OrderBookServer, OrderBookServerV2
+from src.orderbook_service_pb2 import Order, OrderBookUpdate
+from src import orderbook_service_v2_pb2 as pb2_v2
+from src.order import Order as BookOrder
+from src.ticker import Ticker
+from src.orderbook_logger import configure_logging, TextLogSink
+import numpy as np
+
+SEED = 42
+rng = np.random.default_rng(SEED)
+
+def populate(manager, symbol, num_orders, min_tick, max_tick):
+    mid_tick = (min_tick + max_tick) // 2
+    for order_id in range(num_orders):
+        side = "buy" if order_id % 2 == 0 else "sell"
+        tick = int(rng.integers(min_tick, mid_tick)) if side == "buy" else int(rng.integers(mid_tick + 1, max_tick))
+        manager.process_order(BookOrder(order_id, "limit", side, Decimal(tick) / 100, int(rng.integers(1, 1001)), symbol))
+
+def time_per_call(function, repeat):
+    return min(timeit.repeat(function, number=repeat, repeat=5)) / repeat * 1e6
+
+def order_cases(ticker):
+    v1_order = Order(symbol="TEST", order_id="123456", side="buy", type="limit", price="100.25", quantity=500)
+    v2_order = pb2_v2.Order(symbol="TEST", order_id=123456, side=pb2_v2.BUY, type=pb2_v2.LIMIT, price_ticks=10025, quantity=500)
+    v1_bytes, v2_bytes = v1_order.SerializeToString(), v2_order.SerializeToString()
+
+    def decode_v1():
+        order = Order.FromString(v1_bytes)
+        return ticker.to_ticks(Decimal(order.price))
+
+    def decode_v2():
+        return pb2_v2.Order.FromString(v2_bytes).price_ticks
+
+    encode_v1 = lambda: Order(symbol="TEST", order_id=str(123456), side="buy", type="limit", price=str(Decimal("100.25")),
+                              quantity=500).SerializeToString()
+    encode_v2 = lambda: pb2_v2.Order(symbol="TEST", order_id=123456, side=pb2_v2.BUY, type=pb2_v2.LIMIT, price_ticks=10025,
+                                     quantity=500).SerializeToString()
+    return ("Order", encode_v1, decode_v1, v1_bytes), ("Order", encode_v2, decode_v2, v2_bytes)
+
+def snapshot_cases(v1, v2, symbol, levels):
+    v1.order_book_manager.default_order_book_levels = levels
+    encode_v1 = lambda: v1._create_snapshot(symbol).SerializeToString()
+    encode_v2 = lambda: v2._create_snapshot(symbol).SerializeToString()
+    v1_bytes, v2_bytes = encode_v1(), encode_v2()
+
+    def decode_v1():
+        update = OrderBookUpdate.FromString(v1_bytes)
+        return [(Decimal(level.price), level.quantity) for level in update.bids], \
+               [(Decimal(level.price), level.quantity) for level in update.asks]
+
+    def decode_v2():
+        update = pb2_v2.OrderBookUpdate.FromString(v2_bytes)
+        return list(zip(update.bid_ticks, update.bid_quantities)), list(zip(update.ask_ticks, update.ask_quantities))
+
+    label = f"Snapshot {levels} levels"
+    return (label, encode_v1, decode_v1, v1_bytes), (label, encode_v2, decode_v2, v2_bytes)
+
+def update_cases(v1, v2, symbol, num_changes):
+    version = v1.order_book_manager.order_books[symbol].current_version - num_changes
+    updates, current = v1.order_book_manager.get_updates_since(symbol, version)
+    records, _ = v2.order_book_manager.get_change_records_since(symbol, version)
+    encode_v1 = lambda: v1._create_incremental_update(symbol, v1.order_book_manager.get_updates_since(symbol, version)[0],
+                                                      current).SerializeToString()
+    encode_v2 = lambda: v2._create_incremental_update(symbol, v2.order_book_manager.get_change_records_since(symbol, version)[0],
+                                                      current).SerializeToString()
+    v1_bytes, v2_bytes = encode_v1(), encode_v2()
+
+    def decode_v1():
+        return [(change.side, change.action, Decimal(change.price), change.quantity)
+                for change in OrderBookUpdate.FromString(v1_bytes).changes]
+
+    def decode_v2():
+        update = pb2_v2.OrderBookUpdate.FromString(v2_bytes)
+        return list(zip(update.change_sides, update.change_actions, update.change_ticks, update.change_quantities))
+
+    label = f"Update {num_changes} changes"
+    return (label, encode_v1, decode_v1, v1_bytes), (label, encode_v2, decode_v2, v2_bytes)
+
+def run_benchmarks():
+    configure_logging(TextLogSink(open(os.devnull, 'w')), level=logging.WARNING)
+    config = {"server_port": 0, "instruments": {"TEST": {"tick_size": "0.01"}}}
+    v1 = OrderBookServer(config, lanes=False)
+    v2 = OrderBookServerV2(server=v1)
+    populate(v1.order_book_manager, "TEST", 20000, 9000, 11000)
+    ticker = Ticker("TEST", Decimal("0.01"))
+    repeat = 2000
+
+    cases = [order_cases(ticker)]
+    for levels in (10, 50):
+        cases.append(snapshot_cases(v1, v2, "TEST", levels))
+    for num_changes in (1, 20):
+        cases.append(update_cases(v1, v2, "TEST", num_changes))
+
+    print(f"{'Message':<22} {'Schema':<8} {'Bytes':<8} {'Encode (μs)':<13} {'Decode (μs)':<13} {'Bytes saved':<12} {'Encode speedup':<15} {'Decode speedup':<15}")
+    print("-" * 112)
+    for (label, encode_v1, decode_v1, v1_bytes), (_, encode_v2, decode_v2, v2_bytes) in cases:
+        v1_encode, v1_decode = time_per_call(encode_v1, repeat), time_per_call(decode_v1, repeat)
+        v2_encode, v2_decode = time_per_call(encode_v2, repeat), time_per_call(decode_v2, repeat)
+        print(f"{label:<22} {'v1':<8} {len(v1_bytes):<8} {v1_encode:<13.2f} {v1_decode:<13.2f}")
+        print(f"{'':<22} {'v2':<8} {len(v2_bytes):<8} {v2_encode:<13.2f} {v2_decode:<13.2f} "
+              f"{1 - len(v2_bytes) / len(v1_bytes):<12.0%} {v1_encode / v2_encode:<15.2f} {v1_decode / v2_decode:<15.2f}")
+
+if __name__ == "__main__":
+    run_benchmarks()
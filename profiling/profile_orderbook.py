@@ -31,15 +31,20 @@ def setup_orderbook(initial_orders, ticker):
 
 def run_mixed_workload(ob, operations, orders):
     order_index = 0
+    resting = list(ob.orders)
     for operation in operations:
         if operation == "add":
             order = orders[order_index]
             o = Order(order['id'], "limit", order['side'], Decimal(order['price']), Decimal(str(order['quantity'])), ob.ticker.symbol)
             ob.add_order(o)
+            resting.append(order['id'])
             order_index += 1
         elif operation == "cancel":
-            if ob.orders:
-                order_id = list(ob.orders.keys())[order_index % len(ob.orders)]
+            if resting:
+                position = order_index % len(resting)
+                order_id = resting[position]
+                resting[position] = resting[-1]
+                resting.pop()
                 try:
                     ob.cancel_order(order_id)
                 except OrderNotFoundException:
@@ -0,0 +1,60 @@
+import asyncio
+import grpc
+from .orderbook_service_pb2 import OrderResponse
+from .orderbook_server import OrderBookServer, add_servicer_to_server, load_config
+from .update_publisher import AsyncSubscription
+
+class AsyncOrderBookServer(OrderBookServer):
+    def __init__(self, config=None):
+        super().__init__(config, lanes=False)
+
+    async def SubscribeOrderBook(self, request_iterator, context):
+        subscription = AsyncSubscription()
+        reader = asyncio.ensure_future(self._read_requests_async(request_iterator, subscription))
+        cursors = {}
+        requests_open = True
+        try:
+            while not subscription.closed and (requests_open or cursors):
+                requests, symbols = await subscription.wait()
+                for request in requests:
+                    if request is None:
+                        requests_open = False
+                    else:
+                        response = self._handle_subscription_request(request, subscription, cursors)
+                        if response is not None:
+                            yield response
+                for symbol in symbols:
+                    response = self._next_update(symbol, cursors)
+                    if response is not None:
+                        yield response
+        finally:
+            reader.cancel()
+            self._end_subscription(subscription, cursors)
+
+    async def _read_requests_async(self, request_iterator, subscription):
+        try:
+            async for request in request_iterator:
+                subscription.post(request)
+        except grpc.RpcError:
+            subscription.close()
+        finally:
+            subscription.post(None)
+
+    async def PlaceOrder(self, request, context):
+        order_id, _, _ = self.order_book_manager.process_order(self._order_from_request(request), False)
+        if self.order_book_manager.journal is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.order_book_manager.wait_durable)
+        return OrderResponse(order_id=str(order_id), status="PLACED")
+
+async def serve_async(config=None):
+    if config is None:
+        config = load_config()
+    server = grpc.aio.server()
+    add_servicer_to_server(AsyncOrderBookServer(config), server)
+    server.add_insecure_port(f'[::]:{config["server_port"]}')
+    await server.start()
+    print(f"Async server started on port {config['server_port']}")
+    await server.wait_for_termination()
+
+if __name__ == '__main__':
+    asyncio.run(serve_async())
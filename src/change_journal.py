@@ -0,0 +1,97 @@
+from typing import List, Optional, Tuple
+from .exceptions import VersionOutOfRangeException
+
+DEFAULT_JOURNAL_CAPACITY = 100000
+
+ChangeRecord = Tuple[int, str, str, int, int]
+
+class ChangeJournal:
+    def __init__(self, capacity: int = DEFAULT_JOURNAL_CAPACITY):
+        if capacity <= 0:
+            raise ValueError("Journal capacity must be positive")
+        self.capacity = capacity
+        self._records: List[Optional[ChangeRecord]] = [None] * capacity
+        self._first_version = 1
+        self._last_version = 0
+
+    def __len__(self) -> int:
+        return self._last_version - self._first_version + 1
+
+    @property
+    def first_version(self) -> int:
+        return self._first_version
+
+    @property
+    def last_version(self) -> int:
+        return self._last_version
+
+    def append(self, version: int, action: str, side: str, tick: int, quantity: int) -> None:
+        self._records[version % self.capacity] = (version, action, side, tick, quantity)
+        self._last_version = version
+        if version - self._first_version >= self.capacity:
+            self._first_version = version - self.capacity + 1
+
+    def since(self, version: int) -> List[ChangeRecord]:
+        if version < self._first_version - 1:
+            raise VersionOutOfRangeException(
+                f"Version {version} is older than the journal window starting at {self._first_version}")
+        if version >= self._last_version:
+            return []
+
+        start = (version + 1) % self.capacity
+        end = self._last_version % self.capacity + 1
+        if start < end:
+            return self._records[start:end]
+        return self._records[start:] + self._records[:end]
+
+    def clear(self) -> None:
+        self._first_version = self._last_version + 1
+
+    def reset(self, version: int) -> None:
+        self._first_version = version + 1
+        self._last_version = version
+
+    def copy(self) -> 'ChangeJournal':
+        journal = ChangeJournal.__new__(ChangeJournal)
+        journal.capacity = self.capacity
+        journal._records = list(self._records)
+        journal._first_version = self._first_version
+        journal._last_version = self._last_version
+        return journal
+
+class NullChangeJournal:
+    capacity = 0
+
+    def __init__(self):
+        self._last_version = 0
+
+    def __len__(self) -> int:
+        return 0
+
+    @property
+    def first_version(self) -> int:
+        return self._last_version + 1
+
+    @property
+    def last_version(self) -> int:
+        return self._last_version
+
+    def append(self, version: int, action: str, side: str, tick: int, quantity: int) -> None:
+        self._last_version = version
+
+    def since(self, version: int) -> List[ChangeRecord]:
+        if version < self._last_version:
+            raise VersionOutOfRangeException(f"Version {version} is older than the current version {self._last_version}"
+                                             " and change journaling is disabled")
+        return []
+
+    def clear(self) -> None:
+        pass
+
+    def reset(self, version: int) -> None:
+        self._last_version = version
+
+    def copy(self) -> 'NullChangeJournal':
+        journal = NullChangeJournal()
+        journal._last_version = self._last_version
+        return journal
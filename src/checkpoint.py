@@ -0,0 +1,202 @@
+import gc
+import mmap
+import os
+import struct
+from decimal import Decimal
+from typing import BinaryIO, Dict, Tuple
+import numpy as np
+from .orderbook import Orderbook, SideState
+from .compact_orderbook import CompactOrderbook
+from .ticker import Ticker
+from .event_journal import FLAG_STRING_ID, encode_order_id
+from .exceptions import InvalidCheckpointException, InvalidOrderException
+
+MAGIC = b'OBCK'
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct('<4sHxxqI')
+BOOK_HEADER = struct.Struct('<BBxxxxxxqqq')
+STRING_LENGTH = struct.Struct('<H')
+COUNT = struct.Struct('<q')
+
+BOOK_COMPACT = 1
+BOOK_DEPTH_INDEX = 2
+
+IDS_INT64 = 0
+IDS_STRING = 1
+IDS_TAGGED = 2
+
+BOOK_CLASSES = {0: Orderbook, BOOK_COMPACT: CompactOrderbook}
+
+def write_checkpoint(path: str, order_books: Dict[str, Orderbook], sequence: int = 0) -> None:
+    temporary_path = path + '.tmp'
+    try:
+        with open(temporary_path, 'wb') as stream:
+            stream.write(HEADER.pack(MAGIC, FORMAT_VERSION, sequence, len(order_books)))
+            for order_book in order_books.values():
+                _write_book(stream, order_book)
+            stream.flush()
+            os.fsync(stream.fileno())
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+def read_checkpoint(path: str) -> Tuple[Dict[str, Orderbook], int]:
+    try:
+        return _read_checkpoint(path)
+    except (struct.error, ValueError) as error:
+        raise InvalidCheckpointException(f"{path} is truncated or corrupt: {error}") from error
+
+def _read_checkpoint(path: str) -> Tuple[Dict[str, Orderbook], int]:
+    with open(path, 'rb') as stream, mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        reader = _Reader(buffer)
+        magic, format_version, sequence, book_count = reader.read_struct(HEADER)
+        if magic != MAGIC:
+            raise InvalidCheckpointException(f"{path} is not an order book checkpoint")
+        if format_version != FORMAT_VERSION:
+            raise InvalidCheckpointException(f"Unsupported checkpoint format version {format_version}")
+
+        order_books = {}
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(book_count):
+                order_book = _read_book(reader)
+                order_books[order_book.ticker.symbol] = order_book
+        finally:
+            if gc_enabled:
+                gc.enable()
+        del reader
+    return order_books, sequence
+
+def _write_book(stream: BinaryIO, order_book: Orderbook) -> None:
+    ticker = order_book.ticker
+    sides = [order_book.export_side("buy"), order_book.export_side("sell")]
+    ids = [order_id for side in sides for order_id in side.ids]
+    if all(isinstance(order_id, (int, np.integer)) for order_id in ids):
+        id_kind = IDS_INT64
+    elif all(isinstance(order_id, str) for order_id in ids):
+        id_kind = IDS_STRING
+    else:
+        id_kind = IDS_TAGGED
+        try:
+            tagged = [encode_order_id(int(order_id) if isinstance(order_id, np.integer) else order_id)
+                      for order_id in ids]
+        except InvalidOrderException as error:
+            raise InvalidCheckpointException(f"Cannot checkpoint mixed order ids: {error}") from error
+
+    flags = BOOK_COMPACT if isinstance(order_book, CompactOrderbook) else 0
+    if order_book.bid_depth is not None:
+        flags |= BOOK_DEPTH_INDEX
+    stream.write(BOOK_HEADER.pack(flags, id_kind, order_book.version,
+                                  len(sides[0].level_ticks), len(sides[1].level_ticks)))
+    _write_string(stream, ticker.symbol)
+    _write_string(stream, str(ticker.tick_size))
+    band = ticker.price_band
+    _write_string(stream, f"{band[0]}:{band[1]}" if band is not None else "")
+
+    for side in sides:
+        _write_array(stream, side.level_ticks)
+        _write_array(stream, side.level_counts)
+    quantities = np.concatenate([side.quantities for side in sides])
+    timestamps = np.concatenate([side.timestamps for side in sides])
+    stream.write(COUNT.pack(len(quantities)))
+    _write_array(stream, quantities)
+    _write_array(stream, timestamps)
+    if id_kind == IDS_INT64:
+        _write_array(stream, np.array(ids, dtype=np.int64))
+    elif id_kind == IDS_TAGGED:
+        _write_array(stream, np.array([order_id for order_id, _ in tagged], dtype=np.int64))
+        _write_padded(stream, bytes(flags for _, flags in tagged))
+    else:
+        encoded = [order_id.encode('utf-8') for order_id in ids]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(order_id) for order_id in encoded], out=offsets[1:])
+        _write_array(stream, offsets)
+        stream.write(COUNT.pack(int(offsets[-1])))
+        _write_padded(stream, b''.join(encoded))
+
+def _read_book(reader: '_Reader') -> Orderbook:
+    flags, id_kind, version, bid_levels, ask_levels = reader.read_struct(BOOK_HEADER)
+    symbol = reader.read_string()
+    tick_size = reader.read_string()
+    band = reader.read_string()
+    price_band = tuple(Decimal(price) for price in band.split(':')) if band else None
+
+    level_ticks = []
+    level_counts = []
+    for level_count in (bid_levels, ask_levels):
+        level_ticks.append(reader.read_array(np.int64, level_count))
+        level_counts.append(reader.read_array(np.int64, level_count))
+    (order_count,) = reader.read_struct(COUNT)
+    quantities = reader.read_array(np.int64, order_count)
+    timestamps = reader.read_array(np.float64, order_count)
+    if id_kind == IDS_INT64:
+        ids = reader.read_array(np.int64, order_count)
+    elif id_kind == IDS_TAGGED:
+        values = reader.read_array(np.int64, order_count).tolist()
+        tags = reader.read_bytes(order_count)
+        ids = [str(order_id) if tag & FLAG_STRING_ID else order_id for order_id, tag in zip(values, tags)]
+    elif id_kind == IDS_STRING:
+        offsets = reader.read_array(np.int64, order_count + 1).tolist()
+        (size,) = reader.read_struct(COUNT)
+        blob = reader.read_bytes(size)
+        ids = [blob[start:end].decode('utf-8') for start, end in zip(offsets, offsets[1:])]
+    else:
+        raise InvalidCheckpointException(f"Unknown order id encoding {id_kind}")
+
+    bid_orders = int(level_counts[0].sum())
+    sides = []
+    for index, (start, end) in enumerate(((0, bid_orders), (bid_orders, order_count))):
+        sides.append(SideState(level_ticks[index], level_counts[index], ids[start:end],
+                               quantities[start:end], timestamps[start:end]))
+
+    book_class = BOOK_CLASSES[flags & BOOK_COMPACT]
+    return book_class.restore(Ticker(symbol, tick_size, price_band), version, sides[0], sides[1],
+                              depth_index=bool(flags & BOOK_DEPTH_INDEX))
+
+def _write_string(stream: BinaryIO, value: str) -> None:
+    encoded = value.encode('utf-8')
+    stream.write(STRING_LENGTH.pack(len(encoded)))
+    stream.write(encoded)
+
+def _write_array(stream: BinaryIO, values: np.ndarray) -> None:
+    _write_padded(stream, np.ascontiguousarray(values).tobytes())
+
+def _write_padded(stream: BinaryIO, data: bytes) -> None:
+    padding = -stream.tell() % 8
+    stream.write(b'\0' * padding)
+    stream.write(data)
+
+class _Reader:
+    def __init__(self, buffer: mmap.mmap):
+        self.buffer = buffer
+        self.offset = 0
+
+    def read_struct(self, layout: struct.Struct) -> tuple:
+        values = layout.unpack_from(self.buffer, self.offset)
+        self.offset += layout.size
+        return values
+
+    def read_string(self) -> str:
+        (length,) = self.read_struct(STRING_LENGTH)
+        return self._take(length).decode('utf-8')
+
+    def read_array(self, dtype, count: int) -> np.ndarray:
+        self.offset += -self.offset % 8
+        values = np.frombuffer(self.buffer, dtype=dtype, count=count, offset=self.offset).copy()
+        self.offset += values.nbytes
+        return values
+
+    def read_bytes(self, size: int) -> bytes:
+        self.offset += -self.offset % 8
+        return self._take(size)
+
+    def _take(self, size: int) -> bytes:
+        data = self.buffer[self.offset:self.offset + size]
+        if len(data) != size:
+            raise InvalidCheckpointException("Checkpoint is truncated")
+        self.offset += size
+        return data
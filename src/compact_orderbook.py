@@ -0,0 +1,221 @@
+from decimal import Decimal
+from operator import index
+from typing import Dict, List, Tuple, Optional
+import numpy as np
+from .order import Order
+from .order_batch import OrderBatch
+from .order_store import OrderStore, SlotLevel, NO_SLOT, BUY, SELL
+from .orderbook import Orderbook, SideState
+from .change_journal import DEFAULT_JOURNAL_CAPACITY
+from .ticker import Ticker
+from .exceptions import InvalidOrderException, OrderNotFoundException, InvalidQuantityException
+
+class CompactOrderbook(Orderbook):
+    level_class = SlotLevel
+
+    def __init__(self, ticker: Ticker, journal_capacity: Optional[int] = DEFAULT_JOURNAL_CAPACITY, depth_index: bool = False):
+        super().__init__(ticker, journal_capacity=journal_capacity, depth_index=depth_index)
+        self.store = OrderStore()
+        self.orders: Dict[int, int] = {}
+
+    def _rest_order(self, order: Order) -> None:
+        try:
+            order_id = index(order.id)
+        except TypeError:
+            raise InvalidOrderException("CompactOrderbook requires integer order ids")
+        is_buy = order.side == "buy"
+        slot = self.store.allocate(order_id, BUY if is_buy else SELL, order.tick, order.quantity)
+        tree = self.bids if is_buy else self.asks
+        level = tree.find_or_create(order.tick)
+        level.add_slot(self.store, slot)
+        self.orders[order_id] = slot
+        self._update_depth(is_buy, order.tick, order.quantity)
+        self._log_level_change(order.side, level, level.order_count == 1)
+
+    def _validate_batch(self, batch: OrderBatch) -> None:
+        try:
+            for order_id in batch.ids:
+                index(order_id)
+        except TypeError:
+            raise InvalidOrderException("CompactOrderbook requires integer order ids")
+
+    def _sweep_level(self, level: SlotLevel, filled_orders: List[Tuple[int, int, Decimal]]) -> int:
+        store = self.store
+        ids = store.ids
+        quantities = store.quantities
+        price = self.ticker.to_price(level.price)
+        swept_volume = level.total_volume
+        slots = level.detach_slots(store)
+        filled_orders.extend([(ids[slot], quantities[slot], price) for slot in slots])
+
+        orders = self.orders
+        release = store.release
+        for slot in slots:
+            del orders[ids[slot]]
+            release(slot)
+        return swept_volume
+
+    def _walk_level(self, level: SlotLevel, quantity: int, filled_orders: List[Tuple[int, int, Decimal]]) -> int:
+        store = self.store
+        quantities = store.quantities
+        filled_quantity = 0
+        price = self.ticker.to_price(level.price)
+        slot = level.head_slot
+
+        while slot != NO_SLOT and filled_quantity < quantity:
+            resting_quantity = quantities[slot]
+            order_fill = min(quantity - filled_quantity, resting_quantity)
+            filled_quantity += order_fill
+            order_id = store.ids[slot]
+            filled_orders.append((order_id, order_fill, price))
+
+            next_slot = store.next_slots[slot]
+            if order_fill == resting_quantity:
+                level.remove_slot(store, slot)
+                del self.orders[order_id]
+                store.release(slot)
+            else:
+                quantities[slot] = resting_quantity - order_fill
+                level.update_volume(resting_quantity, resting_quantity - order_fill)
+            slot = next_slot
+
+        return filled_quantity
+
+    def cancel_order(self, order_id: int) -> None:
+        if order_id not in self.orders:
+            raise OrderNotFoundException("Order not found")
+        slot = self.orders[order_id]
+        store = self.store
+        is_buy = store.sides[slot] == BUY
+        level = (self.bids if is_buy else self.asks).find(store.ticks[slot])
+        self._remove_slot(slot)
+        self._log_level_change("buy" if is_buy else "sell", level)
+
+    def modify_order(self, order_id: int, new_quantity: int) -> int:
+        if order_id not in self.orders:
+            raise OrderNotFoundException("Order not found")
+
+        new_quantity = int(new_quantity)
+        if new_quantity <= 0:
+            raise InvalidQuantityException("Order quantity must be positive")
+
+        store = self.store
+        slot = self.orders[order_id]
+        is_buy = store.sides[slot] == BUY
+        tick = store.ticks[slot]
+        old_quantity = store.quantities[slot]
+        level = (self.bids if is_buy else self.asks).find(tick)
+
+        if new_quantity < old_quantity:
+            level.update_volume(old_quantity, new_quantity)
+            store.quantities[slot] = new_quantity
+        elif new_quantity > old_quantity:
+            level.remove_slot(store, slot)
+            store.quantities[slot] = new_quantity
+            level.add_slot(store, slot)
+        else:
+            return order_id
+        self._update_depth(is_buy, tick, new_quantity - old_quantity)
+
+        self._log_level_change("buy" if is_buy else "sell", level)
+        return order_id
+
+    def mass_cancel(self, side: Optional[str] = None, min_price: Optional[Decimal] = None,
+                    max_price: Optional[Decimal] = None) -> int:
+        low = self.ticker.to_ticks(min_price) if min_price is not None else None
+        high = self.ticker.to_ticks(max_price) if max_price is not None else None
+        store = self.store
+
+        slots = store.live_slots()
+        columns = store.columns(slots)
+        mask = np.ones(len(slots), dtype=bool)
+        if side is not None:
+            mask &= columns['side'] == (BUY if side == "buy" else SELL)
+        if low is not None:
+            mask &= columns['tick'] >= low
+        if high is not None:
+            mask &= columns['tick'] <= high
+        slots = slots[mask]
+        if not len(slots):
+            return 0
+
+        for book_side in ("buy", "sell") if side is None else (side,):
+            tree = self.bids if book_side == "buy" else self.asks
+            level = tree.min()
+            while level and (high is None or level.price <= high):
+                next_level = tree.next_level(level)
+                if low is None or level.price >= low:
+                    self._log_change('delete', book_side, level.price, 0)
+                    self._update_depth(book_side == "buy", level.price, -level.total_volume)
+                    level.clear()
+                    tree.delete(level.price)
+                level = next_level
+
+        orders = self.orders
+        for order_id in columns['id'][mask].tolist():
+            del orders[order_id]
+        store.release_many(slots)
+        return len(slots)
+
+    def clone(self) -> 'CompactOrderbook':
+        clone = super().clone()
+        clone.store = self.store.copy()
+        clone.orders = dict(self.orders)
+        return clone
+
+    def export_side(self, side: str) -> SideState:
+        tree = self.bids if side == "buy" else self.asks
+        next_slots = self.store.next_slots
+        level_ticks = []
+        level_counts = []
+        slots = []
+        level = tree.min()
+        while level:
+            level_ticks.append(level.price)
+            level_counts.append(level.order_count)
+            slot = level.head_slot
+            while slot != NO_SLOT:
+                slots.append(slot)
+                slot = next_slots[slot]
+            level = tree.next_level(level)
+        columns = self.store.columns(np.array(slots, dtype=np.int64))
+        return SideState(np.array(level_ticks, dtype=np.int64), np.array(level_counts, dtype=np.int64), columns['id'],
+                         columns['quantity'], np.zeros(len(slots), dtype=np.float64))
+
+    def _load_side(self, side: str, state: SideState) -> None:
+        if not len(state.level_ticks):
+            return
+        is_buy = side == "buy"
+        ids = np.asarray(state.ids, dtype=np.int64)
+        quantities = np.asarray(state.quantities, dtype=np.int64)
+        slots = self.store.extend_levels(ids, BUY if is_buy else SELL, state.level_ticks, state.level_counts, quantities)
+
+        ends = np.cumsum(state.level_counts)
+        starts = ends - state.level_counts
+        volumes = np.add.reduceat(quantities, starts)
+        slot_list = slots.tolist()
+        levels = []
+        for tick, start, end, count, volume in zip(state.level_ticks.tolist(), starts.tolist(), ends.tolist(),
+                                                   state.level_counts.tolist(), volumes.tolist()):
+            level = SlotLevel(tick)
+            level.load(slot_list[start], slot_list[end - 1], count, volume)
+            levels.append(level)
+            self._update_depth(is_buy, tick, volume)
+
+        (self.bids if is_buy else self.asks).load_sorted(levels)
+        self.orders.update(zip(ids.tolist(), slot_list))
+
+    def dump(self) -> Dict[str, np.ndarray]:
+        return self.store.columns(self.store.live_slots())
+
+    def _remove_slot(self, slot: int) -> None:
+        store = self.store
+        tree = self.bids if store.sides[slot] == BUY else self.asks
+        tick = store.ticks[slot]
+        level = tree.find(tick)
+        level.remove_slot(store, slot)
+        if level.order_count == 0:
+            tree.delete(tick)
+        self._update_depth(store.sides[slot] == BUY, tick, -store.quantities[slot])
+        del self.orders[store.ids[slot]]
+        store.release(slot)
@@ -0,0 +1,185 @@
+from typing import Dict, List, Optional
+
+DEFAULT_MAX_SPAN = 1 << 16
+
+class DepthIndex:
+    def __init__(self, low: Optional[int] = None, high: Optional[int] = None, initial_size: int = 1024,
+                 max_span: int = DEFAULT_MAX_SPAN):
+        if max_span <= 0:
+            raise ValueError("Depth index span must be positive")
+        self._low = 0
+        self._size = 0
+        self._volumes: List[int] = []
+        self._tree: List[int] = []
+        self._notional_tree: List[int] = []
+        self._level_tree: List[int] = []
+        self._total = 0
+        self._initial_size = initial_size
+        self._max_span = max_span
+        self._outliers: Dict[int, int] = {}
+        self._outlier_total = 0
+        if low is not None and high is not None:
+            self._resize(low, high)
+            self._max_span = self._size
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    def volume_at(self, key: int) -> int:
+        index = key - self._low
+        return self._volumes[index] if 0 <= index < self._size else self._outliers.get(key, 0)
+
+    def add(self, key: int, delta: int) -> None:
+        index = key - self._low
+        if not 0 <= index < self._size:
+            if not self._grow(key):
+                self._add_outlier(key, delta)
+                return
+            index = key - self._low
+        old_volume = self._volumes[index]
+        new_volume = old_volume + delta
+        self._volumes[index] = new_volume
+        self._total += delta
+        notional_delta = key * delta
+        level_delta = (new_volume > 0) - (old_volume > 0)
+
+        tree = self._tree
+        notional_tree = self._notional_tree
+        level_tree = self._level_tree
+        size = self._size
+        position = index + 1
+        while position <= size:
+            tree[position] += delta
+            notional_tree[position] += notional_delta
+            level_tree[position] += level_delta
+            position += position & -position
+
+    def volume_through(self, key: int) -> int:
+        volume = self._prefix(self._tree, key)
+        if self._outliers:
+            volume += sum(outlier_volume for outlier, outlier_volume in self._outliers.items() if outlier <= key)
+        return volume
+
+    def notional_through(self, key: int) -> int:
+        notional = self._prefix(self._notional_tree, key)
+        if self._outliers:
+            notional += sum(outlier * outlier_volume for outlier, outlier_volume in self._outliers.items() if outlier <= key)
+        return notional
+
+    def levels_through(self, key: int) -> int:
+        levels = self._prefix(self._level_tree, key)
+        if self._outliers:
+            levels += sum(1 for outlier in self._outliers if outlier <= key)
+        return levels
+
+    def volume_between(self, low: int, high: int) -> int:
+        if high < low:
+            return 0
+        return self.volume_through(high) - self.volume_through(low - 1)
+
+    def key_for_quantity(self, quantity: int) -> Optional[int]:
+        if quantity <= 0 or quantity > self._total:
+            return None
+        remaining = quantity
+        if self._outliers:
+            for key, volume in sorted(item for item in self._outliers.items() if item[0] < self._low):
+                if remaining <= volume:
+                    return key
+                remaining -= volume
+            dense_total = self._total - self._outlier_total
+            if remaining > dense_total:
+                remaining -= dense_total
+                for key, volume in sorted(item for item in self._outliers.items() if item[0] >= self._low):
+                    if remaining <= volume:
+                        return key
+                    remaining -= volume
+        tree = self._tree
+        size = self._size
+        position = 0
+        step = 1 << (size.bit_length() - 1)
+        while step:
+            next_position = position + step
+            if next_position <= size and tree[next_position] < remaining:
+                position = next_position
+                remaining -= tree[position]
+            step >>= 1
+        return self._low + position
+
+    def copy(self) -> 'DepthIndex':
+        index = DepthIndex.__new__(DepthIndex)
+        index._low = self._low
+        index._size = self._size
+        index._volumes = list(self._volumes)
+        index._tree = list(self._tree)
+        index._notional_tree = list(self._notional_tree)
+        index._level_tree = list(self._level_tree)
+        index._total = self._total
+        index._initial_size = self._initial_size
+        index._max_span = self._max_span
+        index._outliers = dict(self._outliers)
+        index._outlier_total = self._outlier_total
+        return index
+
+    def _prefix(self, tree: List[int], key: int) -> int:
+        position = min(key - self._low + 1, self._size)
+        total = 0
+        while position > 0:
+            total += tree[position]
+            position -= position & -position
+        return total
+
+    def _grow(self, key: int) -> bool:
+        if not self._size:
+            half = max(min(self._initial_size, self._max_span) // 2, 1)
+            self._resize(key - half, key + half - 1)
+            return True
+        low = min(key, self._low)
+        high = max(key, self._low + self._size - 1)
+        span = high - low + 1
+        size = self._size
+        while size < span:
+            size *= 2
+        if size > self._max_span:
+            return False
+        if key < self._low:
+            low = self._low + self._size - size
+        self._resize(low, low + size - 1)
+        return True
+
+    def _add_outlier(self, key: int, delta: int) -> None:
+        volume = self._outliers.get(key, 0) + delta
+        if volume:
+            self._outliers[key] = volume
+        else:
+            self._outliers.pop(key, None)
+        self._outlier_total += delta
+        self._total += delta
+
+    def _resize(self, low: int, high: int) -> None:
+        size = 1 << max(high - low, 1).bit_length()
+        volumes = [0] * size
+        offset = self._low - low
+        for index, volume in enumerate(self._volumes):
+            if volume:
+                volumes[index + offset] = volume
+        for key in [key for key in self._outliers if low <= key < low + size]:
+            volume = self._outliers.pop(key)
+            volumes[key - low] = volume
+            self._outlier_total -= volume
+
+        self._low = low
+        self._size = size
+        self._volumes = volumes
+        self._tree = self._build([0] + volumes)
+        self._notional_tree = self._build([0] + [(low + index) * volume for index, volume in enumerate(volumes)])
+        self._level_tree = self._build([0] + [int(volume > 0) for volume in volumes])
+
+    @staticmethod
+    def _build(tree: List[int]) -> List[int]:
+        size = len(tree) - 1
+        for position in range(1, size + 1):
+            parent = position + (position & -position)
+            if parent <= size:
+                tree[parent] += tree[position]
+        return tree
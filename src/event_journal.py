@@ -0,0 +1,272 @@
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from decimal import Decimal
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from .order import Order
+from .ticker import Ticker
+from .exceptions import InvalidJournalException, InvalidOrderException
+
+MAGIC = b'OBWL'
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct('<4sHxx')
+RECORD = struct.Struct('<qIBBBxqqqd')
+CHECKSUM = struct.Struct('<I4x')
+RECORD_SIZE = RECORD.size + CHECKSUM.size
+
+OP_DEFINE = 0
+OP_LIMIT = 1
+OP_MARKET = 2
+OP_CANCEL = 3
+OP_MODIFY = 4
+
+ORDER_OPS = {"limit": OP_LIMIT, "market": OP_MARKET}
+SIDE_CODES = {"buy": 0, "sell": 1}
+SIDES = ("buy", "sell")
+
+FLAG_STRING_ID = 1
+FLAG_REPLACE = 2
+
+SYNC_MODES = ("fsync", "flush", "none")
+
+class JournalRecord(NamedTuple):
+    sequence: int
+    symbol: str
+    op: int
+    side: str
+    order_id: object
+    tick: int
+    quantity: int
+    timestamp: float
+    flags: int = 0
+    ticker: Optional[Ticker] = None
+
+def encode_order_id(order_id) -> Tuple[int, int]:
+    if isinstance(order_id, int):
+        return order_id, 0
+    if isinstance(order_id, str) and order_id.isdigit() and str(int(order_id)) == order_id:
+        return int(order_id), FLAG_STRING_ID
+    raise InvalidOrderException("Journaled order ids must be integers or canonical numeric strings")
+
+def order_entry(order: Order) -> tuple:
+    op = ORDER_OPS.get(order.type)
+    side = SIDE_CODES.get(order.side)
+    if op is None or side is None:
+        raise InvalidOrderException("Invalid order type or side")
+    order_id, flags = encode_order_id(order.id)
+    return op, side, flags, order_id, order.quantity, order.timestamp
+
+def read_journal(path: str) -> Iterator[JournalRecord]:
+    for record, _ in _scan_journal(path):
+        yield record
+
+def _scan_journal(path: str) -> Iterator[Tuple[JournalRecord, int]]:
+    with open(path, 'rb') as stream:
+        if os.fstat(stream.fileno()).st_size < HEADER.size:
+            return
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield from _iter_records(data, path)
+
+def _iter_records(data, path: str) -> Iterator[Tuple[JournalRecord, int]]:
+    if len(data) < HEADER.size:
+        return
+    magic, format_version = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise InvalidJournalException(f"{path} is not an event journal")
+    if format_version != FORMAT_VERSION:
+        raise InvalidJournalException(f"Unsupported journal format version {format_version}")
+
+    symbols: Dict[int, str] = {}
+    offset = HEADER.size
+    end = len(data)
+    unpack = RECORD.unpack_from
+    while offset + RECORD_SIZE <= end:
+        sequence, symbol_id, op, side, flags, order_id, tick, quantity, timestamp = unpack(data, offset)
+        (checksum,) = CHECKSUM.unpack_from(data, offset + RECORD.size)
+        record_end = offset + RECORD_SIZE
+        ticker = None
+        if op == OP_DEFINE:
+            payload_end = record_end + quantity + (-quantity % 8)
+            if payload_end > end:
+                return
+            payload = data[record_end:record_end + quantity]
+            if zlib.crc32(payload, zlib.crc32(data[offset:offset + RECORD.size])) != checksum:
+                return
+            ticker = _decode_ticker(payload)
+            symbols[symbol_id] = ticker.symbol
+            record_end = payload_end
+        elif zlib.crc32(data[offset:offset + RECORD.size]) != checksum or symbol_id not in symbols:
+            return
+        if flags & FLAG_STRING_ID:
+            order_id = str(order_id)
+        yield JournalRecord(sequence, symbols[symbol_id], op, SIDES[side], order_id, tick, quantity,
+                            timestamp, flags, ticker), record_end
+        offset = record_end
+
+def _encode_ticker(ticker: Ticker) -> bytes:
+    band = ticker.price_band
+    return '\0'.join((ticker.symbol, str(ticker.tick_size),
+                      f"{band[0]}:{band[1]}" if band is not None else "")).encode('utf-8')
+
+def _decode_ticker(payload: bytes) -> Ticker:
+    symbol, tick_size, band = payload.decode('utf-8').split('\0')
+    price_band = tuple(Decimal(price) for price in band.split(':')) if band else None
+    return Ticker(symbol, tick_size, price_band)
+
+class EventJournal:
+    def __init__(self, path: str, sync: str = "fsync", commit_delay: float = 0.0, sequence: int = 0):
+        if sync not in SYNC_MODES:
+            raise ValueError(f"Journal sync mode must be one of {SYNC_MODES}")
+        self.path = path
+        self.sync = sync
+        self.commit_delay = commit_delay
+        self.symbol_ids: Dict[str, int] = {}
+        self.commits = 0
+        self._sequence = sequence
+        self._open()
+        self._durable_sequence = self._sequence
+        self._pending: List[bytes] = []
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._lock = threading.Lock()
+        self._work = threading.Condition(self._lock)
+        self._durable = threading.Condition(self._lock)
+        self._writer = threading.Thread(target=self._run, name="event-journal-writer", daemon=True)
+        self._writer.start()
+
+    @property
+    def sequence(self) -> int:
+        return self._sequence
+
+    @property
+    def durable_sequence(self) -> int:
+        return self._durable_sequence
+
+    def _open(self) -> None:
+        end = 0
+        if os.path.exists(self.path):
+            end = HEADER.size if os.path.getsize(self.path) >= HEADER.size else 0
+            for record, end in _scan_journal(self.path):
+                self._sequence = max(self._sequence, record.sequence)
+                if record.op == OP_DEFINE:
+                    self.symbol_ids.setdefault(record.symbol, len(self.symbol_ids))
+        if end:
+            with open(self.path, 'r+b') as stream:
+                stream.truncate(end)
+            self._file = open(self.path, 'ab', buffering=0)
+        else:
+            self._file = open(self.path, 'wb', buffering=0)
+            self._file.write(HEADER.pack(MAGIC, FORMAT_VERSION))
+
+    def define_symbol(self, ticker: Ticker, replace: bool = False) -> int:
+        payload = _encode_ticker(ticker)
+        with self._lock:
+            self._check_open()
+            symbol_id = self.symbol_ids.setdefault(ticker.symbol, len(self.symbol_ids))
+            sequence = self._sequence + 1
+            body = RECORD.pack(sequence, symbol_id, OP_DEFINE, 0, FLAG_REPLACE if replace else 0,
+                               0, 0, len(payload), 0.0)
+            self._enqueue(body + CHECKSUM.pack(zlib.crc32(payload, zlib.crc32(body)))
+                          + payload + b'\0' * (-len(payload) % 8))
+            self._sequence = sequence
+        return sequence
+
+    def append(self, symbol: str, op: int, order_key: Tuple[int, int], side: int = 0, tick: int = 0,
+               quantity: int = 0, timestamp: float = 0.0) -> int:
+        order_id, flags = order_key
+        with self._lock:
+            self._check_open()
+            sequence = self._sequence + 1
+            body = RECORD.pack(sequence, self.symbol_ids[symbol], op, side, flags, order_id, tick, quantity, timestamp)
+            self._enqueue(body + CHECKSUM.pack(zlib.crc32(body)))
+            self._sequence = sequence
+        return sequence
+
+    def append_order(self, symbol: str, entry: tuple, tick: Optional[int]) -> int:
+        op, side, flags, order_id, quantity, timestamp = entry
+        return self.append(symbol, op, (order_id, flags), side, tick or 0, quantity, timestamp)
+
+    def append_orders(self, symbol: str, entries: Sequence[tuple], ticks: Sequence[int]) -> int:
+        pack = RECORD.pack
+        crc32 = zlib.crc32
+        with self._lock:
+            self._check_open()
+            symbol_id = self.symbol_ids[symbol]
+            sequence = self._sequence
+            records = []
+            for (op, side, flags, order_id, quantity, timestamp), tick in zip(entries, ticks):
+                sequence += 1
+                body = pack(sequence, symbol_id, op, side, flags, order_id, tick or 0, quantity, timestamp)
+                records.append(body + CHECKSUM.pack(crc32(body)))
+            if records:
+                self._enqueue(b''.join(records))
+            self._sequence = sequence
+        return sequence
+
+    def wait_durable(self, sequence: int) -> None:
+        if self.sync == "none":
+            return
+        with self._lock:
+            while self._durable_sequence < sequence:
+                if self._error is not None:
+                    raise self._error
+                self._durable.wait()
+
+    def flush(self) -> None:
+        with self._lock:
+            while self._durable_sequence < self._sequence and self._error is None:
+                self._durable.wait()
+            if self._error is not None:
+                raise self._error
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._work.notify()
+        self._writer.join()
+        self._file.close()
+        if self._error is not None:
+            raise self._error
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise InvalidJournalException("Event journal is closed")
+        if self._error is not None:
+            raise self._error
+
+    def _enqueue(self, record: bytes) -> None:
+        self._pending.append(record)
+        if len(self._pending) == 1:
+            self._work.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while not self._pending and not self._closed:
+                    self._work.wait()
+                if not self._pending:
+                    return
+            if self.commit_delay:
+                time.sleep(self.commit_delay)
+            with self._lock:
+                pending, self._pending = self._pending, []
+                sequence = self._sequence
+            try:
+                self._file.write(b''.join(pending))
+                if self.sync == "fsync":
+                    os.fsync(self._file.fileno())
+            except OSError as error:
+                with self._lock:
+                    self._error = error
+                    self._durable.notify_all()
+                return
+            with self._lock:
+                self.commits += 1
+                self._durable_sequence = sequence
+                self._durable.notify_all()
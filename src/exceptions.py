@@ -11,4 +11,16 @@ class InvalidTickSizeException(Exception):
     pass
 
 class InvalidQuantityException(Exception):
-    pass
\ No newline at end of file
+    pass
+
+class VersionOutOfRangeException(Exception):
+    pass
+
+class InvalidCheckpointException(Exception):
+    pass
+
+class InvalidJournalException(Exception):
+    pass
+
+class InvalidEventFileException(Exception):
+    pass
@@ -0,0 +1,62 @@
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable
+
+_STOP = object()
+
+class ExecutionLane:
+    def __init__(self, name: str, batch_size: int = 256):
+        self.name = name
+        self.batch_size = batch_size
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=f"lane-{name}", daemon=True)
+        self._thread.start()
+
+    def submit(self, function: Callable, *args) -> Future:
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"Execution lane {self.name} is closed")
+            self._queue.put((future, function, args))
+        return future
+
+    def call(self, function: Callable, *args):
+        if threading.current_thread() is self._thread:
+            return function(*args)
+        return self.submit(function, *args).result()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join()
+
+    def _run(self) -> None:
+        get = self._queue.get
+        get_nowait = self._queue.get_nowait
+        stopping = False
+        while True:
+            batch = [] if stopping else [get()]
+            while stopping or len(batch) < self.batch_size:
+                try:
+                    batch.append(get_nowait())
+                except queue.Empty:
+                    break
+            if stopping and not batch:
+                return
+            for item in batch:
+                if item is _STOP:
+                    stopping = True
+                    continue
+                future, function, args = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(function(*args))
+                except BaseException as error:
+                    future.set_exception(error)
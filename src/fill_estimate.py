@@ -0,0 +1,17 @@
+from decimal import Decimal
+from typing import NamedTuple, Optional
+import numpy as np
+
+class FillEstimate(NamedTuple):
+    filled_quantity: int
+    average_price: Optional[Decimal]
+    worst_price: Optional[Decimal]
+    levels_consumed: int
+    shortfall: int
+
+class FillEstimates(NamedTuple):
+    filled_quantity: np.ndarray
+    average_price: np.ndarray
+    worst_price: np.ndarray
+    levels_consumed: np.ndarray
+    shortfall: np.ndarray
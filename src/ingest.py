@@ -0,0 +1,183 @@
+import os
+import queue
+import struct
+import threading
+from itertools import islice
+from typing import Iterable, Iterator, NamedTuple
+import numpy as np
+from .orderbook import Orderbook
+from .order_batch import OrderBatch
+from .ticker import Ticker
+from .event_journal import OP_LIMIT, OP_MARKET, OP_CANCEL, OP_MODIFY
+from .exceptions import (InvalidEventFileException, InvalidOrderException, InvalidQuantityException,
+                         InvalidTickSizeException, OrderNotFoundException)
+
+MAGIC = b'OBEV'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sHxx24s32s')
+
+DEFAULT_CHUNK_SIZE = 65536
+
+EVENT_DTYPE = np.dtype([('order_id', '<i8'), ('tick', '<i8'), ('quantity', '<i8'), ('timestamp', '<f8'),
+                        ('op', 'u1'), ('side', 'u1')], align=True)
+
+CSV_COLUMNS = ('op', 'side', 'order_id', 'price', 'quantity')
+OP_CODES = {"limit": OP_LIMIT, "market": OP_MARKET, "cancel": OP_CANCEL, "modify": OP_MODIFY}
+SIDE_CODES = {"buy": 0, "sell": 1}
+TYPE_NAMES = np.array(["", "limit", "market"])
+SIDE_NAMES = np.array(["buy", "sell"])
+
+REJECTIONS = (InvalidOrderException, InvalidQuantityException, InvalidTickSizeException, OrderNotFoundException)
+
+class FeedResult(NamedTuple):
+    events: int
+    rejected: int
+
+def read_csv(path: str, ticker: Ticker, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[np.ndarray]:
+    with open(path, newline='') as stream:
+        header = stream.readline().rstrip('\r\n').split(',')
+        missing = [name for name in CSV_COLUMNS if name not in header]
+        if missing:
+            raise InvalidEventFileException(f"{path} is missing CSV columns {missing}")
+        positions = [header.index(name) for name in CSV_COLUMNS]
+        timestamp_position = header.index('timestamp') if 'timestamp' in header else None
+
+        while True:
+            lines = list(islice(stream, chunk_size))
+            if not lines:
+                return
+            columns = np.loadtxt(lines, delimiter=',', dtype=str, ndmin=2, comments=None)
+            if columns.shape[1] != len(header):
+                raise InvalidEventFileException(f"{path} rows must have {len(header)} columns")
+            yield _csv_chunk(columns, positions, timestamp_position, ticker)
+
+def _csv_chunk(columns: np.ndarray, positions: list, timestamp_position, ticker: Ticker) -> np.ndarray:
+    ops, sides, order_ids, prices, quantities = (columns[:, position] for position in positions)
+    events = np.zeros(len(ops), dtype=EVENT_DTYPE)
+    events['op'] = _codes(ops, OP_CODES, "op")
+    is_order = events['op'] <= OP_MARKET
+    events['side'] = _codes(np.where(is_order, sides, "buy"), SIDE_CODES, "side")
+    events['order_id'] = order_ids.astype(np.int64)
+    events['quantity'] = np.where(events['op'] == OP_CANCEL, "0", quantities).astype(np.int64)
+    is_limit = events['op'] == OP_LIMIT
+    events['tick'][is_limit] = ticker.to_ticks_array(prices[is_limit].astype(np.float64))
+    if timestamp_position is not None:
+        events['timestamp'] = columns[:, timestamp_position].astype(np.float64)
+    return events
+
+def _codes(values: np.ndarray, table: dict, column: str) -> np.ndarray:
+    codes = np.full(len(values), 255, dtype=np.uint8)
+    for name, code in table.items():
+        codes[values == name] = code
+    invalid = codes == 255
+    if invalid.any():
+        raise InvalidEventFileException(f"Invalid {column} {values[np.argmax(invalid)]!r}")
+    return codes
+
+def write_binary(path: str, ticker: Ticker, chunks: Iterable[np.ndarray]) -> int:
+    count = 0
+    with open(path, 'wb') as stream:
+        stream.write(HEADER.pack(MAGIC, FORMAT_VERSION, str(ticker.tick_size).encode('ascii'),
+                                 ticker.symbol.encode('utf-8')))
+        for chunk in chunks:
+            stream.write(np.ascontiguousarray(chunk, dtype=EVENT_DTYPE).tobytes())
+            count += len(chunk)
+    return count
+
+def read_binary_ticker(path: str) -> Ticker:
+    with open(path, 'rb') as stream:
+        header = stream.read(HEADER.size)
+    if len(header) < HEADER.size or header[:4] != MAGIC:
+        raise InvalidEventFileException(f"{path} is not an event file")
+    _, format_version, tick_size, symbol = HEADER.unpack(header)
+    if format_version != FORMAT_VERSION:
+        raise InvalidEventFileException(f"Unsupported event file format version {format_version}")
+    return Ticker(symbol.rstrip(b'\0').decode('utf-8'), tick_size.rstrip(b'\0').decode('ascii'))
+
+def read_binary(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[np.ndarray]:
+    read_binary_ticker(path)
+    count = (os.path.getsize(path) - HEADER.size) // EVENT_DTYPE.itemsize
+    for start in range(0, count, chunk_size):
+        window = np.memmap(path, dtype=EVENT_DTYPE, mode='r', offset=HEADER.size + start * EVENT_DTYPE.itemsize,
+                           shape=(min(chunk_size, count - start),))
+        chunk = np.array(window)
+        del window
+        yield chunk
+
+def read_ahead(chunks: Iterable[np.ndarray], depth: int = 4) -> Iterator[np.ndarray]:
+    buffer = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce() -> None:
+        try:
+            for chunk in chunks:
+                if not put(chunk):
+                    return
+        except Exception as error:
+            put(error)
+        else:
+            put(done)
+
+    thread = threading.Thread(target=produce, name="ingest-read-ahead", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is done:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+def feed(orderbook: Orderbook, chunks: Iterable[np.ndarray]) -> FeedResult:
+    events = 0
+    rejected = 0
+    for chunk in chunks:
+        ops = chunk['op']
+        op_codes = ops.tolist()
+        order_ids = chunk['order_id'].tolist()
+        quantities = chunk['quantity'].tolist()
+        start = 0
+        for position in np.flatnonzero(ops >= OP_CANCEL).tolist() + [len(chunk)]:
+            if position > start:
+                rejected += _add_run(orderbook, chunk[start:position])
+            if position < len(chunk):
+                try:
+                    if op_codes[position] == OP_CANCEL:
+                        orderbook.cancel_order(order_ids[position])
+                    else:
+                        orderbook.modify_order(order_ids[position], quantities[position])
+                except REJECTIONS:
+                    rejected += 1
+            start = position + 1
+        events += len(chunk)
+    return FeedResult(events, rejected)
+
+def _add_run(orderbook: Orderbook, run: np.ndarray) -> int:
+    batch = OrderBatch(run['order_id'], TYPE_NAMES[run['op']], SIDE_NAMES[run['side']], run['quantity'], ticks=run['tick'])
+    try:
+        orderbook.add_orders(batch)
+        return 0
+    except REJECTIONS:
+        pass
+    rejected = 0
+    for row in range(len(batch)):
+        try:
+            orderbook.add_orders(OrderBatch(batch.ids[row:row + 1], batch.types[row:row + 1], batch.sides[row:row + 1],
+                                            batch.quantities[row:row + 1], ticks=batch.ticks[row:row + 1]))
+        except REJECTIONS:
+            rejected += 1
+    return rejected
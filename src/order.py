@@ -1,12 +1,19 @@
 from decimal import Decimal
+from typing import List
 import time
 
 class Order:
+    __slots__ = ('id', 'type', 'side', 'price', 'quantity', 'symbol', 'timestamp', 'filled_quantity',
+                 'next_order', 'prev_order', 'parent_level', 'tick', 'pool')
+
     def __init__(self, id, type, side, price, quantity, symbol):
         self.id = id
         self.type = type
         self.side = side
-        self.price = Decimal(str(price)) if price is not None else None
+        if price is None or isinstance(price, Decimal):
+            self.price = price
+        else:
+            self.price = Decimal(str(price))
         self.quantity = int(quantity)
         self.symbol = symbol
         self.timestamp = time.time()
@@ -14,9 +21,68 @@ class Order:
         self.next_order = None
         self.prev_order = None
         self.parent_level = None
+        self.tick = None
+        self.pool = None
+
+    @classmethod
+    def resting(cls, id, side, price: Decimal, quantity: int, symbol, tick: int, timestamp: float) -> 'Order':
+        order = cls.__new__(cls)
+        order.id = id
+        order.type = "limit"
+        order.side = side
+        order.price = price
+        order.quantity = quantity
+        order.symbol = symbol
+        order.timestamp = timestamp
+        order.filled_quantity = 0
+        order.next_order = None
+        order.prev_order = None
+        order.parent_level = None
+        order.tick = tick
+        order.pool = None
+        return order
+
+    def copy(self) -> 'Order':
+        order = Order.__new__(Order)
+        order.id = self.id
+        order.type = self.type
+        order.side = self.side
+        order.price = self.price
+        order.quantity = self.quantity
+        order.symbol = self.symbol
+        order.timestamp = self.timestamp
+        order.filled_quantity = self.filled_quantity
+        order.next_order = None
+        order.prev_order = None
+        order.parent_level = None
+        order.tick = self.tick
+        order.pool = None
+        return order
 
     def update_quantity(self, new_quantity):
         self.quantity = int(new_quantity)
 
     def is_filled(self):
-        return self.filled_quantity == self.quantity
\ No newline at end of file
+        return self.filled_quantity == self.quantity
+
+class OrderPool:
+    def __init__(self, capacity: int = 100000):
+        self.capacity = capacity
+        self._free: List[Order] = []
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def acquire(self, id, type, side, price, quantity, symbol) -> Order:
+        if self._free:
+            order = self._free.pop()
+            Order.__init__(order, id, type, side, price, quantity, symbol)
+        else:
+            order = Order(id, type, side, price, quantity, symbol)
+        order.pool = self
+        return order
+
+    def release(self, order: Order) -> None:
+        if order.pool is self and len(self._free) < self.capacity:
+            order.pool = None
+            self._free.append(order)
@@ -0,0 +1,74 @@
+from array import array
+from decimal import Decimal
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+import numpy as np
+from .order import Order
+from .ticker import Ticker
+from .exceptions import InvalidOrderException, InvalidQuantityException
+
+ORDER_TYPES = ("limit", "market")
+ORDER_SIDES = ("buy", "sell")
+
+class OrderBatch:
+    def __init__(self, ids: Sequence, types: Sequence[str], sides: Sequence[str], quantities: Sequence[int],
+                 prices: Optional[Sequence] = None, ticks: Optional[Sequence[int]] = None):
+        if (prices is None) == (ticks is None):
+            raise InvalidOrderException("OrderBatch needs exactly one of prices or ticks")
+        self.ids = ids.tolist() if isinstance(ids, np.ndarray) else list(ids)
+        self.types = np.asarray(types)
+        self.sides = np.asarray(sides)
+        self.quantities = np.asarray(quantities, dtype=np.int64)
+        self.prices = None if prices is None else np.asarray(prices, dtype=object)
+        self.ticks = None if ticks is None else np.asarray(ticks, dtype=np.int64)
+        if not (len(self.ids) == len(self.types) == len(self.sides) == len(self.quantities)
+                == len(self.prices if self.ticks is None else self.ticks)):
+            raise InvalidOrderException("OrderBatch columns must have the same length")
+
+    @classmethod
+    def from_orders(cls, orders: Sequence[Order]) -> 'OrderBatch':
+        return cls([order.id for order in orders], [order.type for order in orders],
+                   [order.side for order in orders], [order.quantity for order in orders],
+                   prices=[order.price for order in orders])
+
+    def to_orders(self, ticker: Ticker) -> List[Order]:
+        if self.ticks is not None:
+            prices = [ticker.to_price(tick) if order_type == "limit" else None
+                      for order_type, tick in zip(self.types.tolist(), self.ticks.tolist())]
+        else:
+            prices = self.prices.tolist()
+        return [Order(*params, ticker.symbol) for params in
+                zip(self.ids, self.types.tolist(), self.sides.tolist(), prices, self.quantities.tolist())]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def validate(self, ticker: Ticker) -> np.ndarray:
+        if len(self.quantities) and self.quantities.min() <= 0:
+            raise InvalidQuantityException(f"Order quantity must be positive (row {int(np.argmax(self.quantities <= 0))})")
+        is_limit = self.types == "limit"
+        invalid = ~(is_limit | (self.types == "market"))
+        if invalid.any():
+            raise InvalidOrderException(f"Invalid order type (row {int(np.argmax(invalid))})")
+        invalid = ~((self.sides == "buy") | (self.sides == "sell"))
+        if invalid.any():
+            raise InvalidOrderException(f"Invalid order side (row {int(np.argmax(invalid))})")
+
+        if self.ticks is not None:
+            return self.ticks
+        ticks = np.zeros(len(self), dtype=np.int64)
+        ticks[is_limit] = ticker.to_ticks_array(self.prices[is_limit])
+        return ticks
+
+class BatchFills(NamedTuple):
+    order_ids: List[Any]
+    offsets: array
+    fills: List[Tuple[Any, int, Decimal]]
+
+    def for_order(self, row: int) -> List[Tuple[Any, int, Decimal]]:
+        return self.fills[self.offsets[row]:self.offsets[row + 1]]
+
+    def filled_quantities(self) -> np.ndarray:
+        quantities = np.fromiter((fill[1] for fill in self.fills), dtype=np.int64, count=len(self.fills))
+        cumulative = np.concatenate(([0], np.cumsum(quantities)))
+        offsets = np.frombuffer(self.offsets, dtype=np.int64)
+        return cumulative[offsets[1:]] - cumulative[offsets[:-1]]
@@ -0,0 +1,158 @@
+from array import array
+from typing import Dict, List, Optional
+import numpy as np
+from .price_level import PriceLevel
+
+NO_SLOT = -1
+BUY = 0
+SELL = 1
+
+class OrderStore:
+    def __init__(self):
+        self.ids = array('q')
+        self.ticks = array('q')
+        self.quantities = array('q')
+        self.sides = array('b')
+        self.next_slots = array('q')
+        self.prev_slots = array('q')
+        self._free_slots = array('q')
+
+    def __len__(self) -> int:
+        return len(self.ids) - len(self._free_slots)
+
+    @property
+    def capacity(self) -> int:
+        return len(self.ids)
+
+    def copy(self) -> 'OrderStore':
+        store = OrderStore.__new__(OrderStore)
+        store.ids = array('q', self.ids)
+        store.ticks = array('q', self.ticks)
+        store.quantities = array('q', self.quantities)
+        store.sides = array('b', self.sides)
+        store.next_slots = array('q', self.next_slots)
+        store.prev_slots = array('q', self.prev_slots)
+        store._free_slots = array('q', self._free_slots)
+        return store
+
+    def extend_levels(self, ids: np.ndarray, side: int, level_ticks: np.ndarray, level_counts: np.ndarray,
+                      quantities: np.ndarray) -> np.ndarray:
+        count = len(ids)
+        slots = np.arange(len(self.ids), len(self.ids) + count, dtype=np.int64)
+        next_slots = slots + 1
+        prev_slots = slots - 1
+        ends = np.cumsum(level_counts) - 1
+        next_slots[ends] = NO_SLOT
+        prev_slots[ends - level_counts + 1] = NO_SLOT
+
+        self.ids.frombytes(np.ascontiguousarray(ids, dtype=np.int64).tobytes())
+        self.ticks.frombytes(np.repeat(level_ticks, level_counts).astype(np.int64).tobytes())
+        self.quantities.frombytes(np.ascontiguousarray(quantities, dtype=np.int64).tobytes())
+        self.sides.frombytes(np.full(count, side, dtype=np.int8).tobytes())
+        self.next_slots.frombytes(next_slots.tobytes())
+        self.prev_slots.frombytes(prev_slots.tobytes())
+        return slots
+
+    def allocate(self, order_id: int, side: int, tick: int, quantity: int) -> int:
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self.ids[slot] = order_id
+            self.ticks[slot] = tick
+            self.quantities[slot] = quantity
+            self.sides[slot] = side
+            self.next_slots[slot] = NO_SLOT
+            self.prev_slots[slot] = NO_SLOT
+            return slot
+        self.ids.append(order_id)
+        self.ticks.append(tick)
+        self.quantities.append(quantity)
+        self.sides.append(side)
+        self.next_slots.append(NO_SLOT)
+        self.prev_slots.append(NO_SLOT)
+        return len(self.ids) - 1
+
+    def release(self, slot: int) -> None:
+        self.quantities[slot] = 0
+        self._free_slots.append(slot)
+
+    def release_many(self, slots: np.ndarray) -> None:
+        quantities = np.frombuffer(self.quantities, dtype=np.int64)
+        quantities[slots] = 0
+        del quantities
+        self._free_slots.frombytes(slots.astype(np.int64).tobytes())
+
+    def live_slots(self) -> np.ndarray:
+        return np.flatnonzero(np.frombuffer(self.quantities, dtype=np.int64))
+
+    def columns(self, slots: np.ndarray) -> Dict[str, np.ndarray]:
+        return {
+            'slot': slots,
+            'id': np.frombuffer(self.ids, dtype=np.int64)[slots],
+            'side': np.frombuffer(self.sides, dtype=np.int8)[slots],
+            'tick': np.frombuffer(self.ticks, dtype=np.int64)[slots],
+            'quantity': np.frombuffer(self.quantities, dtype=np.int64)[slots],
+        }
+
+class SlotLevel(PriceLevel):
+    __slots__ = ('head_slot', 'tail_slot')
+
+    def __init__(self, price: int):
+        super().__init__(price)
+        self.head_slot = NO_SLOT
+        self.tail_slot = NO_SLOT
+
+    def copy(self, orders: Optional[Dict] = None) -> 'SlotLevel':
+        level = SlotLevel(self._price)
+        level._total_volume = self._total_volume
+        level._order_count = self._order_count
+        level.head_slot = self.head_slot
+        level.tail_slot = self.tail_slot
+        return level
+
+    def load(self, head_slot: int, tail_slot: int, order_count: int, total_volume: int) -> None:
+        self.head_slot = head_slot
+        self.tail_slot = tail_slot
+        self._order_count = order_count
+        self._total_volume = total_volume
+
+    def add_slot(self, store: OrderStore, slot: int) -> None:
+        self._total_volume += store.quantities[slot]
+        self._order_count += 1
+        if self.tail_slot == NO_SLOT:
+            self.head_slot = self.tail_slot = slot
+        else:
+            store.next_slots[self.tail_slot] = slot
+            store.prev_slots[slot] = self.tail_slot
+            self.tail_slot = slot
+
+    def remove_slot(self, store: OrderStore, slot: int) -> None:
+        self._total_volume -= store.quantities[slot]
+        self._order_count -= 1
+        prev_slot = store.prev_slots[slot]
+        next_slot = store.next_slots[slot]
+        if prev_slot != NO_SLOT:
+            store.next_slots[prev_slot] = next_slot
+        else:
+            self.head_slot = next_slot
+        if next_slot != NO_SLOT:
+            store.prev_slots[next_slot] = prev_slot
+        else:
+            self.tail_slot = prev_slot
+        store.next_slots[slot] = NO_SLOT
+        store.prev_slots[slot] = NO_SLOT
+
+    def detach_slots(self, store: OrderStore) -> List[int]:
+        slots = []
+        next_slots = store.next_slots
+        slot = self.head_slot
+        while slot != NO_SLOT:
+            slots.append(slot)
+            slot = next_slots[slot]
+        self.clear()
+        return slots
+
+    def clear(self) -> None:
+        self._total_volume = 0
+        self._order_count = 0
+        self.head_slot = NO_SLOT
+        self.tail_slot = NO_SLOT
@@ -1,115 +1,182 @@
+import sys
+import copy
+import itertools
+from array import array
+import numpy as np
 from decimal import Decimal
-from typing import Dict, List, Tuple, Optional
-from .order import Order
+from typing import Dict, Iterator, List, NamedTuple, Sequence, Tuple, Optional, Union
+from .order import Order, OrderPool
+from .order_batch import OrderBatch, BatchFills
 from .price_level import PriceLevel, PriceLevelTree
+from .price_ladder import PriceLadder
 from .ticker import Ticker
-from .exceptions import InvalidOrderException, OrderNotFoundException, InvalidTickSizeException, InvalidQuantityException
+from .exceptions import InvalidOrderException, OrderNotFoundException, InvalidQuantityException
 from .orderbook_logger import OrderBookLogger
+from .depth_index import DepthIndex
+from .fill_estimate import FillEstimate, FillEstimates
+from .change_journal import ChangeJournal, NullChangeJournal, ChangeRecord, DEFAULT_JOURNAL_CAPACITY
+
+_generations = itertools.count(1)
+
+class SideState(NamedTuple):
+    level_ticks: np.ndarray
+    level_counts: np.ndarray
+    ids: Sequence
+    quantities: np.ndarray
+    timestamps: np.ndarray
 
 class Orderbook:
-    def __init__(self, ticker: Ticker):
+    level_class = PriceLevel
+
+    def __init__(self, ticker: Ticker, order_pool: Optional[OrderPool] = None,
+                 journal_capacity: Optional[int] = DEFAULT_JOURNAL_CAPACITY, depth_index: bool = False):
         self.ticker: Ticker = ticker
-        self.bids: PriceLevelTree = PriceLevelTree()
-        self.asks: PriceLevelTree = PriceLevelTree()
+        self.order_pool = order_pool
+        self.bids: Union[PriceLevelTree, PriceLadder] = self._create_book_side()
+        self.asks: Union[PriceLevelTree, PriceLadder] = self._create_book_side()
         self.orders: Dict[int, Order] = {}
-        self.best_bid: Optional[Decimal] = None
-        self.best_ask: Optional[Decimal] = None
         self.logger = OrderBookLogger(ticker.symbol)
-        self.changes: List[Dict] = []
+        self.journal = ChangeJournal(journal_capacity) if journal_capacity is not None else NullChangeJournal()
         self.version = 0
+        self.generation = next(_generations)
+        self.bid_depth: Optional[DepthIndex] = None
+        self.ask_depth: Optional[DepthIndex] = None
+        if depth_index:
+            self.bid_depth, self.ask_depth = self._create_depth_indexes()
+
+    def _create_book_side(self) -> Union[PriceLevelTree, PriceLadder]:
+        if self.ticker.price_band is None:
+            return PriceLevelTree(self.level_class)
+        low, high = self.ticker.price_band
+        return PriceLadder(self.ticker.to_ticks(low), self.ticker.to_ticks(high), self.level_class)
+
+    def _create_depth_indexes(self) -> Tuple[DepthIndex, DepthIndex]:
+        if self.ticker.price_band is None:
+            return DepthIndex(), DepthIndex()
+        low, high = (self.ticker.to_ticks(price) for price in self.ticker.price_band)
+        return DepthIndex(-high, -low), DepthIndex(low, high)
 
     def add_order(self, order: Order) -> Tuple[int, List[Tuple[int, int, Decimal]]]:
         if order.quantity <= 0:
             raise InvalidQuantityException("Order quantity must be positive")
-    
-        if order.type == "market":
-            order_id, filled_orders = self._process_market_order(order)
-            total_filled = sum(fill[1] for fill in filled_orders)
-            if total_filled < order.quantity:
-                self._log_change('partial_fill', order.side, order.price, total_filled)
-        elif order.type == "limit":
-            order_id, filled_orders = self._process_limit_order(order)
-        else:
+        if order.type == "limit":
+            order.tick = self.ticker.to_ticks(order.price)
+        elif order.type != "market":
             raise InvalidOrderException("Invalid order type")
-    
-        self._log_change('add', order.side, order.price, order.quantity)
+
+        filled_orders = []
+        order_id = self._execute_order(order, filled_orders)
         return order_id, filled_orders
 
-    def _process_market_order(self, order: Order) -> Tuple[int, List[Tuple[int, int, Decimal]]]:
+    def add_orders(self, batch: Union[Sequence[Order], OrderBatch]) -> BatchFills:
+        orders = None
+        if not isinstance(batch, OrderBatch):
+            orders = batch
+            batch = OrderBatch.from_orders(orders)
+        ticks = batch.validate(self.ticker).tolist()
+        self._validate_batch(batch)
+
+        if orders is None:
+            make_order = self.order_pool.acquire if self.order_pool is not None else Order
+            symbol = self.ticker.symbol
+            to_price = self.ticker.to_price
+            quantities = batch.quantities.tolist()
+            types = batch.types.tolist()
+            sides = batch.sides.tolist()
+
+        order_ids = []
+        offsets = array('q', [0])
+        filled_orders = []
+        execute = self._execute_order
+        for row, tick in enumerate(ticks):
+            if orders is not None:
+                order = orders[row]
+            else:
+                is_limit = types[row] == "limit"
+                order = make_order(batch.ids[row], types[row], sides[row], to_price(tick) if is_limit else None,
+                                   quantities[row], symbol)
+            if order.type == "limit":
+                order.tick = tick
+            order_ids.append(execute(order, filled_orders))
+            offsets.append(len(filled_orders))
+        return BatchFills(order_ids, offsets, filled_orders)
+
+    def _validate_batch(self, batch: OrderBatch) -> None:
+        pass
+
+    def _execute_order(self, order: Order, filled_orders: List[Tuple[int, int, Decimal]]) -> int:
+        order_id = order.id
+        if order.type == "market":
+            self._process_market_order(order, filled_orders)
+        else:
+            self._process_limit_order(order, filled_orders)
+
+        if self.order_pool is not None and order.parent_level is None:
+            self.order_pool.release(order)
+        return order_id
+
+    def _process_market_order(self, order: Order, filled_orders: List[Tuple[int, int, Decimal]]) -> int:
         opposing_tree = self.asks if order.side == "buy" else self.bids
+        opposing_side = "sell" if order.side == "buy" else "buy"
         remaining_quantity = order.quantity
-        filled_orders = []
 
-        while remaining_quantity > 0 and opposing_tree.root:
+        while remaining_quantity > 0:
             best_level = opposing_tree.min() if order.side == "buy" else opposing_tree.max()
             if not best_level:
                 break
 
-            filled_quantity, level_orders = self._match_orders_at_level(best_level, remaining_quantity)
+            filled_quantity = self._match_orders_at_level(best_level, remaining_quantity, filled_orders)
             remaining_quantity -= filled_quantity
-            filled_orders.extend(level_orders)
+            self._update_depth(order.side != "buy", best_level.price, -filled_quantity)
+            self._log_level_change(opposing_side, best_level)
 
             if best_level.order_count == 0:
                 opposing_tree.delete(best_level.price)
-                if order.side == "buy":
-                    self.best_ask = opposing_tree.min().price if opposing_tree.root else None
-                else:
-                    self.best_bid = opposing_tree.max().price if opposing_tree.root else None
 
-        if remaining_quantity > 0:
-            self._log_change('partial_fill', order.side, None, order.quantity - remaining_quantity)
-        else:
-            self._log_change('fill', order.side, None, order.quantity)
+        return order.quantity - remaining_quantity
 
-        return order.id, filled_orders
-
-    def _process_limit_order(self, order: Order) -> Tuple[int, List[Tuple[int, int, Decimal]]]:
-        if not self.ticker.is_valid_price(order.price):
-            raise InvalidTickSizeException(f"Invalid price. Must be a multiple of {self.ticker.tick_size}")
-
-        filled_orders = []
+    def _process_limit_order(self, order: Order, filled_orders: List[Tuple[int, int, Decimal]]) -> None:
         remaining_quantity = order.quantity
+        tick = order.tick
 
-        opposing_tree = self.asks if order.side == "buy" else self.bids
-        best_opposing_price = opposing_tree.min().price if opposing_tree.root else None
+        is_buy = order.side == "buy"
+        opposing_tree = self.asks if is_buy else self.bids
+        opposing_side = "sell" if is_buy else "buy"
+        best_level = opposing_tree.min() if is_buy else opposing_tree.max()
 
-        while remaining_quantity > 0 and best_opposing_price and \
-              ((order.side == "buy" and order.price >= best_opposing_price) or \
-               (order.side == "sell" and order.price <= best_opposing_price)):
-            best_level = opposing_tree.min() if order.side == "buy" else opposing_tree.max()
-            filled_quantity, level_orders = self._match_orders_at_level(best_level, remaining_quantity)
+        while remaining_quantity > 0 and best_level and \
+              ((is_buy and tick >= best_level.price) or \
+               (not is_buy and tick <= best_level.price)):
+            filled_quantity = self._match_orders_at_level(best_level, remaining_quantity, filled_orders)
             remaining_quantity -= filled_quantity
-            filled_orders.extend(level_orders)
+            self._update_depth(not is_buy, best_level.price, -filled_quantity)
+            self._log_level_change(opposing_side, best_level)
 
             if best_level.order_count == 0:
                 opposing_tree.delete(best_level.price)
-                best_opposing_price = opposing_tree.min().price if opposing_tree.root else None
+            best_level = opposing_tree.min() if is_buy else opposing_tree.max()
 
         if remaining_quantity > 0:
-            tree = self.bids if order.side == "buy" else self.asks
-            level = tree.find(order.price)
-            if not level:
-                level = PriceLevel(order.price)
-                tree.insert(level)
             order.quantity = remaining_quantity
-            level.add_order(order)
-            self.orders[order.id] = order
-
-            if order.side == "buy":
-                if not self.best_bid or order.price > self.best_bid:
-                    self.best_bid = order.price
-            else:
-                if not self.best_ask or order.price < self.best_ask:
-                    self.best_ask = order.price
+            self._rest_order(order)
 
-        return order.id, filled_orders
+    def _rest_order(self, order: Order) -> None:
+        tree = self.bids if order.side == "buy" else self.asks
+        level = tree.find_or_create(order.tick)
+        level.add_order(order)
+        self.orders[order.id] = order
+        self._update_depth(order.side == "buy", order.tick, order.quantity)
+        self._log_level_change(order.side, level, level.order_count == 1)
 
     def cancel_order(self, order_id: int) -> None:
         if order_id not in self.orders:
             raise OrderNotFoundException("Order not found")
         order = self.orders[order_id]
+        level = order.parent_level
         self._remove_order(order)
-        self._log_change('delete', order.side, order.price, order.quantity)
+        self._log_level_change(order.side, level)
+        if self.order_pool is not None:
+            self.order_pool.release(order)
 
     def modify_order(self, order_id: int, new_quantity: int) -> int:
         if order_id not in self.orders:
@@ -126,35 +193,117 @@ class Orderbook:
             self._decrease_order_quantity(order, new_quantity)
         elif new_quantity > old_quantity:
             self._increase_order_quantity(order, new_quantity)
+        else:
+            return order_id
 
-        self._log_change('update', order.side, order.price, new_quantity)
+        self._log_level_change(order.side, order.parent_level)
         return order_id
 
-    def get_order_book_snapshot(self, levels: int) -> Dict[str, List[Tuple[Decimal, int]]]:
-        bids = []
-        asks = []
-
-        bid_node = self.bids.max()
-        for _ in range(levels):
-            if bid_node:
-                bids.append((bid_node.price, bid_node.total_volume))
-                bid_node = self._get_previous_level(bid_node)
-            else:
-                break
+    def clone(self) -> 'Orderbook':
+        clone = copy.copy(self)
+        clone.generation = next(_generations)
+        clone.orders = {}
+        clone.journal = self.journal.copy()
+        clone.bid_depth = self.bid_depth.copy() if self.bid_depth is not None else None
+        clone.ask_depth = self.ask_depth.copy() if self.ask_depth is not None else None
+        clone.bids = self.bids.clone(clone._copy_level)
+        clone.asks = self.asks.clone(clone._copy_level)
+        return clone
+
+    def _copy_level(self, level: PriceLevel) -> PriceLevel:
+        return level.copy(self.orders)
+
+    @classmethod
+    def restore(cls, ticker: Ticker, version: int, bids: SideState, asks: SideState,
+                depth_index: bool = False) -> 'Orderbook':
+        orderbook = cls(ticker, depth_index=depth_index)
+        orderbook._load_side("buy", bids)
+        orderbook._load_side("sell", asks)
+        orderbook.version = version
+        orderbook.journal.reset(version)
+        return orderbook
+
+    def export_side(self, side: str) -> SideState:
+        tree = self.bids if side == "buy" else self.asks
+        level_ticks = []
+        level_counts = []
+        ids = []
+        quantities = []
+        timestamps = []
+        level = tree.min()
+        while level:
+            level_ticks.append(level.price)
+            level_counts.append(level.order_count)
+            order = level.head_order
+            while order:
+                ids.append(order.id)
+                quantities.append(order.quantity)
+                timestamps.append(order.timestamp)
+                order = order.next_order
+            level = tree.next_level(level)
+        return SideState(np.array(level_ticks, dtype=np.int64), np.array(level_counts, dtype=np.int64), ids,
+                         np.array(quantities, dtype=np.int64), np.array(timestamps, dtype=np.float64))
+
+    def _load_side(self, side: str, state: SideState) -> None:
+        is_buy = side == "buy"
+        symbol = self.ticker.symbol
+        to_price = self.ticker.to_price
+        ids = state.ids.tolist() if isinstance(state.ids, np.ndarray) else list(state.ids)
+        quantities = state.quantities.tolist()
+        timestamps = state.timestamps.tolist()
+
+        resting = Order.resting
+        levels = []
+        orders = []
+        start = 0
+        for tick, count in zip(state.level_ticks.tolist(), state.level_counts.tolist()):
+            price = to_price(tick)
+            end = start + count
+            level_orders = [resting(order_id, side, price, quantity, symbol, tick, timestamp)
+                            for order_id, quantity, timestamp in zip(ids[start:end], quantities[start:end], timestamps[start:end])]
+            level = self.level_class(tick)
+            level.load_orders(level_orders)
+            levels.append(level)
+            orders.extend(level_orders)
+            self._update_depth(is_buy, tick, level.total_volume)
+            start = end
+
+        (self.bids if is_buy else self.asks).load_sorted(levels)
+        self.orders.update(zip(ids, orders))
 
-        ask_node = self.asks.min()
-        for _ in range(levels):
-            if ask_node:
-                asks.append((ask_node.price, ask_node.total_volume))
-                ask_node = self._get_next_level(ask_node)
-            else:
-                break
+    def get_order_book_snapshot(self, levels: int) -> Dict[str, List[Tuple[Decimal, int]]]:
+        bids = self._get_snapshot_for_tree(self.bids, levels, reverse=True)
+        asks = self._get_snapshot_for_tree(self.asks, levels, reverse=False)
+        return {"bids": bids, "asks": asks}
 
+    def get_tick_snapshot(self, levels: int) -> Dict[str, List[Tuple[int, int]]]:
+        bids = self._get_snapshot_for_tree(self.bids, levels, reverse=True, as_ticks=True)
+        asks = self._get_snapshot_for_tree(self.asks, levels, reverse=False, as_ticks=True)
         return {"bids": bids, "asks": asks}
 
-    def _match_orders_at_level(self, level: PriceLevel, quantity: int) -> Tuple[int, List[Tuple[int, int, Decimal]]]:
+    def _match_orders_at_level(self, level: PriceLevel, quantity: int, filled_orders: List[Tuple[int, int, Decimal]]) -> int:
+        if quantity >= level.total_volume:
+            return self._sweep_level(level, filled_orders)
+        return self._walk_level(level, quantity, filled_orders)
+
+    def _sweep_level(self, level: PriceLevel, filled_orders: List[Tuple[int, int, Decimal]]) -> int:
+        price = self.ticker.to_price(level.price)
+        swept_volume = level.total_volume
+        swept = level.detach_orders()
+        filled_orders.extend([(order.id, order.quantity, price) for order in swept])
+
+        orders = self.orders
+        order_pool = self.order_pool
+        for order in swept:
+            order.quantity = 0
+            del orders[order.id]
+            if order_pool is not None:
+                order_pool.release(order)
+        return swept_volume
+
+    def _walk_level(self, level: PriceLevel, quantity: int, filled_orders: List[Tuple[int, int, Decimal]]) -> int:
         filled_quantity = 0
-        filled_orders = []
+        price = self.ticker.to_price(level.price)
         current_order = level.head_order
 
         while current_order and filled_quantity < quantity:
@@ -163,7 +312,7 @@ class Orderbook:
             filled_quantity += order_fill
             level.update_volume(current_order.quantity + order_fill, current_order.quantity)
 
-            filled_orders.append((current_order.id, order_fill, level.price))
+            filled_orders.append((current_order.id, order_fill, price))
 
             if current_order.quantity == 0:
                 next_order = current_order.next_order
@@ -172,91 +321,244 @@ class Orderbook:
                     del self.orders[current_order.id]
                 else:
                     print(f"Warning: Order {current_order.id} not found in self.orders")
+                if self.order_pool is not None:
+                    self.order_pool.release(current_order)
                 current_order = next_order
             else:
                 current_order = current_order.next_order
 
-        return filled_quantity, filled_orders
+        return filled_quantity
 
     def _remove_order(self, order: Order) -> None:
-        tree = self.bids if order.side == "buy" else self.asks
-        level = tree.find(order.price)
+        level = order.parent_level
         if level:
             level.remove_order(order)
             if level.order_count == 0:
-                tree.delete(order.price)
+                tree = self.bids if order.side == "buy" else self.asks
+                tree.delete(order.tick)
+            self._update_depth(order.side == "buy", order.tick, -order.quantity)
         del self.orders[order.id]
 
     def _decrease_order_quantity(self, order: Order, new_quantity: int) -> None:
         level = order.parent_level
         level.update_volume(order.quantity, new_quantity)
+        self._update_depth(order.side == "buy", order.tick, new_quantity - order.quantity)
         order.quantity = new_quantity
 
     def _increase_order_quantity(self, order: Order, new_quantity: int) -> None:
-        self._remove_order(order)
+        level = order.parent_level
+        level.remove_order(order)
+        self._update_depth(order.side == "buy", order.tick, new_quantity - order.quantity)
         order.quantity = new_quantity
-        self._process_limit_order(order)
-
-    def _get_snapshot_for_tree(self, tree: PriceLevelTree, levels: int, reverse: bool) -> List[Tuple[Decimal, int]]:
+        level.add_order(order)
+
+    def _update_depth(self, is_buy: bool, tick: int, delta: int) -> None:
+        if is_buy:
+            if self.bid_depth is not None:
+                self.bid_depth.add(-tick, delta)
+        elif self.ask_depth is not None:
+            self.ask_depth.add(tick, delta)
+
+    def available_volume(self, side: str, limit_price: Optional[Decimal] = None,
+                         within_ticks: Optional[int] = None) -> int:
+        is_buy = side == "buy"
+        depth = self.ask_depth if is_buy else self.bid_depth
+        limit_key = self._limit_key(is_buy, limit_price, within_ticks)
+        if depth is not None:
+            return depth.total if limit_key is None else max(depth.volume_through(limit_key), 0)
+        return sum(level.total_volume for level in self._opposing_levels(is_buy, limit_key))
+
+    def price_for_quantity(self, side: str, quantity: int) -> Optional[Decimal]:
+        is_buy = side == "buy"
+        depth = self.ask_depth if is_buy else self.bid_depth
+        if depth is not None:
+            key = depth.key_for_quantity(quantity)
+            return None if key is None else self.ticker.to_price(key if is_buy else -key)
+        remaining = quantity
+        for level in self._opposing_levels(is_buy):
+            remaining -= level.total_volume
+            if remaining <= 0:
+                return self.ticker.to_price(level.price)
+        return None
+
+    def can_fill(self, side: str, quantity: int, limit_price: Optional[Decimal] = None) -> bool:
+        if limit_price is None:
+            return self.price_for_quantity(side, quantity) is not None
+        return self.available_volume(side, limit_price) >= quantity
+
+    def estimate_fill(self, side: str, quantity: int) -> FillEstimate:
+        quantity = int(quantity)
+        if quantity <= 0:
+            raise InvalidQuantityException("Order quantity must be positive")
+        is_buy = side == "buy"
+        depth = self.ask_depth if is_buy else self.bid_depth
+        if depth is not None:
+            filled = min(quantity, depth.total)
+            if not filled:
+                return FillEstimate(0, None, None, 0, quantity)
+            key = depth.key_for_quantity(filled)
+            volume_before = depth.volume_through(key - 1)
+            notional = depth.notional_through(key - 1) + (filled - volume_before) * key
+            return self._fill_estimate(is_buy, filled, notional, key, depth.levels_through(key), quantity - filled)
+
+        remaining = quantity
+        notional = 0
+        levels = 0
+        key = None
+        for level in self._opposing_levels(is_buy):
+            key = level.price if is_buy else -level.price
+            fill = min(remaining, level.total_volume)
+            notional += fill * key
+            remaining -= fill
+            levels += 1
+            if not remaining:
+                break
+        return self._fill_estimate(is_buy, quantity - remaining, notional, key, levels, remaining)
+
+    def estimate_fill_to_price(self, side: str, limit_price: Decimal, quantity: Optional[int] = None) -> FillEstimate:
+        is_buy = side == "buy"
+        limit_key = self._limit_key(is_buy, limit_price, None)
+        if quantity is not None:
+            estimate = self.estimate_fill(side, quantity)
+            if not estimate.filled_quantity or self._price_key(is_buy, estimate.worst_price) <= limit_key:
+                return estimate
+
+        depth = self.ask_depth if is_buy else self.bid_depth
+        if depth is not None:
+            filled = max(depth.volume_through(limit_key), 0)
+            key = depth.key_for_quantity(filled)
+            notional = depth.notional_through(limit_key)
+            levels = depth.levels_through(limit_key)
+        else:
+            filled = notional = levels = 0
+            key = None
+            for level in self._opposing_levels(is_buy, limit_key):
+                key = level.price if is_buy else -level.price
+                filled += level.total_volume
+                notional += level.total_volume * key
+                levels += 1
+        shortfall = quantity - filled if quantity is not None else 0
+        return self._fill_estimate(is_buy, filled, notional, key, levels, shortfall)
+
+    def estimate_fills(self, side: str, quantities) -> FillEstimates:
+        quantities = np.asarray(quantities, dtype=np.int64)
+        is_buy = side == "buy"
+        target = int(quantities.max()) if len(quantities) else 0
+        ticks = []
+        volumes = []
+        available = 0
+        for level in self._opposing_levels(is_buy):
+            if available >= target:
+                break
+            ticks.append(level.price)
+            volumes.append(level.total_volume)
+            available += level.total_volume
+
+        filled = np.minimum(quantities, available)
+        shortfall = quantities - filled
+        if not ticks:
+            nan = np.full(len(quantities), np.nan)
+            return FillEstimates(filled, nan, nan.copy(), np.zeros(len(quantities), dtype=np.int64), shortfall)
+
+        ticks = np.array(ticks, dtype=np.int64)
+        volumes = np.array(volumes, dtype=np.int64)
+        cumulative_volume = np.cumsum(volumes)
+        cumulative_notional = np.cumsum(ticks * volumes)
+        last = np.minimum(np.searchsorted(cumulative_volume, filled, side='left'), len(ticks) - 1)
+        volume_before = cumulative_volume[last] - volumes[last]
+        notional = cumulative_notional[last] - ticks[last] * volumes[last] + (filled - volume_before) * ticks[last]
+
+        tick_size = float(self.ticker.tick_size)
+        has_fill = filled > 0
+        with np.errstate(invalid='ignore', divide='ignore'):
+            average_price = np.where(has_fill, notional * tick_size / filled, np.nan)
+        worst_price = np.where(has_fill, ticks[last] * tick_size, np.nan)
+        levels = np.where(has_fill, last + 1, 0)
+        return FillEstimates(filled, average_price, worst_price, levels, shortfall)
+
+    def _fill_estimate(self, is_buy: bool, filled: int, notional: int, worst_key: Optional[int],
+                       levels: int, shortfall: int) -> FillEstimate:
+        if not filled:
+            return FillEstimate(0, None, None, 0, shortfall)
+        average_price = abs(notional) * self.ticker.tick_size / filled
+        worst_price = self.ticker.to_price(worst_key if is_buy else -worst_key)
+        return FillEstimate(filled, average_price, worst_price, levels, shortfall)
+
+    def _price_key(self, is_buy: bool, price: Decimal) -> int:
+        tick = self.ticker.to_ticks(price)
+        return tick if is_buy else -tick
+
+    def _limit_key(self, is_buy: bool, limit_price: Optional[Decimal], within_ticks: Optional[int]) -> Optional[int]:
+        keys = []
+        if limit_price is not None:
+            tick = self.ticker.to_ticks(limit_price)
+            keys.append(tick if is_buy else -tick)
+        if within_ticks is not None:
+            best_level = self.asks.min() if is_buy else self.bids.max()
+            if not best_level:
+                return -sys.maxsize
+            keys.append((best_level.price if is_buy else -best_level.price) + within_ticks)
+        return min(keys) if keys else None
+
+    def _opposing_levels(self, is_buy: bool, limit_key: Optional[int] = None) -> Iterator[PriceLevel]:
+        tree = self.asks if is_buy else self.bids
+        level = tree.min() if is_buy else tree.max()
+        while level and (limit_key is None or (level.price if is_buy else -level.price) <= limit_key):
+            yield level
+            level = tree.next_level(level) if is_buy else tree.previous_level(level)
+
+    def _get_snapshot_for_tree(self, tree: Union[PriceLevelTree, PriceLadder], levels: int, reverse: bool,
+                               as_ticks: bool = False) -> List[Tuple[Decimal, int]]:
         snapshot = []
+        to_price = self.ticker.to_price
         current = tree.max() if reverse else tree.min()
         while current and len(snapshot) < levels:
-            snapshot.append((current.price, current.total_volume))
+            snapshot.append((current.price if as_ticks else to_price(current.price), current.total_volume))
             if reverse:
-                current = self._get_previous_level(current)
+                current = tree.previous_level(current)
             else:
-                current = self._get_next_level(current)
+                current = tree.next_level(current)
         return snapshot
 
-    def _get_next_level(self, level: PriceLevel) -> Optional[PriceLevel]:
-        if level.right_child:
-            return self._find_min(level.right_child)
-        while level.parent and level.parent.right_child == level:
-            level = level.parent
-        return level.parent
-
-    def _get_previous_level(self, level: PriceLevel) -> Optional[PriceLevel]:
-        if level.left_child:
-            return self._find_max(level.left_child)
-        while level.parent and level.parent.left_child == level:
-            level = level.parent
-        return level.parent
-
-    def _find_min(self, node: PriceLevel) -> PriceLevel:
-        current = node
-        while current.left_child:
-            current = current.left_child
-        return current
-
-    def _find_max(self, node: PriceLevel) -> PriceLevel:
-        current = node
-        while current.right_child:
-            current = current.right_child
-        return current
-
-    def _log_change(self, action: str, side: str, price: Decimal, quantity: int):
+    def _log_level_change(self, side: str, level: PriceLevel, created: bool = False) -> None:
+        if level.order_count == 0:
+            self._log_change('delete', side, level.price, 0)
+        else:
+            self._log_change('add' if created else 'update', side, level.price, level.total_volume)
+
+    def _log_change(self, action: str, side: str, tick: int, quantity: int):
         self.version += 1
-        change = {
-            'version': self.version,
-            'action': action,
-            'side': side,
-            'price': price,
-            'quantity': quantity
-        }
-        self.changes.append(change)
-        self.logger.log_change(action, side, price, quantity)
+        self.journal.append(self.version, action, side, tick, quantity)
+        if self.logger.is_enabled():
+            self.logger.log_change(action, side, self._to_price(tick), quantity)
 
     def get_updates_since(self, last_version: int) -> List[Dict]:
-        return [change for change in self.changes if change['version'] > last_version]
+        to_price = self._to_price
+        return [{'version': version, 'action': action, 'side': side, 'price': to_price(tick), 'quantity': quantity}
+                for version, action, side, tick, quantity in self.journal.since(last_version)]
+
+    def get_change_records_since(self, last_version: int) -> List[ChangeRecord]:
+        return self.journal.since(last_version)
+
+    def _to_price(self, tick: Optional[int]) -> Optional[Decimal]:
+        return self.ticker.to_price(tick) if tick is not None else None
 
     def clear_changes(self):
-        self.changes.clear()
+        self.journal.clear()
+
+    @property
+    def best_bid(self) -> Optional[Decimal]:
+        level = self.bids.max()
+        return self.ticker.to_price(level.price) if level else None
+
+    @property
+    def best_ask(self) -> Optional[Decimal]:
+        level = self.asks.min()
+        return self.ticker.to_price(level.price) if level else None
 
     @property
     def best_bid_ask(self) -> Tuple[Optional[Decimal], Optional[Decimal]]:
-        best_bid = self.bids.max().price if self.bids.root else None
-        best_ask = self.asks.min().price if self.asks.root else None
-        return best_bid, best_ask
+        return self.best_bid, self.best_ask
 
     @property
     def current_version(self):
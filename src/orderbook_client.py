@@ -1,23 +1,32 @@
 import grpc
 import json
+import queue
 import argparse
+import threading
+from concurrent.futures import Future
+from decimal import Decimal
 from .orderbook_service_pb2 import SubscriptionRequest, Order, OrderBookUpdate
 from .orderbook_service_pb2_grpc import OrderBookServiceStub
+from . import orderbook_service_v2_pb2 as pb2_v2
+from .orderbook_service_v2_pb2_grpc import OrderBookServiceStub as OrderBookServiceStubV2
+from .ticker import Ticker
 
 class OrderBookClient:
+    subscription_request = SubscriptionRequest
+
     def __init__(self):
         with open('src/config.json') as config_file:
             config = json.load(config_file)
-        channel = grpc.insecure_channel(f'localhost:{config["server_port"]}')
-        self.stub = OrderBookServiceStub(channel)
+        self.channel = grpc.insecure_channel(f'localhost:{config["server_port"]}')
+        self.stub = OrderBookServiceStub(self.channel)
 
     def subscribe_order_book(self, symbol):
         def request_iterator():
-            yield SubscriptionRequest(symbol=symbol, subscribe=True)
+            yield self.subscription_request(symbol=symbol, subscribe=True)
             while True:
                 user_input = input("Enter 'u' to unsubscribe or press Enter to continue: ")
                 if user_input.lower() == 'u':
-                    yield SubscriptionRequest(symbol=symbol, subscribe=False)
+                    yield self.subscription_request(symbol=symbol, subscribe=False)
                     break
 
         try:
@@ -59,6 +68,135 @@ class OrderBookClient:
         except grpc.RpcError as e:
             print(f"RPC error: {e}")
 
+class OrderEntrySession:
+    def __init__(self, stub, max_batch: int = 512):
+        self.max_batch = max_batch
+        self._requests = queue.SimpleQueue()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._responses = stub.OrderEntry(self._request_batches())
+        self._receiver = threading.Thread(target=self._receive, name="order-entry-receiver", daemon=True)
+        self._receiver.start()
+
+    def __enter__(self) -> 'OrderEntrySession':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def place_order(self, symbol, order_id, side, order_type, price_ticks, quantity) -> Future:
+        return self._send(request_type=pb2_v2.NEW_ORDER, symbol=symbol, order_id=order_id,
+                          side=pb2_v2.BUY if side == "buy" else pb2_v2.SELL,
+                          type=pb2_v2.LIMIT if order_type == "limit" else pb2_v2.MARKET,
+                          price_ticks=price_ticks or 0, quantity=quantity)
+
+    def cancel_order(self, symbol, order_id) -> Future:
+        return self._send(request_type=pb2_v2.CANCEL_ORDER, symbol=symbol, order_id=order_id)
+
+    def modify_order(self, symbol, order_id, quantity) -> Future:
+        return self._send(request_type=pb2_v2.MODIFY_ORDER, symbol=symbol, order_id=order_id, quantity=quantity)
+
+    def close(self) -> None:
+        self._requests.put(None)
+        self._receiver.join()
+
+    def _send(self, **fields) -> Future:
+        future = Future()
+        with self._lock:
+            self._sequence += 1
+            sequence = self._sequence
+            self._pending[sequence] = future
+        self._requests.put(pb2_v2.OrderRequest(client_sequence=sequence, **fields))
+        return future
+
+    def _request_batches(self):
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+            requests = [request]
+            while len(requests) < self.max_batch:
+                try:
+                    request = self._requests.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    yield pb2_v2.OrderRequests(requests=requests)
+                    return
+                requests.append(request)
+            yield pb2_v2.OrderRequests(requests=requests)
+
+    def _receive(self):
+        error = None
+        try:
+            for batch in self._responses:
+                with self._lock:
+                    acknowledged = [(self._pending.pop(report.client_sequence), report) for report in batch.reports]
+                for future, report in acknowledged:
+                    future.set_result(report)
+        except grpc.RpcError as rpc_error:
+            error = rpc_error
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_exception(error or RuntimeError("Order entry stream closed"))
+
+class OrderBookClientV2(OrderBookClient):
+    subscription_request = pb2_v2.SubscriptionRequest
+
+    def __init__(self):
+        super().__init__()
+        self.stub = OrderBookServiceStubV2(self.channel)
+        self.tickers = {}
+
+    def get_ticker(self, symbol):
+        if symbol not in self.tickers:
+            for instrument in self.stub.ListInstruments(pb2_v2.InstrumentsRequest()).instruments:
+                self.tickers[instrument.symbol] = Ticker(instrument.symbol, instrument.tick_size)
+        return self.tickers[symbol]
+
+    def open_order_entry(self, max_batch: int = 512) -> OrderEntrySession:
+        return OrderEntrySession(self.stub, max_batch)
+
+    def _handle_update(self, update: pb2_v2.OrderBookUpdate):
+        if update.tick_size:
+            self.tickers[update.symbol] = Ticker(update.symbol, update.tick_size)
+        to_price = self.get_ticker(update.symbol).to_price
+        print(f"Received update for {update.symbol}:")
+        if update.is_snapshot:
+            print("Snapshot:")
+            print("Bids:")
+            for tick, quantity in zip(update.bid_ticks, update.bid_quantities):
+                print(f"  Price: {to_price(tick)}, Quantity: {quantity}")
+            print("Asks:")
+            for tick, quantity in zip(update.ask_ticks, update.ask_quantities):
+                print(f"  Price: {to_price(tick)}, Quantity: {quantity}")
+        else:
+            print("Incremental Update:")
+            for side, action, tick, quantity in zip(update.change_sides, update.change_actions, update.change_ticks,
+                                                    update.change_quantities):
+                print(f"  {'Bid' if side == pb2_v2.BUY else 'Ask'} - "
+                      f"Price: {to_price(tick)}, Quantity: {quantity}, "
+                      f"Action: {'Add' if action == pb2_v2.ADD else 'Update' if action == pb2_v2.UPDATE else 'Delete'}")
+        print("------------------------")
+
+    def place_order(self, symbol, order_id, side, order_type, price, quantity):
+        is_limit = order_type == "limit"
+        order = pb2_v2.Order(
+            symbol=symbol,
+            order_id=int(order_id),
+            side=pb2_v2.BUY if side == "buy" else pb2_v2.SELL,
+            type=pb2_v2.LIMIT if is_limit else pb2_v2.MARKET,
+            price_ticks=self.get_ticker(symbol).to_ticks(Decimal(str(price))) if is_limit else 0,
+            quantity=quantity
+        )
+        try:
+            response = self.stub.PlaceOrder(order)
+            print(f"Order placed: ID = {response.order_id}, Status = {pb2_v2.OrderStatus.Name(response.status)}")
+        except grpc.RpcError as e:
+            print(f"RPC error: {e}")
+
 def main():
     parser = argparse.ArgumentParser(description="OrderBook Client")
     parser.add_argument('action', choices=['subscribe', 'place_order'], help="Action to perform")
@@ -68,9 +206,10 @@ def main():
     parser.add_argument('--type', choices=['market', 'limit'], help="Order type")
     parser.add_argument('--price', type=float, help="Order price (for limit orders)")
     parser.add_argument('--quantity', type=int, help="Order quantity")
+    parser.add_argument('--v2', action='store_true', help="Use the compact v2 wire schema")
 
     args = parser.parse_args()
-    client = OrderBookClient()
+    client = OrderBookClientV2() if args.v2 else OrderBookClient()
 
     if args.action == 'subscribe':
         client.subscribe_order_book(args.symbol)
@@ -1,16 +1,146 @@
+import atexit
+import json
 import logging
-from typing import List, Dict
+import queue
+import sys
+import threading
+import time
+import traceback
+from typing import List, Optional
 from decimal import Decimal
 
+LOGGER_NAME = "orderbook"
+DEFAULT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+CHANGE_FIELDS = ('symbol', 'action', 'side', 'quantity', 'price')
+CHANGE_FORMAT = "%s - %s: %s %s @ %s"
+
+_STOP = object()
+
+class TextLogSink:
+    def __init__(self, stream=None, fmt: str = DEFAULT_FORMAT):
+        self.stream = stream
+        self.formatter = logging.Formatter(fmt)
+
+    def write(self, records: List[logging.LogRecord]) -> None:
+        stream = self.stream if self.stream is not None else sys.stderr
+        stream.write(''.join(self.formatter.format(record) + '\n' for record in records))
+        stream.flush()
+
+class JsonLinesLogSink:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, records: List[logging.LogRecord]) -> None:
+        self.stream.write(''.join(json.dumps(self._to_dict(record)) + '\n' for record in records))
+        self.stream.flush()
+
+    def _to_dict(self, record: logging.LogRecord) -> dict:
+        entry = {'time': record.created, 'logger': record.name, 'level': record.levelname}
+        if isinstance(record.args, tuple) and len(record.args) == len(CHANGE_FIELDS):
+            entry.update(zip(CHANGE_FIELDS, record.args))
+            if entry['price'] is not None:
+                entry['price'] = str(entry['price'])
+        else:
+            entry['message'] = record.getMessage()
+        return entry
+
+class _LogWriter(threading.Thread):
+    def __init__(self, sink, batch_size: int):
+        super().__init__(name="orderbook-log-writer", daemon=True)
+        self.sink = sink
+        self.batch_size = batch_size
+        self.queue = queue.SimpleQueue()
+
+    def run(self) -> None:
+        get = self.queue.get
+        get_nowait = self.queue.get_nowait
+        running = True
+        while running:
+            batch = [get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(get_nowait())
+                except queue.Empty:
+                    break
+            records = [_change_record(item) if type(item) is tuple else item
+                       for item in batch if item is not _STOP]
+            running = len(records) == len(batch)
+            if records:
+                try:
+                    self.sink.write(records)
+                except Exception:
+                    traceback.print_exc()
+
+    def stop(self) -> None:
+        self.queue.put(_STOP)
+        self.join()
+
+def _change_record(change: tuple) -> logging.LogRecord:
+    name, created, symbol, action, side, quantity, price = change
+    record = logging.LogRecord(name, logging.INFO, __file__, 0, CHANGE_FORMAT,
+                               (symbol, action.upper(), side, quantity, price), None)
+    record.created = created
+    record.msecs = (created - int(created)) * 1000
+    return record
+
+class _QueueHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.queue: Optional[queue.SimpleQueue] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.queue is not None:
+            self.queue.put(record)
+
+    def enqueue_change(self, change: tuple) -> None:
+        if self.queue is not None:
+            self.queue.put(change)
+
+_handler = _QueueHandler()
+_writer: Optional[_LogWriter] = None
+_writer_lock = threading.Lock()
+
+def configure_logging(sink=None, level: Optional[int] = None, batch_size: int = 1024) -> None:
+    global _writer
+    with _writer_lock:
+        if _writer is not None:
+            _writer.stop()
+        _writer = _LogWriter(sink if sink is not None else TextLogSink(), batch_size)
+        _writer.start()
+        _handler.queue = _writer.queue
+
+        logger = logging.getLogger(LOGGER_NAME)
+        if level is not None:
+            logger.setLevel(level)
+        elif logger.level == logging.NOTSET:
+            logger.setLevel(logging.INFO)
+        logger.propagate = False
+        if _handler not in logger.handlers:
+            logger.addHandler(_handler)
+
+def shutdown_logging() -> None:
+    global _writer
+    with _writer_lock:
+        if _writer is not None:
+            _handler.queue = None
+            _writer.stop()
+            _writer = None
+
+def _ensure_configured() -> None:
+    if _writer is None:
+        configure_logging()
+
+atexit.register(shutdown_logging)
+
 class OrderBookLogger:
     def __init__(self, symbol: str):
+        _ensure_configured()
         self.symbol = symbol
-        self.logger = logging.getLogger(f"orderbook.{symbol}")
-        self.logger.setLevel(logging.INFO)
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
+        self.logger = logging.getLogger(f"{LOGGER_NAME}.{symbol}")
+
+    def is_enabled(self) -> bool:
+        return self.logger.isEnabledFor(logging.INFO)
 
     def log_change(self, action: str, side: str, price: Decimal, quantity: int):
-        self.logger.info(f"{self.symbol} - {action.upper()}: {side} {quantity} @ {price}")
+        if self.logger.isEnabledFor(logging.INFO):
+            _handler.enqueue_change((self.logger.name, time.time(), self.symbol, action, side, quantity, price))
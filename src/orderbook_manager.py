@@ -1,20 +1,103 @@
-from typing import Dict, List, Tuple
+import os
+import threading
+from contextlib import ExitStack
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from .orderbook import Orderbook
 from .ticker import Ticker
 from .order import Order
+from .order_batch import OrderBatch, BatchFills
+from .update_publisher import UpdatePublisher
+from .checkpoint import write_checkpoint, read_checkpoint
+from .change_journal import DEFAULT_JOURNAL_CAPACITY
+from .event_journal import (EventJournal, JournalRecord, read_journal, order_entry, encode_order_id,
+                            OP_DEFINE, OP_LIMIT, OP_CANCEL, OP_MODIFY, FLAG_REPLACE)
+from .exceptions import VersionOutOfRangeException
 from decimal import Decimal
 
 class OrderBookManager:
-    def __init__(self):
+    def __init__(self, journal_capacity: Optional[int] = DEFAULT_JOURNAL_CAPACITY):
+        self.journal_capacity = journal_capacity
         self.order_books: Dict[str, Orderbook] = {}
         self.subscriptions: Dict[str, List[str]] = {}
         self.last_update: Dict[str, int] = {}
         self.default_order_book_levels = 10
+        self.journal: Optional[EventJournal] = None
+        self.publisher = UpdatePublisher()
+        self._lock = threading.Lock()
+        self._symbol_locks: Dict[str, threading.Lock] = {}
 
-    def create_order_book(self, symbol: str, tick_size: Decimal):
-        ticker = Ticker(symbol, tick_size)
-        self.order_books[symbol] = Orderbook(ticker)
-        self.last_update[symbol] = 0
+    def create_order_book(self, symbol: str, tick_size: Decimal, price_band: Tuple[Decimal, Decimal] = None):
+        ticker = Ticker(symbol, tick_size, price_band)
+        with self._lock, self._symbol_locks.setdefault(symbol, threading.Lock()):
+            replace = symbol in self.order_books
+            self.order_books[symbol] = Orderbook(ticker, journal_capacity=self.journal_capacity)
+            self.last_update[symbol] = 0
+            if self.journal is not None:
+                self.journal.define_symbol(ticker, replace)
+        self.publisher.publish(symbol)
+
+    def attach_journal(self, journal: EventJournal) -> None:
+        with self._lock:
+            for symbol, order_book in self.order_books.items():
+                if symbol not in journal.symbol_ids:
+                    journal.define_symbol(order_book.ticker)
+            self.journal = journal
+
+    @classmethod
+    def recover(cls, journal_path: str, checkpoint_path: Optional[str] = None, **journal_options) -> 'OrderBookManager':
+        manager = cls()
+        sequence = 0
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            sequence = manager.load_checkpoint(checkpoint_path)
+        if os.path.exists(journal_path):
+            sequence = manager.replay_journal(journal_path, sequence)
+        manager.attach_journal(EventJournal(journal_path, sequence=sequence, **journal_options))
+        return manager
+
+    def replay_journal(self, path: str, after_sequence: int = 0) -> int:
+        sequence = after_sequence
+        for record in read_journal(path):
+            if record.sequence > after_sequence or (record.op == OP_DEFINE and record.symbol not in self.order_books):
+                self.apply_record(record)
+            sequence = max(sequence, record.sequence)
+        for symbol, order_book in self.order_books.items():
+            self.last_update[symbol] = order_book.current_version
+        return sequence
+
+    def apply_record(self, record: JournalRecord) -> None:
+        op = record.op
+        if op == OP_DEFINE:
+            if record.symbol not in self.order_books or record.flags & FLAG_REPLACE:
+                self.order_books[record.symbol] = Orderbook(record.ticker, journal_capacity=self.journal_capacity)
+                self.last_update[record.symbol] = 0
+            return
+        order_book = self.order_books[record.symbol]
+        if op == OP_CANCEL:
+            order_book.cancel_order(record.order_id)
+        elif op == OP_MODIFY:
+            order_book.modify_order(record.order_id, record.quantity)
+        else:
+            is_limit = op == OP_LIMIT
+            order = Order(record.order_id, "limit" if is_limit else "market", record.side,
+                          order_book.ticker.to_price(record.tick) if is_limit else None, record.quantity, record.symbol)
+            if record.timestamp:
+                order.timestamp = record.timestamp
+            order_book.add_order(order)
+
+    def save_checkpoint(self, path: str, sequence: Optional[int] = None) -> None:
+        with self._lock, ExitStack() as stack:
+            for symbol in sorted(self.order_books):
+                stack.enter_context(self._symbol_locks.setdefault(symbol, threading.Lock()))
+            if sequence is None:
+                sequence = self.journal.sequence if self.journal is not None else 0
+            write_checkpoint(path, self.order_books, sequence)
+
+    def load_checkpoint(self, path: str) -> int:
+        order_books, sequence = read_checkpoint(path)
+        self.order_books.update(order_books)
+        for symbol, order_book in order_books.items():
+            self.last_update[symbol] = order_book.current_version
+        return sequence
 
     def get_order_book(self, symbol: str) -> Orderbook:
         return self.order_books.get(symbol)
@@ -28,13 +111,90 @@ class OrderBookManager:
         if symbol in self.subscriptions:
             self.subscriptions[symbol].remove(client_id)
 
-    def process_order(self, order: Order) -> Tuple[int, List, int]:
-        order_book = self.get_order_book(order.symbol)
-        if order_book:
+    def process_order(self, order: Order, durable: bool = True) -> Tuple[int, List, int]:
+        journal = self.journal
+        with self._write_lock(order.symbol):
+            order_book = self.get_order_book(order.symbol)
+            if not order_book:
+                return None, [], 0
+            entry = order_entry(order) if journal is not None else None
             order_id, filled_orders = order_book.add_order(order)
             version = order_book.current_version
-            return order_id, filled_orders, version
-        return None, [], 0
+            if journal is not None:
+                sequence = journal.append_order(order.symbol, entry, order.tick)
+        self.publisher.publish(order.symbol)
+        if journal is not None and durable:
+            journal.wait_durable(sequence)
+        return order_id, filled_orders, version
+
+    def cancel_order(self, symbol: str, order_id, durable: bool = True) -> int:
+        journal = self.journal
+        with self._write_lock(symbol):
+            order_book = self.order_books[symbol]
+            order_key = encode_order_id(order_id) if journal is not None else None
+            order_book.cancel_order(order_id)
+            version = order_book.current_version
+            if journal is not None:
+                sequence = journal.append(symbol, OP_CANCEL, order_key)
+        self.publisher.publish(symbol)
+        if journal is not None and durable:
+            journal.wait_durable(sequence)
+        return version
+
+    def modify_order(self, symbol: str, order_id, new_quantity: int, durable: bool = True) -> int:
+        journal = self.journal
+        with self._write_lock(symbol):
+            order_book = self.order_books[symbol]
+            order_key = encode_order_id(order_id) if journal is not None else None
+            order_book.modify_order(order_id, new_quantity)
+            version = order_book.current_version
+            if journal is not None:
+                sequence = journal.append(symbol, OP_MODIFY, order_key, quantity=int(new_quantity))
+        self.publisher.publish(symbol)
+        if journal is not None and durable:
+            journal.wait_durable(sequence)
+        return version
+
+    def process_orders(self, batch: Union[Sequence[Order], OrderBatch], symbol: Optional[str] = None,
+                       durable: bool = True) -> Dict[str, Tuple[BatchFills, int]]:
+        if symbol is not None:
+            batches = {symbol: batch}
+        else:
+            batches = {}
+            for order in batch:
+                batches.setdefault(order.symbol, []).append(order)
+
+        results = {}
+        journal = self.journal
+        sequence = 0
+        for book_symbol, book_batch in batches.items():
+            with self._write_lock(book_symbol):
+                order_book = self.get_order_book(book_symbol)
+                if order_book:
+                    if journal is not None:
+                        if isinstance(book_batch, OrderBatch):
+                            book_batch = book_batch.to_orders(order_book.ticker)
+                        entries = [order_entry(order) for order in book_batch]
+                    results[book_symbol] = (order_book.add_orders(book_batch), order_book.current_version)
+                    if journal is not None:
+                        sequence = journal.append_orders(book_symbol, entries, [order.tick for order in book_batch])
+        for book_symbol in results:
+            self.publisher.publish(book_symbol)
+        if sequence and durable:
+            journal.wait_durable(sequence)
+        return results
+
+    def wait_durable(self) -> None:
+        journal = self.journal
+        if journal is not None:
+            journal.wait_durable(journal.sequence)
+
+    def _write_lock(self, symbol: str) -> threading.Lock:
+        lock = self._symbol_locks.get(symbol)
+        if lock is None:
+            with self._lock:
+                lock = self._symbol_locks.setdefault(symbol, threading.Lock())
+        return lock
 
     def get_order_book_snapshot(self, symbol: str, levels: int = None) -> Tuple[Dict, int]:
         order_book = self.get_order_book(symbol)
@@ -46,11 +206,33 @@ class OrderBookManager:
             return snapshot, version
         return None, 0
 
+    def get_tick_snapshot(self, symbol: str, levels: int = None) -> Tuple[Dict, int]:
+        order_book = self.get_order_book(symbol)
+        if order_book:
+            return order_book.get_tick_snapshot(levels if levels is not None else self.default_order_book_levels), order_book.current_version
+        return None, 0
+
+    def get_change_records_since(self, symbol: str, version: int) -> Tuple[List, int]:
+        order_book = self.get_order_book(symbol)
+        if order_book:
+            return order_book.get_change_records_since(version), order_book.current_version
+        return [], 0
+
+    def get_updates_since(self, symbol: str, version: int) -> Tuple[List, int]:
+        order_book = self.get_order_book(symbol)
+        if order_book:
+            return order_book.get_updates_since(version), order_book.current_version
+        return [], 0
+
     def get_order_book_update(self, symbol: str) -> Tuple[List, int]:
         order_book = self.get_order_book(symbol)
         if order_book:
             current_version = order_book.current_version
-            updates = order_book.get_updates_since(self.last_update.get(symbol, 0))
+            try:
+                updates = order_book.get_updates_since(self.last_update.get(symbol, 0))
+            except VersionOutOfRangeException:
+                self.last_update[symbol] = current_version
+                raise
             if updates:
                 self.last_update[symbol] = current_version
             return updates, current_version
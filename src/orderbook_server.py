@@ -1,44 +1,173 @@
 import grpc
 from concurrent import futures
-import time
 import json
+import queue
+import threading
 from .orderbook_service_pb2 import OrderBookUpdate, PriceLevel, OrderResponse, PriceLevelUpdate, Side, Action
-from .orderbook_service_pb2_grpc import OrderBookServiceServicer, add_OrderBookServiceServicer_to_server
+from .orderbook_service_pb2_grpc import OrderBookServiceServicer
+from . import orderbook_service_pb2
+from . import orderbook_service_v2_pb2 as pb2_v2
 from .orderbook_manager import OrderBookManager
+from .execution_lane import ExecutionLane
+from .update_publisher import Subscription
+from .update_cache import EncodedUpdateCache, DEFAULT_UPDATE_CACHE_SIZE
 from .order import Order
+from .exceptions import (VersionOutOfRangeException, InvalidOrderException, InsufficientLiquidityException,
+                         OrderNotFoundException, InvalidTickSizeException, InvalidQuantityException)
 from decimal import Decimal
 
 class OrderBookServer(OrderBookServiceServicer):
-    def __init__(self):
-        self.order_book_manager = OrderBookManager()
-        with open('src/config.json') as config_file:
-            config = json.load(config_file)
+    encode_updates = False
+
+    def __init__(self, config=None, lanes=True):
+        if config is None:
+            config = load_config()
+        journal = config.get('journal')
+        if journal:
+            self.order_book_manager = OrderBookManager.recover(
+                journal['path'], journal.get('checkpoint'),
+                sync=journal.get('sync', 'fsync'), commit_delay=journal.get('commit_delay', 0.0))
+        else:
+            self.order_book_manager = OrderBookManager()
         for symbol, details in config['instruments'].items():
-            self.order_book_manager.create_order_book(symbol, Decimal(details['tick_size']))
+            if symbol not in self.order_book_manager.order_books:
+                self.order_book_manager.create_order_book(symbol, Decimal(details['tick_size']), details.get('price_band'))
+        self.lanes = {symbol: ExecutionLane(symbol) for symbol in self.order_book_manager.order_books} if lanes else {}
+        self.update_cache = EncodedUpdateCache(config.get('update_cache_size', DEFAULT_UPDATE_CACHE_SIZE))
+
+    def close(self):
+        for lane in self.lanes.values():
+            lane.close()
+
+    def _on_lane(self, symbol, function, *args):
+        lane = self.lanes.get(symbol)
+        if lane is None:
+            return function(*args)
+        return lane.call(function, *args)
 
     def SubscribeOrderBook(self, request_iterator, context):
-        subscribed_symbols = set()
+        subscription = Subscription()
+        if context is not None:
+            context.add_callback(subscription.close)
+        reader = threading.Thread(target=self._read_requests, args=(request_iterator, subscription),
+                                  name="subscription-reader", daemon=True)
+        reader.start()
+        cursors = {}
+        requests_open = True
+        try:
+            while not subscription.closed and (requests_open or cursors):
+                requests, symbols = subscription.wait()
+                for request in requests:
+                    if request is None:
+                        requests_open = False
+                    else:
+                        response = self._handle_subscription_request(request, subscription, cursors)
+                        if response is not None:
+                            yield response
+                for symbol in symbols:
+                    response = self._next_update(symbol, cursors)
+                    if response is not None:
+                        yield response
+        finally:
+            self._end_subscription(subscription, cursors)
+
+    def _handle_subscription_request(self, request, subscription, cursors):
+        publisher = self.order_book_manager.publisher
+        if request.subscribe:
+            publisher.subscribe(request.symbol, subscription)
+            response, cursors[request.symbol] = self._snapshot_response(request.symbol)
+            return response
+        if request.symbol in cursors:
+            publisher.unsubscribe(request.symbol, subscription)
+            del cursors[request.symbol]
+            update = self._create_empty_update(request.symbol)
+            return update.SerializeToString() if self.encode_updates else update
+        return None
+
+    def _next_update(self, symbol, cursors):
+        cursor = cursors.get(symbol)
+        if cursor is None:
+            return None
+        if self.encode_updates:
+            return self._next_encoded_update(symbol, cursors, cursor)
+        try:
+            updates, version = self._updates_since(symbol, cursor)
+        except VersionOutOfRangeException:
+            updates, version = None, -1
+        if updates is None or version < cursor:
+            response, cursors[symbol] = self._snapshot_response(symbol)
+            return response
+        if updates:
+            cursors[symbol] = version
+            return self._create_incremental_update(symbol, updates, version)
+        return None
+
+    def _next_encoded_update(self, symbol, cursors, cursor):
+        order_book = self.order_book_manager.get_order_book(symbol)
+        if order_book is None:
+            return None
+        version = order_book.current_version
+        if version == cursor:
+            return None
+        data = None
+        if version > cursor:
+            try:
+                data = self.update_cache.get_or_put(('delta', symbol, order_book.generation, cursor, version),
+                                                    lambda: self._encode_delta(symbol, cursor, version))
+            except VersionOutOfRangeException:
+                pass
+        if data is None:
+            data, version = self._snapshot_response(symbol)
+        cursors[symbol] = version
+        return data
+
+    def _encode_delta(self, symbol, cursor, version):
+        updates, _ = self._updates_since(symbol, cursor)
+        updates = [update for update in updates if self._update_version(update) <= version]
+        return self._create_incremental_update(symbol, updates, version).SerializeToString()
+
+    @staticmethod
+    def _update_version(update):
+        return update['version']
+
+    def _snapshot_response(self, symbol):
+        order_book = self.order_book_manager.get_order_book(symbol)
+        if self.encode_updates and order_book is not None:
+            version = order_book.current_version
+            data = self.update_cache.get(('snapshot', symbol, order_book.generation, version))
+            if data is not None:
+                return data, version
+        snapshot = self._create_snapshot(symbol)
+        if self.encode_updates:
+            return self.update_cache.put(('snapshot', symbol, order_book.generation, snapshot.version), snapshot.SerializeToString()), snapshot.version
+        return snapshot, snapshot.version
+
+    def _updates_since(self, symbol, cursor):
+        return self._on_lane(symbol, self.order_book_manager.get_updates_since, symbol, cursor)
+
+    def _end_subscription(self, subscription, cursors):
+        for symbol in cursors:
+            self.order_book_manager.publisher.unsubscribe(symbol, subscription)
+        cursors.clear()
+        subscription.close()
+
+    def _read_requests(self, request_iterator, subscription):
         try:
             for request in request_iterator:
-                if request.subscribe:
-                    subscribed_symbols.add(request.symbol)
-                    yield self._create_snapshot(request.symbol)
-                else:
-                    subscribed_symbols.remove(request.symbol)
-                    yield self._create_empty_update(request.symbol)
-
-                while subscribed_symbols:
-                    for symbol in subscribed_symbols:
-                        update, version = self.order_book_manager.get_order_book_update(symbol)
-                        if update:
-                            yield self._create_incremental_update(symbol, update, version)
-                    time.sleep(0.1)  # Adjust the sleep time as needed
+                subscription.post(request)
         except grpc.RpcError:
-            for symbol in subscribed_symbols:
-                self.order_book_manager.unsubscribe(symbol, context.peer())
+            subscription.close()
+        finally:
+            subscription.post(None)
 
     def PlaceOrder(self, request, context):
-        order = Order(
+        order = self._order_from_request(request)
+        order_id, _, _ = self._on_lane(order.symbol, self.order_book_manager.process_order, order, False)
+        self.order_book_manager.wait_durable()
+        return OrderResponse(order_id=str(order_id), status="PLACED")
+
+    def _order_from_request(self, request):
+        return Order(
             request.order_id,
             request.type,
             request.side,
@@ -46,11 +175,9 @@ class OrderBookServer(OrderBookServiceServicer):
             request.quantity,
             request.symbol
         )
-        order_id, _, _ = self.order_book_manager.process_order(order)
-        return OrderResponse(order_id=str(order_id), status="PLACED")
 
     def _create_snapshot(self, symbol):
-        snapshot, version = self.order_book_manager.get_order_book_snapshot(symbol)
+        snapshot, version = self._on_lane(symbol, self.order_book_manager.get_order_book_snapshot, symbol)
         return OrderBookUpdate(
             symbol=symbol,
             bids=[PriceLevel(price=str(price), quantity=quantity) for price, quantity in snapshot['bids']],
@@ -78,15 +205,212 @@ class OrderBookServer(OrderBookServiceServicer):
     def _create_empty_update(self, symbol):
         return OrderBookUpdate(symbol=symbol, is_snapshot=True, version=0)
 
+V2_SIDES = {pb2_v2.BUY: "buy", pb2_v2.SELL: "sell"}
+V2_ORDER_TYPES = {pb2_v2.LIMIT: "limit", pb2_v2.MARKET: "market"}
+V2_SIDE_CODES = {"buy": pb2_v2.BUY, "sell": pb2_v2.SELL}
+V2_ACTION_CODES = {"add": pb2_v2.ADD, "update": pb2_v2.UPDATE, "delete": pb2_v2.DELETE}
+
+UNKNOWN_ORDER_ID = -1
+
+REJECTIONS = (InvalidOrderException, InsufficientLiquidityException, OrderNotFoundException, InvalidTickSizeException,
+              InvalidQuantityException)
+
+class OrderBookServerV2(OrderBookServer):
+    def __init__(self, config=None, lanes=True, server=None):
+        if server is None:
+            super().__init__(config, lanes)
+        else:
+            self.order_book_manager = server.order_book_manager
+            self.lanes = server.lanes
+            self.update_cache = EncodedUpdateCache(server.update_cache.capacity)
+
+    def ListInstruments(self, request, context):
+        return pb2_v2.InstrumentsResponse(instruments=[
+            pb2_v2.Instrument(symbol=symbol, tick_size=str(order_book.ticker.tick_size))
+            for symbol, order_book in self.order_book_manager.order_books.items()
+        ])
+
+    def PlaceOrder(self, request, context):
+        try:
+            order = self._order_from_request(request)
+            order_id, _, _ = self._on_lane(order.symbol, self.order_book_manager.process_order, order, False)
+        except REJECTIONS:
+            order_id = None
+        if order_id is None:
+            return pb2_v2.OrderResponse(order_id=request.order_id, status=pb2_v2.REJECTED)
+        self.order_book_manager.wait_durable()
+        return pb2_v2.OrderResponse(order_id=order_id, status=pb2_v2.PLACED)
+
+    def OrderEntry(self, request_iterator, context):
+        batches = queue.SimpleQueue()
+        reader = threading.Thread(target=self._read_order_requests, args=(request_iterator, batches),
+                                  name="order-entry-reader", daemon=True)
+        reader.start()
+        requests_open = True
+        while requests_open:
+            by_symbol = {}
+            batch = batches.get()
+            while True:
+                if batch is None:
+                    requests_open = False
+                    break
+                for request in batch.requests:
+                    by_symbol.setdefault(request.symbol, []).append(request)
+                try:
+                    batch = batches.get_nowait()
+                except queue.Empty:
+                    break
+            if not by_symbol:
+                continue
+            pending = [self._submit_requests(symbol, requests) for symbol, requests in by_symbol.items()]
+            reports = [report for future in pending for report in future.result()]
+            self.order_book_manager.wait_durable()
+            yield pb2_v2.ExecutionReports(reports=reports)
+
+    def _read_order_requests(self, request_iterator, batches):
+        try:
+            for batch in request_iterator:
+                batches.put(batch)
+        except grpc.RpcError:
+            pass
+        finally:
+            batches.put(None)
+
+    def _submit_requests(self, symbol, requests):
+        lane = self.lanes.get(symbol)
+        if lane is None:
+            future = futures.Future()
+            future.set_result(self._execute_requests(requests))
+            return future
+        return lane.submit(self._execute_requests, requests)
+
+    def _execute_requests(self, requests):
+        return [self._execute_request(request) for request in requests]
+
+    def _execute_request(self, request):
+        manager = self.order_book_manager
+        report = pb2_v2.ExecutionReport(client_sequence=request.client_sequence, order_id=request.order_id)
+        try:
+            order_book = manager.get_order_book(request.symbol)
+            if order_book is None:
+                raise InvalidOrderException(f"Unknown symbol {request.symbol}")
+            if request.request_type == pb2_v2.NEW_ORDER:
+                _, fills, report.version = manager.process_order(self._order_from_request(request), False)
+                if fills:
+                    to_ticks = order_book.ticker.to_ticks
+                    report.fill_order_ids.extend(_v2_order_id(order_id) for order_id, _, _ in fills)
+                    report.fill_quantities.extend(quantity for _, quantity, _ in fills)
+                    report.fill_ticks.extend(to_ticks(price) for _, _, price in fills)
+                report.status = pb2_v2.PLACED
+            elif request.request_type == pb2_v2.CANCEL_ORDER:
+                report.version = manager.cancel_order(request.symbol, request.order_id, False)
+                report.status = pb2_v2.CANCELLED
+            elif request.request_type == pb2_v2.MODIFY_ORDER:
+                report.version = manager.modify_order(request.symbol, request.order_id, request.quantity, False)
+                report.status = pb2_v2.MODIFIED
+            else:
+                raise InvalidOrderException(f"Invalid request type {request.request_type}")
+        except REJECTIONS as error:
+            report.status = pb2_v2.REJECTED
+            report.reason = str(error)
+        return report
+
+    def _order_from_request(self, request):
+        order_type, side = V2_ORDER_TYPES.get(request.type), V2_SIDES.get(request.side)
+        if order_type is None:
+            raise InvalidOrderException(f"Invalid order type {request.type}")
+        if side is None:
+            raise InvalidOrderException(f"Invalid side {request.side}")
+        order_book = self.order_book_manager.get_order_book(request.symbol)
+        is_limit = request.type == pb2_v2.LIMIT
+        return Order(
+            request.order_id,
+            order_type,
+            side,
+            order_book.ticker.to_price(request.price_ticks) if is_limit and order_book else None,
+            request.quantity,
+            request.symbol
+        )
+
+    def _updates_since(self, symbol, cursor):
+        return self._on_lane(symbol, self.order_book_manager.get_change_records_since, symbol, cursor)
+
+    @staticmethod
+    def _update_version(record):
+        return record[0]
+
+    def _create_snapshot(self, symbol):
+        snapshot, version = self._on_lane(symbol, self.order_book_manager.get_tick_snapshot, symbol)
+        bids, asks = snapshot['bids'], snapshot['asks']
+        return pb2_v2.OrderBookUpdate(
+            symbol=symbol,
+            version=version,
+            is_snapshot=True,
+            tick_size=str(self.order_book_manager.order_books[symbol].ticker.tick_size),
+            bid_ticks=[tick for tick, _ in bids],
+            bid_quantities=[quantity for _, quantity in bids],
+            ask_ticks=[tick for tick, _ in asks],
+            ask_quantities=[quantity for _, quantity in asks]
+        )
+
+    def _create_incremental_update(self, symbol, records, version):
+        return pb2_v2.OrderBookUpdate(
+            symbol=symbol,
+            version=version,
+            change_sides=[V2_SIDE_CODES[side] for _, _, side, _, _ in records],
+            change_actions=[V2_ACTION_CODES[action] for _, action, _, _, _ in records],
+            change_ticks=[tick for _, _, _, tick, _ in records],
+            change_quantities=[quantity for _, _, _, _, quantity in records]
+        )
+
+    def _create_empty_update(self, symbol):
+        return pb2_v2.OrderBookUpdate(symbol=symbol, is_snapshot=True, version=0)
+
+def _v2_order_id(order_id):
+    try:
+        return int(order_id)
+    except (TypeError, ValueError):
+        return UNKNOWN_ORDER_ID
+
+RPC_HANDLERS = {
+    (False, False): grpc.unary_unary_rpc_method_handler,
+    (False, True): grpc.unary_stream_rpc_method_handler,
+    (True, False): grpc.stream_unary_rpc_method_handler,
+    (True, True): grpc.stream_stream_rpc_method_handler,
+}
+
+def add_servicer_to_server(servicer, server, messages=orderbook_service_pb2):
+    service = messages.DESCRIPTOR.services_by_name['OrderBookService']
+    handlers = {}
+    for method in service.methods:
+        if method.name == 'SubscribeOrderBook':
+            serialize = lambda data: data
+        else:
+            serialize = getattr(messages, method.output_type.name).SerializeToString
+        handlers[method.name] = RPC_HANDLERS[method.client_streaming, method.server_streaming](
+            getattr(servicer, method.name),
+            request_deserializer=getattr(messages, method.input_type.name).FromString,
+            response_serializer=serialize)
+    servicer.encode_updates = True
+    server.add_generic_rpc_handlers((grpc.method_handlers_generic_handler(service.full_name, handlers),))
+
+def load_config(path='src/config.json'):
+    with open(path) as config_file:
+        return json.load(config_file)
+
 def serve():
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    add_OrderBookServiceServicer_to_server(OrderBookServer(), server)
-    with open('src/config.json') as config_file:
-        config = json.load(config_file)
+    config = load_config()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=config.get('max_workers', 64)))
+    servicer = OrderBookServer(config)
+    add_servicer_to_server(servicer, server)
+    add_servicer_to_server(OrderBookServerV2(server=servicer), server, pb2_v2)
     server.add_insecure_port(f'[::]:{config["server_port"]}')
     server.start()
     print(f"Server started on port {config['server_port']}")
-    server.wait_for_termination()
+    try:
+        server.wait_for_termination()
+    finally:
+        servicer.close()
 
 if __name__ == '__main__':
-    serve()
\ No newline at end of file
+    serve()
@@ -3,7 +3,7 @@
 import grpc
 import warnings
 
-import orderbook_service_pb2 as orderbook__service__pb2
+from . import orderbook_service_pb2 as orderbook__service__pb2
 
 GRPC_GENERATED_VERSION = '1.66.2'
 GRPC_VERSION = grpc.__version__
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: orderbook_service_v2.proto
+# Protobuf Python Version: 5.27.2
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    27,
+    2,
+    '',
+    'orderbook_service_v2.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1aorderbook_service_v2.proto\x12\x0corderbook.v2\"/\n\nInstrument\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x11\n\ttick_size\x18\x02 \x01(\t\"\x14\n\x12InstrumentsRequest\"D\n\x13InstrumentsResponse\x12-\n\x0binstruments\x18\x01 \x03(\x0b\x32\x18.orderbook.v2.Instrument\"8\n\x13SubscriptionRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x11\n\tsubscribe\x18\x02 \x01(\x08\"\xb9\x02\n\x0fOrderBookUpdate\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\x03\x12\x13\n\x0bis_snapshot\x18\x03 \x01(\x08\x12\x11\n\ttick_size\x18\x04 \x01(\t\x12\x11\n\tbid_ticks\x18\x05 \x03(\x03\x12\x16\n\x0e\x62id_quantities\x18\x06 \x03(\x03\x12\x11\n\task_ticks\x18\x07 \x03(\x03\x12\x16\n\x0e\x61sk_quantities\x18\x08 \x03(\x03\x12(\n\x0c\x63hange_sides\x18\t \x03(\x0e\x32\x12.orderbook.v2.Side\x12,\n\x0e\x63hange_actions\x18\n \x03(\x0e\x32\x14.orderbook.v2.Action\x12\x14\n\x0c\x63hange_ticks\x18\x0b \x03(\x03\x12\x19\n\x11\x63hange_quantities\x18\x0c \x03(\x03\"\x99\x01\n\x05Order\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x10\n\x08order_id\x18\x02 \x01(\x03\x12 \n\x04side\x18\x03 \x01(\x0e\x32\x12.orderbook.v2.Side\x12%\n\x04type\x18\x04 \x01(\x0e\x32\x17.orderbook.v2.OrderType\x12\x13\n\x0bprice_ticks\x18\x05 \x01(\x03\x12\x10\n\x08quantity\x18\x06 \x01(\x03\"L\n\rOrderResponse\x12\x10\n\x08order_id\x18\x01 \x01(\x03\x12)\n\x06status\x18\x02 \x01(\x0e\x32\x19.orderbook.v2.OrderStatus\"\xea\x01\n\x0cOrderRequest\x12\x17\n\x0f\x63lient_sequence\x18\x01 \x01(\x04\x12/\n\x0crequest_type\x18\x02 \x01(\x0e\x32\x19.orderbook.v2.RequestType\x12\x0e\n\x06symbol\x18\x03 \x01(\t\x12\x10\n\x08order_id\x18\x04 \x01(\x03\x12 \n\x04side\x18\x05 \x01(\x0e\x32\x12.orderbook.v2.Side\x12%\n\x04type\x18\x06 \x01(\x0e\x32\x17.orderbook.v2.OrderType\x12\x13\n\x0bprice_ticks\x18\x07 \x01(\x03\x12\x10\n\x08quantity\x18\x08 \x01(\x03\"=\n\rOrderRequests\x12,\n\x08requests\x18\x01 \x03(\x0b\x32\x1a.orderbook.v2.OrderRequest\"\xcd\x01\n\x0f\x45xecutionReport\x12\x17\n\x0f\x63lient_sequence\x18\x01 \x01(\x04\x12\x10\n\x08order_id\x18\x02 \x01(\x03\x12)\n\x06status\x18\x03 \x01(\x0e\x32\x19.orderbook.v2.OrderStatus\x12\x0f\n\x07version\x18\x04 \x01(\x03\x12\x16\n\x0e\x66ill_order_ids\x18\x05 \x03(\x03\x12\x17\n\x0f\x66ill_quantities\x18\x06 \x03(\x03\x12\x12\n\nfill_ticks\x18\x07 \x03(\x03\x12\x0e\n\x06reason\x18\x08 \x01(\t\"B\n\x10\x45xecutionReports\x12.\n\x07reports\x18\x01 \x03(\x0b\x32\x1d.orderbook.v2.ExecutionReport*/\n\x04Side\x12\x14\n\x10SIDE_UNSPECIFIED\x10\x00\x12\x07\n\x03\x42UY\x10\x01\x12\x08\n\x04SELL\x10\x02*>\n\tOrderType\x12\x1a\n\x16ORDER_TYPE_UNSPECIFIED\x10\x00\x12\t\n\x05LIMIT\x10\x01\x12\n\n\x06MARKET\x10\x02*A\n\x06\x41\x63tion\x12\x16\n\x12\x41\x43TION_UNSPECIFIED\x10\x00\x12\x07\n\x03\x41\x44\x44\x10\x01\x12\n\n\x06UPDATE\x10\x02\x12\n\n\x06\x44\x45LETE\x10\x03*b\n\x0bOrderStatus\x12\x1c\n\x18ORDER_STATUS_UNSPECIFIED\x10\x00\x12\n\n\x06PLACED\x10\x01\x12\x0c\n\x08REJECTED\x10\x02\x12\r\n\tCANCELLED\x10\x03\x12\x0c\n\x08MODIFIED\x10\x04*^\n\x0bRequestType\x12\x1c\n\x18REQUEST_TYPE_UNSPECIFIED\x10\x00\x12\r\n\tNEW_ORDER\x10\x01\x12\x10\n\x0c\x43\x41NCEL_ORDER\x10\x02\x12\x10\n\x0cMODIFY_ORDER\x10\x03\x32\xdd\x02\n\x10OrderBookService\x12X\n\x0fListInstruments\x12 .orderbook.v2.InstrumentsRequest\x1a!.orderbook.v2.InstrumentsResponse\"\x00\x12\\\n\x12SubscribeOrderBook\x12!.orderbook.v2.SubscriptionRequest\x1a\x1d.orderbook.v2.OrderBookUpdate\"\x00(\x01\x30\x01\x12@\n\nPlaceOrder\x12\x13.orderbook.v2.Order\x1a\x1b.orderbook.v2.OrderResponse\"\x00\x12O\n\nOrderEntry\x12\x1b.orderbook.v2.OrderRequests\x1a\x1e.orderbook.v2.ExecutionReports\"\x00(\x01\x30\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'orderbook_service_v2_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_SIDE']._serialized_start=1369
+  _globals['_SIDE']._serialized_end=1416
+  _globals['_ORDERTYPE']._serialized_start=1418
+  _globals['_ORDERTYPE']._serialized_end=1480
+  _globals['_ACTION']._serialized_start=1482
+  _globals['_ACTION']._serialized_end=1547
+  _globals['_ORDERSTATUS']._serialized_start=1549
+  _globals['_ORDERSTATUS']._serialized_end=1647
+  _globals['_REQUESTTYPE']._serialized_start=1649
+  _globals['_REQUESTTYPE']._serialized_end=1743
+  _globals['_INSTRUMENT']._serialized_start=44
+  _globals['_INSTRUMENT']._serialized_end=91
+  _globals['_INSTRUMENTSREQUEST']._serialized_start=93
+  _globals['_INSTRUMENTSREQUEST']._serialized_end=113
+  _globals['_INSTRUMENTSRESPONSE']._serialized_start=115
+  _globals['_INSTRUMENTSRESPONSE']._serialized_end=183
+  _globals['_SUBSCRIPTIONREQUEST']._serialized_start=185
+  _globals['_SUBSCRIPTIONREQUEST']._serialized_end=241
+  _globals['_ORDERBOOKUPDATE']._serialized_start=244
+  _globals['_ORDERBOOKUPDATE']._serialized_end=557
+  _globals['_ORDER']._serialized_start=560
+  _globals['_ORDER']._serialized_end=713
+  _globals['_ORDERRESPONSE']._serialized_start=715
+  _globals['_ORDERRESPONSE']._serialized_end=791
+  _globals['_ORDERREQUEST']._serialized_start=794
+  _globals['_ORDERREQUEST']._serialized_end=1028
+  _globals['_ORDERREQUESTS']._serialized_start=1030
+  _globals['_ORDERREQUESTS']._serialized_end=1091
+  _globals['_EXECUTIONREPORT']._serialized_start=1094
+  _globals['_EXECUTIONREPORT']._serialized_end=1299
+  _globals['_EXECUTIONREPORTS']._serialized_start=1301
+  _globals['_EXECUTIONREPORTS']._serialized_end=1367
+  _globals['_ORDERBOOKSERVICE']._serialized_start=1746
+  _globals['_ORDERBOOKSERVICE']._serialized_end=2095
+# @@protoc_insertion_point(module_scope)
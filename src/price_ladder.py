@@ -0,0 +1,148 @@
+from typing import Callable, List, Optional
+from .price_level import PriceLevel, PriceLevelTree
+
+class PriceLadder:
+    def __init__(self, low: int, high: int, level_class: type = PriceLevel):
+        if high < low:
+            raise ValueError("Price band high must not be below low")
+        self._low = low
+        self._high = high
+        size = high - low + 1
+        self._levels: List[PriceLevel] = [level_class(low + i) for i in range(size)]
+        self._active = bytearray(size)
+        self._active_count = 0
+        self._lowest_index = -1
+        self._highest_index = -1
+        self._below = PriceLevelTree(level_class)
+        self._above = PriceLevelTree(level_class)
+
+    def __len__(self) -> int:
+        return self._active_count + len(self._below) + len(self._above)
+
+    @property
+    def band(self):
+        return self._low, self._high
+
+    def insert(self, level: PriceLevel) -> None:
+        price = level.price
+        if price < self._low:
+            self._below.insert(level)
+        elif price > self._high:
+            self._above.insert(level)
+        else:
+            index = price - self._low
+            self._levels[index] = level
+            self._activate(index)
+
+    def find_or_create(self, price: int) -> PriceLevel:
+        if price < self._low:
+            return self._below.find_or_create(price)
+        if price > self._high:
+            return self._above.find_or_create(price)
+        index = price - self._low
+        if not self._active[index]:
+            self._activate(index)
+        return self._levels[index]
+
+    def delete(self, price: int) -> None:
+        if price < self._low:
+            self._below.delete(price)
+            return
+        if price > self._high:
+            self._above.delete(price)
+            return
+
+        index = price - self._low
+        if not self._active[index]:
+            return
+        self._active[index] = 0
+        self._active_count -= 1
+        if index == self._lowest_index:
+            self._lowest_index = self._active.find(1, index + 1)
+        if index == self._highest_index:
+            self._highest_index = self._active.rfind(1, 0, index)
+
+    def find(self, price: int) -> Optional[PriceLevel]:
+        if price < self._low:
+            return self._below.find(price)
+        if price > self._high:
+            return self._above.find(price)
+        index = price - self._low
+        return self._levels[index] if self._active[index] else None
+
+    def min(self) -> Optional[PriceLevel]:
+        level = self._below.min()
+        if level:
+            return level
+        if self._lowest_index != -1:
+            return self._levels[self._lowest_index]
+        return self._above.min()
+
+    def max(self) -> Optional[PriceLevel]:
+        level = self._above.max()
+        if level:
+            return level
+        if self._highest_index != -1:
+            return self._levels[self._highest_index]
+        return self._below.max()
+
+    def next_level(self, level: PriceLevel) -> Optional[PriceLevel]:
+        price = level.price
+        if price > self._high:
+            return self._above.next_level(level)
+        if price < self._low:
+            next_level = self._below.next_level(level)
+            if next_level:
+                return next_level
+            index = self._lowest_index
+        else:
+            index = self._active.find(1, price - self._low + 1)
+        if index != -1:
+            return self._levels[index]
+        return self._above.min()
+
+    def previous_level(self, level: PriceLevel) -> Optional[PriceLevel]:
+        price = level.price
+        if price < self._low:
+            return self._below.previous_level(level)
+        if price > self._high:
+            previous_level = self._above.previous_level(level)
+            if previous_level:
+                return previous_level
+            index = self._highest_index
+        else:
+            index = self._active.rfind(1, 0, price - self._low)
+        if index != -1:
+            return self._levels[index]
+        return self._below.max()
+
+    def load_sorted(self, levels: List[PriceLevel]) -> None:
+        self._below.load_sorted([level for level in levels if level.price < self._low])
+        self._above.load_sorted([level for level in levels if level.price > self._high])
+        for level in levels:
+            if self._low <= level.price <= self._high:
+                self.insert(level)
+
+    def clone(self, copy_level: Callable[[PriceLevel], PriceLevel]) -> 'PriceLadder':
+        ladder = PriceLadder.__new__(PriceLadder)
+        ladder._low = self._low
+        ladder._high = self._high
+        level_class = self._below.level_class
+        active = self._active
+        ladder._levels = [copy_level(level) if active[index] else level_class(level.price)
+                          for index, level in enumerate(self._levels)]
+        ladder._active = bytearray(active)
+        ladder._active_count = self._active_count
+        ladder._lowest_index = self._lowest_index
+        ladder._highest_index = self._highest_index
+        ladder._below = self._below.clone(copy_level)
+        ladder._above = self._above.clone(copy_level)
+        return ladder
+
+    def _activate(self, index: int) -> None:
+        self._active[index] = 1
+        self._active_count += 1
+        if self._lowest_index == -1 or index < self._lowest_index:
+            self._lowest_index = index
+        if self._highest_index == -1 or index > self._highest_index:
+            self._highest_index = index
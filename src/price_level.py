@@ -1,10 +1,12 @@
-from typing import Optional
-from decimal import Decimal
+from typing import Callable, Dict, List, Optional
 from .order import Order
 
 class PriceLevel:
-    def __init__(self, price: Decimal):
-        self._price = Decimal(str(price))
+    __slots__ = ('_price', '_total_volume', '_order_count', '_head_order', '_tail_order',
+                 'parent', 'left_child', 'right_child', 'is_red')
+
+    def __init__(self, price: int):
+        self._price = price
         self._total_volume = 0
         self._order_count = 0
         self._head_order: Optional[Order] = None
@@ -12,9 +14,10 @@ class PriceLevel:
         self.parent: Optional['PriceLevel'] = None
         self.left_child: Optional['PriceLevel'] = None
         self.right_child: Optional['PriceLevel'] = None
+        self.is_red: bool = False
 
     @property
-    def price(self) -> Decimal:
+    def price(self) -> int:
         return self._price
 
     @property
@@ -62,11 +65,68 @@ class PriceLevel:
     def update_volume(self, old_quantity: int, new_quantity: int) -> None:
         self._total_volume += new_quantity - old_quantity
 
+    def load_orders(self, orders: List[Order]) -> None:
+        previous = self._tail_order
+        volume = 0
+        for order in orders:
+            order.parent_level = self
+            order.prev_order = previous
+            if previous is None:
+                self._head_order = order
+            else:
+                previous.next_order = order
+            previous = order
+            volume += order.quantity
+        self._tail_order = previous
+        self._total_volume += volume
+        self._order_count += len(orders)
+
+    def copy(self, orders: Dict) -> 'PriceLevel':
+        level = type(self)(self._price)
+        previous = None
+        order = self._head_order
+        while order:
+            order_copy = order.copy()
+            order_copy.parent_level = level
+            if previous is None:
+                level._head_order = order_copy
+            else:
+                previous.next_order = order_copy
+                order_copy.prev_order = previous
+            orders[order_copy.id] = order_copy
+            previous = order_copy
+            order = order.next_order
+        level._tail_order = previous
+        level._total_volume = self._total_volume
+        level._order_count = self._order_count
+        return level
+
+    def detach_orders(self) -> List[Order]:
+        orders = []
+        order = self._head_order
+        while order:
+            orders.append(order)
+            next_order = order.next_order
+            order.parent_level = None
+            order.prev_order = None
+            order.next_order = None
+            order = next_order
+        self._head_order = self._tail_order = None
+        self._total_volume = 0
+        self._order_count = 0
+        return orders
+
+
 class PriceLevelTree:
-    def __init__(self):
+    def __init__(self, level_class: type = PriceLevel):
+        self.level_class = level_class
         self.root: Optional[PriceLevel] = None
         self._lowest_level: Optional[PriceLevel] = None
         self._highest_level: Optional[PriceLevel] = None
+        self._levels: Dict[int, PriceLevel] = {}
+
+    def __len__(self) -> int:
+        return len(self._levels)
 
     @property
     def lowest_level(self) -> Optional[PriceLevel]:
@@ -77,61 +137,56 @@ class PriceLevelTree:
         return self._highest_level
 
     def insert(self, level: PriceLevel) -> None:
-        if not self.root:
-            self.root = level
-            self._lowest_level = self._highest_level = level
-            return
+        level.left_child = level.right_child = None
+        level.is_red = True
 
+        price = level._price
+        parent = None
         current = self.root
-        while True:
-            if level.price < current.price:
-                if current.left_child is None:
-                    current.left_child = level
-                    level.parent = current
-                    break
+        while current:
+            parent = current
+            if price < current._price:
                 current = current.left_child
             else:
-                if current.right_child is None:
-                    current.right_child = level
-                    level.parent = current
-                    break
                 current = current.right_child
 
-        if level.price < self._lowest_level.price:
+        level.parent = parent
+        if parent is None:
+            self.root = level
+        elif price < parent._price:
+            parent.left_child = level
+        else:
+            parent.right_child = level
+
+        self._fix_insert(level)
+        self._levels[price] = level
+
+        if self._lowest_level is None or price < self._lowest_level._price:
             self._lowest_level = level
-        if level.price > self._highest_level.price:
+        if self._highest_level is None or price > self._highest_level._price:
             self._highest_level = level
 
-    def delete(self, price: Decimal) -> None:
-        level = self.find(price)
+    def delete(self, price: int) -> None:
+        level = self._levels.pop(price, None)
         if not level:
             return
 
-        if level.left_child is None and level.right_child is None:
-            self._delete_leaf(level)
-        elif level.left_child is None or level.right_child is None:
-            self._delete_single_child(level)
-        else:
-            self._delete_two_children(level)
+        if level is self._lowest_level:
+            self._lowest_level = self._successor(level)
+        if level is self._highest_level:
+            self._highest_level = self._predecessor(level)
 
-        if self.root:
-            if price == self._lowest_level.price:
-                self._lowest_level = self._find_min(self.root)
-            if price == self._highest_level.price:
-                self._highest_level = self._find_max(self.root)
-        else:
-            self._lowest_level = self._highest_level = None
+        self._remove(level)
 
-    def find(self, price: Decimal) -> Optional[PriceLevel]:
-        current = self.root
-        while current:
-            if price == current.price:
-                return current
-            elif price < current.price:
-                current = current.left_child
-            else:
-                current = current.right_child
-        return None
+    def find_or_create(self, price: int) -> PriceLevel:
+        level = self._levels.get(price)
+        if level is None:
+            level = self.level_class(price)
+            self.insert(level)
+        return level
+
+    def find(self, price: int) -> Optional[PriceLevel]:
+        return self._levels.get(price)
 
     def min(self) -> Optional[PriceLevel]:
         return self._lowest_level
@@ -139,35 +194,199 @@ class PriceLevelTree:
     def max(self) -> Optional[PriceLevel]:
         return self._highest_level
 
-    def _delete_leaf(self, level: PriceLevel) -> None:
-        if level.parent:
-            if level.parent.left_child == level:
-                level.parent.left_child = None
+    def next_level(self, level: PriceLevel) -> Optional[PriceLevel]:
+        return self._successor(level)
+
+    def previous_level(self, level: PriceLevel) -> Optional[PriceLevel]:
+        return self._predecessor(level)
+
+    def clone(self, copy_level: Callable[[PriceLevel], PriceLevel]) -> 'PriceLevelTree':
+        levels = []
+        level = self._lowest_level
+        while level:
+            levels.append(copy_level(level))
+            level = self._successor(level)
+        tree = PriceLevelTree(self.level_class)
+        tree.load_sorted(levels)
+        return tree
+
+    def load_sorted(self, levels: List[PriceLevel]) -> None:
+        self._levels = {level._price: level for level in levels}
+        self._lowest_level = levels[0] if levels else None
+        self._highest_level = levels[-1] if levels else None
+        red_depth = len(levels).bit_length() - 1
+        self.root = self._build_subtree(levels, 0, len(levels), None, 0, red_depth or -1)
+
+    def _build_subtree(self, levels: List[PriceLevel], start: int, end: int, parent: Optional[PriceLevel],
+                       depth: int, red_depth: int) -> Optional[PriceLevel]:
+        if start >= end:
+            return None
+        middle = (start + end) // 2
+        level = levels[middle]
+        level.parent = parent
+        level.is_red = depth == red_depth
+        level.left_child = self._build_subtree(levels, start, middle, level, depth + 1, red_depth)
+        level.right_child = self._build_subtree(levels, middle + 1, end, level, depth + 1, red_depth)
+        return level
+
+    def _remove(self, level: PriceLevel) -> None:
+        removed_red = level.is_red
+        if level.left_child is None:
+            child = level.right_child
+            child_parent = level.parent
+            self._transplant(level, child)
+        elif level.right_child is None:
+            child = level.left_child
+            child_parent = level.parent
+            self._transplant(level, child)
+        else:
+            successor = self._find_min(level.right_child)
+            removed_red = successor.is_red
+            child = successor.right_child
+            if successor.parent is level:
+                child_parent = successor
             else:
-                level.parent.right_child = None
+                child_parent = successor.parent
+                self._transplant(successor, successor.right_child)
+                successor.right_child = level.right_child
+                successor.right_child.parent = successor
+            self._transplant(level, successor)
+            successor.left_child = level.left_child
+            successor.left_child.parent = successor
+            successor.is_red = level.is_red
+
+        if not removed_red:
+            self._fix_delete(child, child_parent)
+
+        level.parent = level.left_child = level.right_child = None
+        level.is_red = False
+
+    def _transplant(self, old: PriceLevel, new: Optional[PriceLevel]) -> None:
+        if old.parent is None:
+            self.root = new
+        elif old is old.parent.left_child:
+            old.parent.left_child = new
         else:
-            self.root = None
+            old.parent.right_child = new
+        if new:
+            new.parent = old.parent
+
+    def _rotate_left(self, level: PriceLevel) -> None:
+        pivot = level.right_child
+        level.right_child = pivot.left_child
+        if pivot.left_child:
+            pivot.left_child.parent = level
+        self._transplant(level, pivot)
+        pivot.left_child = level
+        level.parent = pivot
+
+    def _rotate_right(self, level: PriceLevel) -> None:
+        pivot = level.left_child
+        level.left_child = pivot.right_child
+        if pivot.right_child:
+            pivot.right_child.parent = level
+        self._transplant(level, pivot)
+        pivot.right_child = level
+        level.parent = pivot
 
-    def _delete_single_child(self, level: PriceLevel) -> None:
-        child = level.left_child if level.left_child else level.right_child
-        if level.parent:
-            if level.parent.left_child == level:
-                level.parent.left_child = child
+    def _fix_insert(self, level: PriceLevel) -> None:
+        while level.parent and level.parent.is_red:
+            parent = level.parent
+            grandparent = parent.parent
+            if parent is grandparent.left_child:
+                uncle = grandparent.right_child
+                if uncle and uncle.is_red:
+                    parent.is_red = uncle.is_red = False
+                    grandparent.is_red = True
+                    level = grandparent
+                    continue
+                if level is parent.right_child:
+                    self._rotate_left(parent)
+                    level, parent = parent, level
+                parent.is_red = False
+                grandparent.is_red = True
+                self._rotate_right(grandparent)
             else:
-                level.parent.right_child = child
-            child.parent = level.parent
-        else:
-            self.root = child
-            child.parent = None
-
-    def _delete_two_children(self, level: PriceLevel) -> None:
-        successor = self._find_min(level.right_child)
-        self.delete(successor.price)
-        level._price = successor.price
-        level.update_volume(level.total_volume, successor.total_volume)
-        level._order_count = successor.order_count
-        level._head_order = successor.head_order
-        level._tail_order = successor.tail_order
+                uncle = grandparent.left_child
+                if uncle and uncle.is_red:
+                    parent.is_red = uncle.is_red = False
+                    grandparent.is_red = True
+                    level = grandparent
+                    continue
+                if level is parent.left_child:
+                    self._rotate_right(parent)
+                    level, parent = parent, level
+                parent.is_red = False
+                grandparent.is_red = True
+                self._rotate_left(grandparent)
+        self.root.is_red = False
+
+    def _fix_delete(self, level: Optional[PriceLevel], parent: Optional[PriceLevel]) -> None:
+        while level is not self.root and (level is None or not level.is_red):
+            if level is parent.left_child:
+                sibling = parent.right_child
+                if sibling.is_red:
+                    sibling.is_red = False
+                    parent.is_red = True
+                    self._rotate_left(parent)
+                    sibling = parent.right_child
+                if not self._is_red(sibling.left_child) and not self._is_red(sibling.right_child):
+                    sibling.is_red = True
+                    level = parent
+                    parent = level.parent
+                else:
+                    if not self._is_red(sibling.right_child):
+                        sibling.left_child.is_red = False
+                        sibling.is_red = True
+                        self._rotate_right(sibling)
+                        sibling = parent.right_child
+                    sibling.is_red = parent.is_red
+                    parent.is_red = False
+                    sibling.right_child.is_red = False
+                    self._rotate_left(parent)
+                    level = self.root
+            else:
+                sibling = parent.left_child
+                if sibling.is_red:
+                    sibling.is_red = False
+                    parent.is_red = True
+                    self._rotate_right(parent)
+                    sibling = parent.left_child
+                if not self._is_red(sibling.left_child) and not self._is_red(sibling.right_child):
+                    sibling.is_red = True
+                    level = parent
+                    parent = level.parent
+                else:
+                    if not self._is_red(sibling.left_child):
+                        sibling.right_child.is_red = False
+                        sibling.is_red = True
+                        self._rotate_left(sibling)
+                        sibling = parent.left_child
+                    sibling.is_red = parent.is_red
+                    parent.is_red = False
+                    sibling.left_child.is_red = False
+                    self._rotate_right(parent)
+                    level = self.root
+        if level:
+            level.is_red = False
+
+    @staticmethod
+    def _is_red(level: Optional[PriceLevel]) -> bool:
+        return level is not None and level.is_red
+
+    def _successor(self, level: PriceLevel) -> Optional[PriceLevel]:
+        if level.right_child:
+            return self._find_min(level.right_child)
+        while level.parent and level.parent.right_child is level:
+            level = level.parent
+        return level.parent
+
+    def _predecessor(self, level: PriceLevel) -> Optional[PriceLevel]:
+        if level.left_child:
+            return self._find_max(level.left_child)
+        while level.parent and level.parent.left_child is level:
+            level = level.parent
+        return level.parent
 
     def _find_min(self, node: PriceLevel) -> PriceLevel:
         current = node
@@ -179,4 +398,4 @@ class PriceLevelTree:
         current = node
         while current.right_child:
             current = current.right_child
-        return current
\ No newline at end of file
+        return current
@@ -0,0 +1,173 @@
+import argparse
+import hashlib
+import json
+import logging
+import time
+from array import array
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional
+import numpy as np
+from .orderbook_manager import OrderBookManager
+from .change_journal import DEFAULT_JOURNAL_CAPACITY
+from .event_journal import (JournalRecord, read_journal, MAGIC,
+                            OP_DEFINE, OP_LIMIT, OP_MARKET, OP_CANCEL, OP_MODIFY)
+from .ticker import Ticker
+from .orderbook_logger import configure_logging
+from .exceptions import (InsufficientLiquidityException, InvalidOrderException, InvalidQuantityException,
+                         InvalidTickSizeException, OrderNotFoundException)
+
+OP_BEST_BID_ASK = 5
+OP_SNAPSHOT = 6
+
+OP_NAMES = {
+    OP_DEFINE: "define", OP_LIMIT: "limit", OP_MARKET: "market", OP_CANCEL: "cancel",
+    OP_MODIFY: "modify", OP_BEST_BID_ASK: "best_bid_ask", OP_SNAPSHOT: "snapshot",
+}
+REJECTIONS = (InsufficientLiquidityException, InvalidOrderException, InvalidQuantityException,
+              InvalidTickSizeException, OrderNotFoundException)
+PERCENTILES = (50, 90, 99, 99.9)
+
+class ReplayResult(NamedTuple):
+    events: int
+    rejected: int
+    elapsed: float
+    latencies: Dict[str, np.ndarray]
+    state_hash: str
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.elapsed if self.elapsed else 0.0
+
+def json_records(path: str, symbol: str = "TEST", tick_size: str = "0.01",
+                 initial_orders: int = 10000) -> Iterator[JournalRecord]:
+    with open(path) as stream:
+        data = json.load(stream)
+    ticker = Ticker(symbol, tick_size)
+    to_ticks = ticker.to_ticks
+    orders = data['orders']
+    resting = []
+    sequence = 1
+    yield JournalRecord(sequence, symbol, OP_DEFINE, "buy", None, 0, 0, 0.0, 0, ticker)
+
+    for order in orders[:initial_orders]:
+        sequence += 1
+        resting.append(order['id'])
+        yield JournalRecord(sequence, symbol, OP_LIMIT, order['side'], order['id'],
+                            to_ticks(Decimal(order['price'])), order['quantity'], 0.0)
+
+    orders = orders[initial_orders:]
+    order_index = 0
+    for operation in data['operations']:
+        sequence += 1
+        if operation in ("add", "market"):
+            if order_index >= len(orders):
+                continue
+            order = orders[order_index]
+            order_index += 1
+            if operation == "add":
+                resting.append(order['id'])
+                yield JournalRecord(sequence, symbol, OP_LIMIT, order['side'], order['id'],
+                                    to_ticks(Decimal(order['price'])), order['quantity'], 0.0)
+            else:
+                yield JournalRecord(sequence, symbol, OP_MARKET, order['side'], order['id'], 0, order['quantity'], 0.0)
+        elif operation == "cancel":
+            if resting:
+                position = order_index % len(resting)
+                order_id = resting[position]
+                resting[position] = resting[-1]
+                resting.pop()
+                yield JournalRecord(sequence, symbol, OP_CANCEL, "buy", order_id, 0, 0, 0.0)
+        elif operation == "modify":
+            if resting and orders:
+                quantity = orders[order_index % len(orders)]['quantity']
+                yield JournalRecord(sequence, symbol, OP_MODIFY, "buy", resting[order_index % len(resting)], 0, quantity, 0.0)
+        elif operation == "best_bid_ask":
+            yield JournalRecord(sequence, symbol, OP_BEST_BID_ASK, "buy", None, 0, 0, 0.0)
+        elif operation == "snapshot":
+            yield JournalRecord(sequence, symbol, OP_SNAPSHOT, "buy", None, 0, 10, 0.0)
+
+def load_records(path: str, **json_options) -> Iterator[JournalRecord]:
+    with open(path, 'rb') as stream:
+        is_journal = stream.read(len(MAGIC)) == MAGIC
+    return read_journal(path) if is_journal else json_records(path, **json_options)
+
+def replay(records: Iterable[JournalRecord], manager: Optional[OrderBookManager] = None,
+           measure_latency: bool = True) -> ReplayResult:
+    if manager is None:
+        manager = OrderBookManager()
+    apply_record = manager.apply_record
+    order_books = manager.order_books
+    timer = time.perf_counter
+    latencies = {op: array('d') for op in OP_NAMES}
+    events = 0
+    rejected = 0
+
+    start = timer()
+    for record in records:
+        op = record.op
+        op_start = timer() if measure_latency else 0.0
+        try:
+            if op == OP_BEST_BID_ASK:
+                order_books[record.symbol].best_bid_ask
+            elif op == OP_SNAPSHOT:
+                order_books[record.symbol].get_order_book_snapshot(record.quantity)
+            else:
+                apply_record(record)
+        except REJECTIONS:
+            rejected += 1
+        if measure_latency:
+            latencies[op].append(timer() - op_start)
+        events += 1
+    elapsed = timer() - start
+
+    return ReplayResult(events, rejected, elapsed,
+                        {OP_NAMES[op]: np.frombuffer(values, dtype=np.float64) for op, values in latencies.items() if values},
+                        state_hash(manager))
+
+def state_hash(manager: OrderBookManager) -> str:
+    digest = hashlib.sha256()
+    for symbol in sorted(manager.order_books):
+        order_book = manager.order_books[symbol]
+        digest.update(f"{symbol}:{order_book.current_version}".encode('utf-8'))
+        for side in ("buy", "sell"):
+            state = order_book.export_side(side)
+            for column in (state.level_ticks, state.level_counts, state.quantities):
+                digest.update(np.ascontiguousarray(column, dtype=np.int64).tobytes())
+            ids = state.ids.tolist() if isinstance(state.ids, np.ndarray) else state.ids
+            digest.update(repr(ids).encode('utf-8'))
+    return digest.hexdigest()
+
+def print_report(result: ReplayResult) -> None:
+    print(f"Events: {result.events}  Rejected: {result.rejected}  Elapsed: {result.elapsed:.3f}s  "
+          f"Events/sec: {result.events_per_second:.0f}")
+    if result.latencies:
+        header = ''.join(f"{f'p{percentile} (μs)':<12}" for percentile in PERCENTILES)
+        print(f"{'Operation':<14} {'Count':<10} {'Mean (μs)':<12} {header}{'Max (μs)':<12}")
+        print("-" * (50 + 12 * len(PERCENTILES)))
+        for name, values in result.latencies.items():
+            times_us = values * 1e6
+            percentiles = ''.join(f"{value:<12.2f}" for value in np.percentile(times_us, PERCENTILES))
+            print(f"{name:<14} {len(times_us):<10} {np.mean(times_us):<12.2f} {percentiles}{np.max(times_us):<12.2f}")
+    print(f"State hash: {result.state_hash}")
+
+def main(argv=None) -> ReplayResult:
+    parser = argparse.ArgumentParser(description="Replay recorded order flow through OrderBookManager")
+    parser.add_argument('path', help="Event journal or JSON file produced by profiling/generate_test_data.py")
+    parser.add_argument('--symbol', default="TEST", help="Symbol for JSON input")
+    parser.add_argument('--tick-size', default="0.01", help="Tick size for JSON input")
+    parser.add_argument('--initial-orders', type=int, default=10000, help="JSON orders to rest before the operations")
+    parser.add_argument('--logging', action='store_true', help="Keep change logging enabled")
+    parser.add_argument('--no-change-journal', action='store_true', help="Disable the per-book change journal")
+    parser.add_argument('--no-latency', action='store_true', help="Skip per-operation latency measurement")
+    args = parser.parse_args(argv)
+
+    if not args.logging:
+        configure_logging(level=logging.WARNING)
+    manager = OrderBookManager(journal_capacity=None if args.no_change_journal else DEFAULT_JOURNAL_CAPACITY)
+    records = load_records(args.path, symbol=args.symbol, tick_size=args.tick_size, initial_orders=args.initial_orders)
+    result = replay(records, manager, measure_latency=not args.no_latency)
+    print_report(result)
+    return result
+
+if __name__ == '__main__':
+    main()
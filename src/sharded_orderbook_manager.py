@@ -0,0 +1,154 @@
+import bisect
+import hashlib
+import multiprocessing
+import threading
+from contextlib import ExitStack
+from decimal import Decimal
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from .orderbook_manager import OrderBookManager
+from .order import Order
+from .order_batch import OrderBatch, BatchFills
+from .orderbook_logger import configure_logging
+
+class ConsistentHashRing:
+    def __init__(self, nodes: int, replicas: int = 128):
+        points = sorted((self._hash(f"{node}:{replica}"), node) for node in range(nodes) for replica in range(replicas))
+        self._keys = [key for key, _ in points]
+        self._nodes = [node for _, node in points]
+
+    @staticmethod
+    def _hash(value: str) -> int:
+        return int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'big')
+
+    def node_for(self, key: str) -> int:
+        return self._nodes[bisect.bisect(self._keys, self._hash(key)) % len(self._keys)]
+
+def _shard_worker(connection, log_level: Optional[int]) -> None:
+    configure_logging(level=log_level)
+    manager = OrderBookManager()
+    while True:
+        calls = connection.recv()
+        if calls is None:
+            break
+        results = []
+        for method, args in calls:
+            if method == "process_order":
+                args = (Order(*args[0]),)
+            elif method == "process_orders" and not isinstance(args[0], OrderBatch):
+                args = ([Order(*fields) for fields in args[0]],) + args[1:]
+            try:
+                results.append((True, getattr(manager, method)(*args)))
+            except Exception as error:
+                results.append((False, error))
+        connection.send(results)
+    connection.close()
+
+def _order_fields(order: Order) -> tuple:
+    return order.id, order.type, order.side, order.price, order.quantity, order.symbol
+
+# Every call is one blocking round trip to a shard process, so process_order
+# pays that latency per order. Order flow should go through process_orders,
+# which sends one message per shard per batch. Calls from several threads are
+# safe; each shard connection carries one request/reply exchange at a time.
+class ShardedOrderBookManager:
+    def __init__(self, num_shards: int, log_level: Optional[int] = None, start_method: Optional[str] = None):
+        context = multiprocessing.get_context(start_method)
+        self.num_shards = num_shards
+        self.ring = ConsistentHashRing(num_shards)
+        self.default_order_book_levels = 10
+        self._shards: Dict[str, int] = {}
+        self._connections = []
+        self._connection_locks = [threading.Lock() for _ in range(num_shards)]
+        self._processes = []
+        for shard in range(num_shards):
+            parent, child = context.Pipe()
+            process = context.Process(target=_shard_worker, args=(child, log_level),
+                                      name=f"orderbook-shard-{shard}", daemon=True)
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+    def __enter__(self) -> 'ShardedOrderBookManager':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def shard_for(self, symbol: str) -> int:
+        shard = self._shards.get(symbol)
+        if shard is None:
+            shard = self._shards[symbol] = self.ring.node_for(symbol)
+        return shard
+
+    def create_order_book(self, symbol: str, tick_size: Decimal, price_band: Tuple[Decimal, Decimal] = None):
+        self._call(symbol, "create_order_book", (symbol, tick_size, price_band))
+
+    def process_order(self, order: Order) -> Tuple[int, List, int]:
+        return self._call(order.symbol, "process_order", (_order_fields(order),))
+
+    def cancel_order(self, symbol: str, order_id) -> int:
+        return self._call(symbol, "cancel_order", (symbol, order_id))
+
+    def modify_order(self, symbol: str, order_id, new_quantity: int) -> int:
+        return self._call(symbol, "modify_order", (symbol, order_id, new_quantity))
+
+    def get_order_book_snapshot(self, symbol: str, levels: int = None) -> Tuple[Dict, int]:
+        return self._call(symbol, "get_order_book_snapshot",
+                          (symbol, levels if levels is not None else self.default_order_book_levels))
+
+    def get_order_book_update(self, symbol: str) -> Tuple[List, int]:
+        return self._call(symbol, "get_order_book_update", (symbol,))
+
+    def process_orders(self, batch: Union[Sequence[Order], OrderBatch], symbol: Optional[str] = None) -> Dict[str, Tuple[BatchFills, int]]:
+        if symbol is not None:
+            calls = {self.shard_for(symbol): [("process_orders", (batch, symbol))]}
+        else:
+            shard_orders: Dict[int, list] = {}
+            for order in batch:
+                shard_orders.setdefault(self.shard_for(order.symbol), []).append(_order_fields(order))
+            calls = {shard: [("process_orders", (orders,))] for shard, orders in shard_orders.items()}
+
+        results = {}
+        for shard_results in self._call_shards(calls).values():
+            results.update(shard_results[0])
+        return results
+
+    def close(self) -> None:
+        with ExitStack() as stack:
+            for lock in self._connection_locks:
+                stack.enter_context(lock)
+            for connection in self._connections:
+                try:
+                    connection.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+            for process in self._processes:
+                process.join()
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
+            self._processes = []
+
+    def _call(self, symbol: str, method: str, args: tuple):
+        shard = self.shard_for(symbol)
+        return self._call_shards({shard: [(method, args)]})[shard][0]
+
+    def _call_shards(self, calls: Dict[int, List[Tuple[str, tuple]]]) -> Dict[int, list]:
+        results = {}
+        error = None
+        with ExitStack() as stack:
+            for shard in sorted(calls):
+                stack.enter_context(self._connection_locks[shard])
+            for shard, shard_calls in calls.items():
+                self._connections[shard].send(shard_calls)
+            for shard in calls:
+                shard_results = []
+                for succeeded, value in self._connections[shard].recv():
+                    if not succeeded and error is None:
+                        error = value
+                    shard_results.append(value)
+                results[shard] = shard_results
+        if error is not None:
+            raise error
+        return results
@@ -1,14 +1,44 @@
 from decimal import Decimal
+import numpy as np
+from .exceptions import InvalidTickSizeException
 
 class Ticker:
-    def __init__(self, symbol, tick_size):
+    def __init__(self, symbol, tick_size, price_band=None):
         self.symbol = symbol
         self._tick_size = Decimal(str(tick_size))
+        self._price_band = None
+        if price_band is not None:
+            low, high = price_band
+            self._price_band = (Decimal(str(low)), Decimal(str(high)))
 
     @property
     def tick_size(self):
         return self._tick_size
 
+    @property
+    def price_band(self):
+        return self._price_band
+
     def is_valid_price(self, price):
         price_decimal = Decimal(str(price))
-        return price_decimal % self._tick_size == 0
\ No newline at end of file
+        return price_decimal % self._tick_size == 0
+
+    def to_ticks(self, price) -> int:
+        price_decimal = price if isinstance(price, Decimal) else Decimal(str(price))
+        ticks, remainder = divmod(price_decimal, self._tick_size)
+        if remainder:
+            raise InvalidTickSizeException(f"Invalid price. Must be a multiple of {self._tick_size}")
+        return int(ticks)
+
+    def to_price(self, ticks: int) -> Decimal:
+        return ticks * self._tick_size
+
+    def to_ticks_array(self, prices) -> np.ndarray:
+        values = np.asarray(prices)
+        if values.dtype.kind in 'iuf':
+            scaled = values / float(self._tick_size)
+            ticks = np.rint(scaled)
+            if np.any(np.abs(scaled - ticks) > 1e-6):
+                raise InvalidTickSizeException(f"Invalid price. Must be a multiple of {self._tick_size}")
+            return ticks.astype(np.int64)
+        return np.fromiter((self.to_ticks(price) for price in values.tolist()), dtype=np.int64, count=len(values))
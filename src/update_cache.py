@@ -0,0 +1,58 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+DEFAULT_UPDATE_CACHE_SIZE = 1024
+
+class EncodedUpdateCache:
+    def __init__(self, capacity: int = DEFAULT_UPDATE_CACHE_SIZE):
+        if capacity <= 0:
+            raise ValueError("Update cache capacity must be positive")
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return data
+
+    def put(self, key: Hashable, data: bytes) -> bytes:
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+        return data
+
+    def get_or_put(self, key: Hashable, encode: Callable[[], bytes]) -> bytes:
+        while True:
+            with self._lock:
+                data = self._entries.get(key)
+                if data is not None:
+                    self.hits += 1
+                    self._entries.move_to_end(key)
+                    return data
+                pending = self._pending.get(key)
+                if pending is None:
+                    self.misses += 1
+                    pending = self._pending[key] = threading.Event()
+                    break
+            pending.wait()
+        try:
+            return self.put(key, encode())
+        finally:
+            with self._lock:
+                del self._pending[key]
+            pending.set()
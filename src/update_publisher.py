@@ -0,0 +1,91 @@
+import asyncio
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+class Subscription:
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._requests: List = []
+        self._symbols: Set[str] = set()
+        self.closed = False
+
+    def notify(self, symbol: str) -> None:
+        with self._condition:
+            self._symbols.add(symbol)
+            self._condition.notify()
+
+    def post(self, request) -> None:
+        with self._condition:
+            self._requests.append(request)
+            self._condition.notify()
+
+    def close(self) -> None:
+        with self._condition:
+            self.closed = True
+            self._condition.notify()
+
+    def wait(self, timeout: Optional[float] = None) -> Tuple[List, Set[str]]:
+        with self._condition:
+            if not (self._requests or self._symbols or self.closed):
+                self._condition.wait(timeout)
+            requests, self._requests = self._requests, []
+            symbols, self._symbols = self._symbols, set()
+            return requests, symbols
+
+class AsyncSubscription:
+    def __init__(self):
+        self._loop = asyncio.get_running_loop()
+        self._thread_id = threading.get_ident()
+        self._event = asyncio.Event()
+        self._requests: List = []
+        self._symbols: Set[str] = set()
+        self.closed = False
+
+    def notify(self, symbol: str) -> None:
+        if threading.get_ident() == self._thread_id:
+            self._symbols.add(symbol)
+            self._event.set()
+        else:
+            self._loop.call_soon_threadsafe(self.notify, symbol)
+
+    def post(self, request) -> None:
+        self._requests.append(request)
+        self._event.set()
+
+    def close(self) -> None:
+        self.closed = True
+        self._event.set()
+
+    async def wait(self) -> Tuple[List, Set[str]]:
+        if not (self._requests or self._symbols or self.closed):
+            await self._event.wait()
+        self._event.clear()
+        requests, self._requests = self._requests, []
+        symbols, self._symbols = self._symbols, set()
+        return requests, symbols
+
+class UpdatePublisher:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, Tuple[Subscription, ...]] = {}
+
+    def subscribe(self, symbol: str, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(symbol, ())
+            if subscription not in subscribers:
+                self._subscribers[symbol] = subscribers + (subscription,)
+
+    def unsubscribe(self, symbol: str, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = tuple(subscriber for subscriber in self._subscribers.get(symbol, ()) if subscriber is not subscription)
+            if subscribers:
+                self._subscribers[symbol] = subscribers
+            else:
+                self._subscribers.pop(symbol, None)
+
+    def subscriber_count(self, symbol: str) -> int:
+        return len(self._subscribers.get(symbol, ()))
+
+    def publish(self, symbol: str) -> None:
+        for subscription in self._subscribers.get(symbol, ()):
+            subscription.notify(symbol)
@@ -0,0 +1,45 @@
+import asyncio
+import grpc
+from src.async_orderbook_server import AsyncOrderBookServer
+from src.orderbook_service_pb2 import SubscriptionRequest, Order
+from src.orderbook_server import add_servicer_to_server
+from src.orderbook_service_pb2_grpc import OrderBookServiceStub
+
+CONFIG = {"server_port": 0, "instruments": {"AAPL": {"tick_size": "0.01"}, "MSFT": {"tick_size": "0.01"}}}
+
+async def start_server():
+    server = grpc.aio.server()
+    add_servicer_to_server(AsyncOrderBookServer(CONFIG), server)
+    port = server.add_insecure_port('127.0.0.1:0')
+    await server.start()
+    return server, port
+
+def test_many_subscribers_do_not_block_order_entry():
+    async def scenario():
+        server, port = await start_server()
+        async with grpc.aio.insecure_channel(f'127.0.0.1:{port}') as channel:
+            stub = OrderBookServiceStub(channel)
+            streams = []
+            for _ in range(200):
+                call = stub.SubscribeOrderBook()
+                await call.write(SubscriptionRequest(symbol="AAPL", subscribe=True))
+                streams.append(call)
+            snapshots = await asyncio.gather(*(call.read() for call in streams))
+            assert all(snapshot.is_snapshot for snapshot in snapshots)
+
+            response = await asyncio.wait_for(stub.PlaceOrder(Order(symbol="AAPL", order_id="1", side="buy", type="limit",
+                                                                    price="100.00", quantity=5)), timeout=5)
+            assert response.status == "PLACED"
+            updates = await asyncio.gather(*(call.read() for call in streams))
+            assert {(update.version, update.changes[0].price) for update in updates} == {(1, "100.00")}
+
+            call = streams[0]
+            await call.write(SubscriptionRequest(symbol="AAPL", subscribe=False))
+            assert (await call.read()).version == 0
+            await call.done_writing()
+            assert await call.read() == grpc.aio.EOF
+            for call in streams[1:]:
+                call.cancel()
+        await server.stop(None)
+
+    asyncio.run(scenario())
@@ -0,0 +1,53 @@
+import pytest
+from src.change_journal import ChangeJournal, NullChangeJournal
+from src.exceptions import VersionOutOfRangeException
+
+def fill(journal, count):
+    for version in range(1, count + 1):
+        journal.append(version, 'add', 'buy', 10000 + version, version)
+
+def test_since_returns_records_after_version():
+    journal = ChangeJournal(capacity=8)
+    fill(journal, 5)
+    assert [record[0] for record in journal.since(0)] == [1, 2, 3, 4, 5]
+    assert [record[0] for record in journal.since(3)] == [4, 5]
+    assert journal.since(5) == []
+    assert journal.since(0)[0] == (1, 'add', 'buy', 10001, 1)
+
+def test_since_wraps_around_ring():
+    journal = ChangeJournal(capacity=4)
+    fill(journal, 10)
+    assert len(journal) == 4
+    assert journal.first_version == 7
+    assert [record[0] for record in journal.since(6)] == [7, 8, 9, 10]
+    assert [record[0] for record in journal.since(8)] == [9, 10]
+
+def test_since_raises_for_evicted_version():
+    journal = ChangeJournal(capacity=4)
+    fill(journal, 10)
+    with pytest.raises(VersionOutOfRangeException):
+        journal.since(5)
+
+def test_clear_moves_window_forward():
+    journal = ChangeJournal(capacity=4)
+    fill(journal, 3)
+    journal.clear()
+    assert len(journal) == 0
+    assert journal.since(3) == []
+    with pytest.raises(VersionOutOfRangeException):
+        journal.since(2)
+    journal.append(4, 'delete', 'sell', 10004, 1)
+    assert journal.since(3) == [(4, 'delete', 'sell', 10004, 1)]
+
+def test_rejects_non_positive_capacity():
+    with pytest.raises(ValueError):
+        ChangeJournal(capacity=0)
+
+def test_null_journal_keeps_version_only():
+    journal = NullChangeJournal()
+    fill(journal, 5)
+    assert len(journal) == 0
+    assert journal.last_version == 5
+    assert journal.since(5) == []
+    with pytest.raises(VersionOutOfRangeException):
+        journal.since(4)
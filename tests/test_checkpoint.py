@@ -0,0 +1,105 @@
+import pytest
+import random
+from decimal import Decimal
+from src.checkpoint import write_checkpoint, read_checkpoint
+from src.orderbook import Orderbook
+from src.compact_orderbook import CompactOrderbook
+from src.orderbook_manager import OrderBookManager
+from src.order import Order
+from src.ticker import Ticker
+from src.exceptions import InvalidCheckpointException, VersionOutOfRangeException
+
+def trade_randomly(orderbook, seed, count, id_type=int):
+    rng = random.Random(seed)
+    for order_id in range(count):
+        if rng.random() < 0.15 and orderbook.orders:
+            orderbook.cancel_order(rng.choice(sorted(orderbook.orders)))
+            continue
+        order_type = "market" if rng.random() > 0.95 else "limit"
+        price = Decimal(rng.randint(9800, 10200)) / 100 if order_type == "limit" else None
+        orderbook.add_order(Order(id_type(order_id), order_type, rng.choice(["buy", "sell"]), price,
+                                  rng.randint(1, 50), "SPY"))
+
+def book_state(orderbook):
+    fifo = []
+    for tree in (orderbook.bids, orderbook.asks):
+        level = tree.min()
+        while level:
+            fifo.append((level.price, level.order_count, level.total_volume))
+            level = tree.next_level(level)
+    return orderbook.get_order_book_snapshot(1000), sorted(orderbook.orders, key=str), fifo, orderbook.current_version
+
+@pytest.mark.parametrize("book_class, price_band, id_type", [
+    (Orderbook, None, int), (Orderbook, ("99", "101"), str), (CompactOrderbook, ("99.50", "100.50"), int),
+])
+def test_round_trip_preserves_book_and_fifo(tmp_path, book_class, price_band, id_type):
+    orderbook = book_class(Ticker("SPY", "0.01", price_band), depth_index=True)
+    trade_randomly(orderbook, 3, 2000, id_type)
+    path = tmp_path / "book.ckpt"
+    write_checkpoint(str(path), {"SPY": orderbook}, sequence=42)
+
+    order_books, sequence = read_checkpoint(str(path))
+    restored = order_books["SPY"]
+    assert sequence == 42
+    assert type(restored) is book_class
+    assert restored.ticker.price_band == orderbook.ticker.price_band
+    assert book_state(restored) == book_state(orderbook)
+    assert restored.estimate_fill("buy", 500) == orderbook.estimate_fill("buy", 500)
+    with pytest.raises(VersionOutOfRangeException):
+        restored.get_updates_since(0)
+
+    if book_class is Orderbook:
+        order_id = next(iter(orderbook.orders))
+        assert restored.orders[order_id].timestamp == orderbook.orders[order_id].timestamp
+
+    trade_randomly(orderbook, 4, 500, id_type)
+    trade_randomly(restored, 4, 500, id_type)
+    assert book_state(restored) == book_state(orderbook)
+    assert restored.get_updates_since(book_state(orderbook)[3] - 10) == orderbook.get_updates_since(book_state(orderbook)[3] - 10)
+
+def test_manager_checkpoint(tmp_path):
+    manager = OrderBookManager()
+    manager.create_order_book("AAPL", Decimal("0.01"))
+    manager.create_order_book("MSFT", Decimal("0.05"), (Decimal("250"), Decimal("350")))
+    manager.process_order(Order("1", "limit", "buy", Decimal("150.00"), 100, "AAPL"))
+    manager.process_order(Order("2", "limit", "sell", Decimal("300.05"), 10, "MSFT"))
+    manager.save_checkpoint(str(tmp_path / "manager.ckpt"), sequence=7)
+
+    restored = OrderBookManager()
+    assert restored.load_checkpoint(str(tmp_path / "manager.ckpt")) == 7
+    assert restored.get_order_book_snapshot("AAPL") == manager.get_order_book_snapshot("AAPL")
+    assert restored.get_order_book_snapshot("MSFT") == manager.get_order_book_snapshot("MSFT")
+    assert restored.get_order_book_update("MSFT") == ([], 1)
+
+def test_round_trip_mixed_order_ids(tmp_path):
+    orderbook = Orderbook(Ticker("SPY", "0.01"))
+    orderbook.add_order(Order(1, "limit", "buy", Decimal("99.00"), 5, "SPY"))
+    orderbook.add_order(Order("2", "limit", "buy", Decimal("99.00"), 3, "SPY"))
+    orderbook.add_order(Order(3, "limit", "sell", Decimal("101.00"), 4, "SPY"))
+    write_checkpoint(str(tmp_path / "book.ckpt"), {"SPY": orderbook})
+    restored = read_checkpoint(str(tmp_path / "book.ckpt"))[0]["SPY"]
+    assert book_state(restored) == book_state(orderbook)
+    assert sorted(restored.orders, key=str) == [1, "2", 3]
+
+    orderbook.add_order(Order("abc", "limit", "sell", Decimal("101.00"), 4, "SPY"))
+    with pytest.raises(InvalidCheckpointException):
+        write_checkpoint(str(tmp_path / "book.ckpt"), {"SPY": orderbook})
+    assert read_checkpoint(str(tmp_path / "book.ckpt"))[0]["SPY"].orders.keys() == restored.orders.keys()
+    assert list(tmp_path.iterdir()) == [tmp_path / "book.ckpt"]
+
+def test_rejects_truncated_files(tmp_path):
+    orderbook = Orderbook(Ticker("SPY", "0.01"))
+    trade_randomly(orderbook, 5, 200, str)
+    path = tmp_path / "book.ckpt"
+    write_checkpoint(str(path), {"SPY": orderbook})
+    data = path.read_bytes()
+    for size in (0, 10, 30, len(data) // 2, len(data) - 1):
+        path.write_bytes(data[:size])
+        with pytest.raises(InvalidCheckpointException):
+            read_checkpoint(str(path))
+
+def test_rejects_foreign_files(tmp_path):
+    path = tmp_path / "not_a_checkpoint"
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(InvalidCheckpointException):
+        read_checkpoint(str(path))
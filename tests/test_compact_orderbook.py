@@ -0,0 +1,119 @@
+import pytest
+import random
+from decimal import Decimal
+from src.compact_orderbook import CompactOrderbook
+from src.orderbook import Orderbook
+from src.order import Order
+from src.order_store import OrderStore, BUY, SELL
+from src.ticker import Ticker
+from src.exceptions import InvalidOrderException, OrderNotFoundException
+
+@pytest.fixture(params=[None, ("90", "110")], ids=["tree", "ladder"])
+def orderbook(request):
+    return CompactOrderbook(Ticker("SPY", "0.01", request.param))
+
+def test_order_store_reuses_released_slots():
+    store = OrderStore()
+    first = store.allocate(1, BUY, 10050, 10)
+    second = store.allocate(2, SELL, 10060, 5)
+    assert (first, second) == (0, 1)
+    store.release(first)
+    assert len(store) == 1
+    assert store.allocate(3, BUY, 10040, 7) == first
+    assert store.capacity == 2
+
+def test_add_and_match_limit_orders(orderbook):
+    orderbook.add_order(Order(1, "limit", "sell", "100.50", 10, "SPY"))
+    orderbook.add_order(Order(2, "limit", "sell", "100.50", 5, "SPY"))
+    order_id, filled_orders = orderbook.add_order(Order(3, "limit", "buy", "100.50", 12, "SPY"))
+
+    assert order_id == 3
+    assert filled_orders == [(1, 10, Decimal("100.50")), (2, 2, Decimal("100.50"))]
+    assert list(orderbook.orders) == [2]
+    assert orderbook.get_order_book_snapshot(5) == {"bids": [], "asks": [(Decimal("100.50"), 3)]}
+
+def test_cancel_and_modify(orderbook):
+    orderbook.add_order(Order(1, "limit", "buy", "100.50", 10, "SPY"))
+    orderbook.add_order(Order(2, "limit", "buy", "100.50", 5, "SPY"))
+    orderbook.modify_order(1, 20)
+    orderbook.modify_order(2, 3)
+    assert orderbook.get_order_book_snapshot(1)["bids"] == [(Decimal("100.50"), 23)]
+
+    _, filled_orders = orderbook.add_order(Order(3, "market", "sell", None, 4, "SPY"))
+    assert filled_orders == [(2, 3, Decimal("100.50")), (1, 1, Decimal("100.50"))]
+
+    orderbook.cancel_order(1)
+    assert not orderbook.orders
+    assert orderbook.best_bid is None
+    changes = orderbook.get_updates_since(0)
+    assert changes[-1]['action'] == 'delete'
+    assert changes[-1]['quantity'] == 0
+    with pytest.raises(OrderNotFoundException):
+        orderbook.cancel_order(1)
+
+def test_rejects_non_integer_ids(orderbook):
+    with pytest.raises(InvalidOrderException):
+        orderbook.add_order(Order("a", "limit", "buy", "100.50", 10, "SPY"))
+
+def test_dump_and_mass_cancel(orderbook):
+    for i, (side, price) in enumerate([("buy", "99.00"), ("buy", "99.50"), ("buy", "99.50"),
+                                        ("sell", "101.00"), ("sell", "102.00")]):
+        orderbook.add_order(Order(i, "limit", side, price, 10 + i, "SPY"))
+
+    dump = orderbook.dump()
+    assert sorted(dump['id'].tolist()) == [0, 1, 2, 3, 4]
+    assert dump['quantity'].sum() == 60
+
+    assert orderbook.mass_cancel(side="buy", min_price=Decimal("99.50")) == 2
+    assert sorted(orderbook.orders) == [0, 3, 4]
+    assert orderbook.best_bid == Decimal("99.00")
+
+    assert orderbook.mass_cancel() == 3
+    assert not orderbook.orders
+    assert len(orderbook.store) == 0
+    assert orderbook.get_order_book_snapshot(5) == {"bids": [], "asks": []}
+
+    orderbook.add_order(Order(9, "limit", "buy", "99.50", 1, "SPY"))
+    assert orderbook.get_order_book_snapshot(5)["bids"] == [(Decimal("99.50"), 1)]
+
+def test_matches_object_orderbook_on_random_flow():
+    rng = random.Random(3)
+    reference = Orderbook(Ticker("SPY", "0.01"))
+    compact = CompactOrderbook(Ticker("SPY", "0.01", ("99", "101")))
+
+    for order_id in range(3000):
+        action = rng.random()
+        if action < 0.15 and reference.orders:
+            target = rng.choice(sorted(reference.orders))
+            reference.cancel_order(target)
+            compact.cancel_order(target)
+        elif action < 0.25 and reference.orders:
+            target = rng.choice(sorted(reference.orders))
+            quantity = rng.randint(1, 50)
+            reference.modify_order(target, quantity)
+            compact.modify_order(target, quantity)
+        else:
+            side = rng.choice(["buy", "sell"])
+            order_type = "market" if action > 0.95 else "limit"
+            price = Decimal(rng.randint(9800, 10200)) / 100 if order_type == "limit" else None
+            quantity = rng.randint(1, 50)
+            expected = reference.add_order(Order(order_id, order_type, side, price, quantity, "SPY"))
+            assert compact.add_order(Order(order_id, order_type, side, price, quantity, "SPY")) == expected
+
+    assert compact.get_order_book_snapshot(500) == reference.get_order_book_snapshot(500)
+    assert sorted(compact.orders) == sorted(reference.orders)
+    assert compact.current_version == reference.current_version
+
+def test_clone_is_independent(orderbook):
+    for i, (side, price) in enumerate([("buy", "99.50"), ("buy", "99.50"), ("sell", "101.00")]):
+        orderbook.add_order(Order(i, "limit", side, price, 10 + i, "SPY"))
+
+    clone = orderbook.clone()
+    clone.add_order(Order(3, "market", "sell", None, 15, "SPY"))
+    clone.mass_cancel(side="sell")
+    clone.add_order(Order(4, "limit", "buy", "99.00", 5, "SPY"))
+
+    assert orderbook.get_order_book_snapshot(5) == {"bids": [(Decimal("99.50"), 21)], "asks": [(Decimal("101.00"), 12)]}
+    assert sorted(orderbook.orders) == [0, 1, 2]
+    assert clone.get_order_book_snapshot(5) == {"bids": [(Decimal("99.50"), 6), (Decimal("99.00"), 5)], "asks": []}
+    assert orderbook.dump()['quantity'].tolist() == [10, 11, 12]
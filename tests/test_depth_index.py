@@ -0,0 +1,113 @@
+import pytest
+import random
+from decimal import Decimal
+from src.depth_index import DepthIndex
+from src.orderbook import Orderbook
+from src.compact_orderbook import CompactOrderbook
+from src.order import Order
+from src.ticker import Ticker
+
+def test_prefix_volumes_and_quantity_search():
+    index = DepthIndex(100, 115)
+    for key, volume in [(100, 5), (103, 10), (110, 20)]:
+        index.add(key, volume)
+
+    assert index.total == 35
+    assert index.volume_through(99) == 0
+    assert index.volume_through(103) == 15
+    assert index.volume_between(101, 110) == 30
+    assert [index.key_for_quantity(quantity) for quantity in (1, 5, 6, 15, 16, 35)] == [100, 100, 103, 103, 110, 110]
+    assert index.key_for_quantity(36) is None
+
+    index.add(103, -10)
+    assert index.volume_at(103) == 0
+    assert index.key_for_quantity(6) == 110
+
+def test_grows_in_both_directions():
+    index = DepthIndex(initial_size=8)
+    index.add(1000, 1)
+    index.add(5000, 2)
+    index.add(-300, 4)
+    assert index.volume_through(999) == 4
+    assert index.volume_through(5000) == 7
+    assert index.key_for_quantity(5) == 1000
+    assert index.key_for_quantity(7) == 5000
+
+def test_outlier_keys_do_not_grow_the_index():
+    index = DepthIndex(initial_size=8, max_span=64)
+    rng = random.Random(5)
+    volumes = {}
+    for _ in range(500):
+        key = rng.choice([rng.randint(1000, 1040), rng.randint(-10**9, 10**9)])
+        delta = rng.randint(1, 20) if volumes.get(key, 0) == 0 or rng.random() < 0.6 else -volumes[key]
+        index.add(key, delta)
+        volumes[key] = volumes.get(key, 0) + delta
+    assert len(index._volumes) <= 64
+
+    keys = sorted(key for key, volume in volumes.items() if volume)
+    for key in keys[::7] + [keys[0] - 1, keys[-1]]:
+        assert index.volume_through(key) == sum(volumes[other] for other in keys if other <= key)
+        assert index.notional_through(key) == sum(other * volumes[other] for other in keys if other <= key)
+        assert index.levels_through(key) == sum(1 for other in keys if other <= key)
+        assert index.volume_at(key) == volumes.get(key, 0)
+    cumulative = 0
+    for key in keys:
+        cumulative += volumes[key]
+        assert index.key_for_quantity(cumulative) == key
+    assert index.copy().key_for_quantity(cumulative) == keys[-1]
+
+@pytest.mark.parametrize("book_class, price_band", [
+    (Orderbook, None), (Orderbook, ("99", "101")), (CompactOrderbook, ("99.50", "100.50")),
+])
+def test_indexed_queries_match_level_walks(book_class, price_band):
+    rng = random.Random(11)
+    ticker = Ticker("SPY", "0.01", price_band)
+    indexed = book_class(ticker, depth_index=True)
+    walking = book_class(ticker)
+
+    for order_id in range(3000):
+        action = rng.random()
+        if action < 0.15 and walking.orders:
+            target = rng.choice(sorted(walking.orders))
+            indexed.cancel_order(target)
+            walking.cancel_order(target)
+        elif action < 0.25 and walking.orders:
+            target = rng.choice(sorted(walking.orders))
+            quantity = rng.randint(1, 50)
+            indexed.modify_order(target, quantity)
+            walking.modify_order(target, quantity)
+        else:
+            order_type = "market" if action > 0.95 else "limit"
+            price = Decimal(rng.randint(9800, 10200)) / 100 if order_type == "limit" else None
+            params = (order_id, order_type, rng.choice(["buy", "sell"]), price, rng.randint(1, 50), "SPY")
+            indexed.add_order(Order(*params))
+            walking.add_order(Order(*params))
+
+        if order_id % 100 == 0:
+            for side in ("buy", "sell"):
+                assert indexed.available_volume(side) == walking.available_volume(side)
+                assert indexed.available_volume(side, within_ticks=5) == walking.available_volume(side, within_ticks=5)
+                assert indexed.available_volume(side, Decimal("100.00")) == walking.available_volume(side, Decimal("100.00"))
+                for quantity in (1, 100, 1000, 10**6):
+                    assert indexed.price_for_quantity(side, quantity) == walking.price_for_quantity(side, quantity)
+                    assert indexed.can_fill(side, quantity, Decimal("100.10")) == walking.can_fill(side, quantity, Decimal("100.10"))
+
+@pytest.mark.parametrize("depth_index", [False, True], ids=["walk", "index"])
+def test_liquidity_queries_from_taker_side(depth_index):
+    orderbook = Orderbook(Ticker("SPY", "0.01"), depth_index=depth_index)
+    for i, (side, price, quantity) in enumerate([("sell", "100.00", 10), ("sell", "100.05", 20),
+                                                 ("buy", "99.90", 5), ("buy", "99.80", 7)]):
+        orderbook.add_order(Order(i, "limit", side, price, quantity, "SPY"))
+
+    assert orderbook.available_volume("buy") == 30
+    assert orderbook.available_volume("buy", within_ticks=4) == 10
+    assert orderbook.available_volume("sell", limit_price=Decimal("99.85")) == 5
+    assert orderbook.price_for_quantity("buy", 11) == Decimal("100.05")
+    assert orderbook.price_for_quantity("sell", 6) == Decimal("99.80")
+    assert orderbook.price_for_quantity("sell", 13) is None
+    assert orderbook.can_fill("buy", 30)
+    assert not orderbook.can_fill("buy", 30, Decimal("100.04"))
+
+    orderbook.add_order(Order(9, "market", "buy", None, 15, "SPY"))
+    assert orderbook.available_volume("buy") == 15
+    assert orderbook.available_volume("sell", within_ticks=0) == 5
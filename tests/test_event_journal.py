@@ -0,0 +1,179 @@
+import pytest
+import random
+import threading
+import tracemalloc
+from decimal import Decimal
+from src.event_journal import EventJournal, read_journal, OP_DEFINE, OP_LIMIT, OP_CANCEL, OP_MODIFY, RECORD_SIZE
+from src.orderbook_manager import OrderBookManager
+from src.order import Order
+from src.order_batch import OrderBatch
+from src.exceptions import InvalidOrderException, InvalidJournalException, InvalidTickSizeException
+
+def trade_randomly(manager, seed, count, id_offset=0):
+    rng = random.Random(seed)
+    for order_id in range(id_offset, id_offset + count):
+        symbol = rng.choice(["AAPL", "MSFT"])
+        orders = manager.order_books[symbol].orders
+        action = rng.random()
+        if action < 0.1 and orders:
+            manager.cancel_order(symbol, rng.choice(sorted(orders)))
+            continue
+        if action < 0.15 and orders:
+            manager.modify_order(symbol, rng.choice(sorted(orders)), rng.randint(1, 50))
+            continue
+        order_type = "market" if rng.random() > 0.95 else "limit"
+        price = Decimal(rng.randint(9800, 10200)) / 100 if order_type == "limit" else None
+        manager.process_order(Order(order_id, order_type, rng.choice(["buy", "sell"]), price,
+                                    rng.randint(1, 50), symbol))
+
+def manager_state(manager, timestamps=True):
+    state = {}
+    for symbol, order_book in manager.order_books.items():
+        orders = [(order_id, order.price, order.quantity, order.timestamp if timestamps else None)
+                  for order_id, order in order_book.orders.items()]
+        state[symbol] = (order_book.get_order_book_snapshot(1000), sorted(orders), order_book.current_version)
+    return state
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return str(tmp_path / "events.wal")
+
+def journaled_manager(journal_path, **options):
+    manager = OrderBookManager.recover(journal_path, **options)
+    manager.create_order_book("AAPL", Decimal("0.01"))
+    manager.create_order_book("MSFT", Decimal("0.01"), (Decimal("90"), Decimal("110")))
+    return manager
+
+def test_read_journal_streams_records(journal_path):
+    manager = journaled_manager(journal_path, sync="none")
+    manager.process_orders(OrderBatch.from_orders(
+        [Order(order_id, "limit", "buy", Decimal("100.00"), 1, "AAPL") for order_id in range(50000)]), "AAPL")
+    manager.journal.close()
+
+    tracemalloc.start()
+    records = read_journal(journal_path)
+    for _ in range(25000):
+        next(records)
+    snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(True, "*event_journal.py")])
+    tracemalloc.stop()
+    assert sum(stat.size for stat in snapshot.statistics("filename")) < 50000 * RECORD_SIZE // 10
+    assert sum(1 for _ in records) == 50002 - 25000
+
+def test_journaled_writers_only_serialize_per_symbol(journal_path):
+    manager = journaled_manager(journal_path, sync="none")
+    done = threading.Event()
+    with manager._write_lock("AAPL"):
+        writer = threading.Thread(target=lambda: (manager.process_order(
+            Order(1, "limit", "buy", Decimal("100.00"), 1, "MSFT")), done.set()))
+        writer.start()
+        assert done.wait(5)
+        blocked = threading.Thread(target=manager.process_order, args=(Order(2, "limit", "buy", Decimal("100.00"), 1, "AAPL"),))
+        blocked.start()
+        blocked.join(0.1)
+        assert blocked.is_alive()
+    blocked.join()
+    writer.join()
+    manager.journal.close()
+    assert [record.symbol for record in read_journal(journal_path)][2:] == ["MSFT", "AAPL"]
+
+def test_records_round_trip(journal_path):
+    manager = journaled_manager(journal_path)
+    manager.process_order(Order(7, "limit", "buy", Decimal("100.25"), 10, "AAPL"))
+    manager.process_order(Order("8", "limit", "sell", Decimal("100.50"), 5, "MSFT"))
+    manager.modify_order("AAPL", 7, 4)
+    manager.cancel_order("MSFT", "8")
+    manager.journal.close()
+
+    records = list(read_journal(journal_path))
+    assert [record.op for record in records] == [OP_DEFINE, OP_DEFINE, OP_LIMIT, OP_LIMIT, OP_MODIFY, OP_CANCEL]
+    assert [record.sequence for record in records] == list(range(1, 7))
+    assert records[1].ticker.price_band == (Decimal("90"), Decimal("110"))
+    assert records[2][1:7] == ("AAPL", OP_LIMIT, "buy", 7, 10025, 10)
+    assert records[3].order_id == "8"
+    assert records[4].quantity == 4
+
+def test_recover_replays_journal(journal_path):
+    manager = journaled_manager(journal_path)
+    trade_randomly(manager, 1, 1500)
+    manager.journal.close()
+
+    recovered = OrderBookManager.recover(journal_path)
+    assert manager_state(recovered) == manager_state(manager)
+    assert recovered.journal.sequence == manager.journal.sequence
+
+    manager.journal = None
+    trade_randomly(manager, 2, 200, 10000)
+    trade_randomly(recovered, 2, 200, 10000)
+    assert manager_state(recovered, timestamps=False) == manager_state(manager, timestamps=False)
+    recovered.journal.close()
+
+def test_recover_from_checkpoint_and_tail(tmp_path, journal_path):
+    checkpoint_path = str(tmp_path / "books.ckpt")
+    manager = journaled_manager(journal_path, sync="flush")
+    trade_randomly(manager, 3, 1000)
+    manager.save_checkpoint(checkpoint_path)
+    trade_randomly(manager, 4, 500, 10000)
+    manager.journal.close()
+
+    recovered = OrderBookManager.recover(journal_path, checkpoint_path)
+    assert manager_state(recovered) == manager_state(manager)
+    recovered.journal.close()
+
+def test_torn_tail_is_discarded(journal_path):
+    manager = journaled_manager(journal_path)
+    trade_randomly(manager, 5, 300)
+    manager.journal.close()
+    expected = manager_state(manager)
+    with open(journal_path, 'ab') as stream:
+        stream.write(b'\x01' * 30)
+
+    recovered = OrderBookManager.recover(journal_path)
+    assert manager_state(recovered) == expected
+    recovered.process_order(Order(99999, "limit", "buy", Decimal("90.00"), 1, "AAPL"))
+    recovered.journal.close()
+    assert list(read_journal(journal_path))[-1].order_id == 99999
+
+def test_rejected_operations_are_not_journaled(journal_path):
+    manager = journaled_manager(journal_path)
+    with pytest.raises(InvalidOrderException):
+        manager.process_order(Order("abc", "limit", "buy", Decimal("100.00"), 10, "AAPL"))
+    with pytest.raises(InvalidTickSizeException):
+        manager.process_order(Order(1, "limit", "buy", Decimal("100.005"), 10, "AAPL"))
+    assert not manager.order_books["AAPL"].orders
+    assert manager.journal.sequence == 2
+    manager.journal.close()
+
+def test_process_orders_batches_are_replayed(journal_path):
+    manager = journaled_manager(journal_path)
+    manager.process_orders(OrderBatch([1, 2, 3], ["limit", "limit", "market"], ["sell", "sell", "buy"],
+                                      [10, 10, 15], ticks=[10000, 10001, 0]), symbol="AAPL")
+    manager.journal.close()
+
+    recovered = OrderBookManager.recover(journal_path)
+    assert manager_state(recovered) == manager_state(manager)
+    assert recovered.order_books["AAPL"].orders[2].quantity == 5
+    recovered.journal.close()
+
+def test_group_commit_batches_concurrent_appends(journal_path):
+    manager = journaled_manager(journal_path, commit_delay=0.001)
+
+    def submit(thread_id):
+        for i in range(50):
+            manager.process_order(Order(thread_id * 1000 + i, "limit", "buy", Decimal("99.00"), 1, "AAPL"))
+
+    threads = [threading.Thread(target=submit, args=(thread_id,)) for thread_id in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert manager.journal.durable_sequence == manager.journal.sequence == 402
+    assert manager.journal.commits < 400
+    manager.journal.close()
+
+def test_invalid_journal(tmp_path):
+    path = tmp_path / "not_a_journal"
+    path.write_bytes(b'garbage!' * 4)
+    with pytest.raises(InvalidJournalException):
+        EventJournal(str(path))
+    with pytest.raises(ValueError):
+        EventJournal(str(tmp_path / "events.wal"), sync="sometimes")
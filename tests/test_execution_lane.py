@@ -0,0 +1,107 @@
+import pytest
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from src.execution_lane import ExecutionLane, _STOP
+from src.orderbook_manager import OrderBookManager
+from src.orderbook_server import OrderBookServer
+from src.orderbook_service_pb2 import Order as OrderMessage
+from src.order import Order
+from src.exceptions import OrderNotFoundException
+
+CONFIG = {"server_port": 0, "instruments": {f"SYM{i}": {"tick_size": "0.01"} for i in range(4)}}
+
+@pytest.fixture
+def lane():
+    lane = ExecutionLane("test", batch_size=4)
+    yield lane
+    lane.close()
+
+def test_runs_submissions_in_order_on_one_thread(lane):
+    seen = []
+    futures = [lane.submit(lambda value: (seen.append(value), threading.current_thread().name)[1], value) for value in range(50)]
+    assert {future.result() for future in futures} == {"lane-test"}
+    assert seen == list(range(50))
+    assert lane.call(lambda: lane.call(lambda: 7)) == 7
+
+def test_propagates_exceptions(lane):
+    manager = OrderBookManager()
+    manager.create_order_book("SPY", Decimal("0.01"))
+    with pytest.raises(OrderNotFoundException):
+        lane.call(manager.cancel_order, "SPY", 1)
+    assert lane.call(lambda: "still running") == "still running"
+
+def test_close_drains_pending_work():
+    lane = ExecutionLane("drain")
+    gate = threading.Event()
+    lane.submit(gate.wait)
+    futures = [lane.submit(lambda value: value * 2, value) for value in range(10)]
+    closer = threading.Thread(target=lane.close)
+    closer.start()
+    gate.set()
+    closer.join()
+    assert [future.result() for future in futures] == [value * 2 for value in range(10)]
+    with pytest.raises(RuntimeError):
+        lane.submit(lambda: None)
+
+def test_submit_racing_close_never_strands_a_future():
+    lane = ExecutionLane("race")
+    entered = threading.Event()
+    work_queue = lane._queue
+
+    class PausingQueue:
+        def put(self, item):
+            if item is not _STOP:
+                entered.set()
+                lane._thread.join(timeout=0.5)
+            work_queue.put(item)
+
+    lane._queue = PausingQueue()
+    futures = []
+    submitter = threading.Thread(target=lambda: futures.append(lane.submit(lambda: 7)))
+    submitter.start()
+    entered.wait()
+    lane.close()
+    submitter.join()
+    assert futures[0].result(timeout=1) == 7
+
+def test_unjournaled_writes_to_one_symbol_are_serialized():
+    manager = OrderBookManager()
+    manager.create_order_book("SPY", Decimal("0.01"))
+    orders = [[Order(f"{worker}-{index}", "limit", "buy" if worker % 2 else "sell", Decimal("100.00"), 1, "SPY")
+               for index in range(500)] for worker in range(4)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda batch: [manager.process_order(order)[2] for order in batch], orders))
+    versions = sorted(version for batch in results for version in batch)
+    assert len(set(versions)) == len(versions)
+    assert manager.get_order_book("SPY").current_version == versions[-1]
+
+def test_concurrent_place_order_matches_sequential_book():
+    server = OrderBookServer(CONFIG)
+    rng = random.Random(11)
+    symbols = list(CONFIG["instruments"])
+    flows = {symbol: [] for symbol in symbols}
+    for order_id in range(2000):
+        symbol = rng.choice(symbols)
+        side = rng.choice(["buy", "sell"])
+        flows[symbol].append(OrderMessage(symbol=symbol, order_id=str(order_id), side=side, type="limit",
+                                          price=str(Decimal(rng.randint(9950, 10050)) / 100), quantity=rng.randint(1, 20)))
+
+    def place(messages):
+        return [server.PlaceOrder(message, None).order_id for message in messages]
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(symbols)) as executor:
+            placed = list(executor.map(place, flows.values()))
+    finally:
+        server.close()
+    assert sum(len(ids) for ids in placed) == 2000
+
+    expected = OrderBookManager()
+    for symbol in symbols:
+        expected.create_order_book(symbol, Decimal("0.01"))
+        for message in flows[symbol]:
+            expected.process_order(Order(message.order_id, message.type, message.side, Decimal(message.price),
+                                         message.quantity, symbol))
+        assert server.order_book_manager.get_order_book_snapshot(symbol) == expected.get_order_book_snapshot(symbol)
@@ -0,0 +1,71 @@
+import pytest
+import copy
+import random
+from decimal import Decimal
+import numpy as np
+from src.orderbook import Orderbook
+from src.order import Order
+from src.ticker import Ticker
+from src.fill_estimate import FillEstimate
+from src.exceptions import InvalidQuantityException
+
+def build_orderbook(depth_index):
+    orderbook = Orderbook(Ticker("SPY", "0.01"), depth_index=depth_index)
+    for i, (side, price, quantity) in enumerate([("sell", "100.00", 10), ("sell", "100.00", 5), ("sell", "100.05", 20),
+                                                 ("sell", "100.10", 30), ("buy", "99.90", 5), ("buy", "99.80", 7)]):
+        orderbook.add_order(Order(i, "limit", side, price, quantity, "SPY"))
+    return orderbook
+
+@pytest.fixture(params=[False, True], ids=["walk", "index"])
+def orderbook(request):
+    return build_orderbook(request.param)
+
+def test_estimate_fill(orderbook):
+    version = orderbook.current_version
+    snapshot = orderbook.get_order_book_snapshot(10)
+
+    assert orderbook.estimate_fill("buy", 25) == FillEstimate(25, Decimal("100.02"), Decimal("100.05"), 2, 0)
+    assert orderbook.estimate_fill("sell", 8) == FillEstimate(8, Decimal("99.8625"), Decimal("99.80"), 2, 0)
+    assert orderbook.estimate_fill("sell", 20) == FillEstimate(12, Decimal("99.84166666666666666666666667"), Decimal("99.80"), 2, 8)
+    assert orderbook.current_version == version
+    assert orderbook.get_order_book_snapshot(10) == snapshot
+
+    with pytest.raises(InvalidQuantityException):
+        orderbook.estimate_fill("buy", 0)
+
+def test_estimate_fill_to_price(orderbook):
+    assert orderbook.estimate_fill_to_price("buy", Decimal("100.05")) == FillEstimate(35, Decimal("100.0285714285714285714285714"), Decimal("100.05"), 2, 0)
+    assert orderbook.estimate_fill_to_price("buy", Decimal("100.05"), 12) == FillEstimate(12, Decimal("100.00"), Decimal("100.00"), 1, 0)
+    assert orderbook.estimate_fill_to_price("buy", Decimal("100.05"), 50).shortfall == 15
+    assert orderbook.estimate_fill_to_price("sell", Decimal("100.00")) == FillEstimate(0, None, None, 0, 0)
+
+def test_empty_side():
+    orderbook = Orderbook(Ticker("SPY", "0.01"), depth_index=True)
+    assert orderbook.estimate_fill("buy", 5) == FillEstimate(0, None, None, 0, 5)
+    estimates = orderbook.estimate_fills("buy", [1, 2])
+    assert estimates.shortfall.tolist() == [1, 2]
+    assert np.isnan(estimates.average_price).all()
+
+def test_estimates_match_execution():
+    rng = random.Random(5)
+    orderbook = build_orderbook(True)
+    for order_id in range(10, 400):
+        side = rng.choice(["buy", "sell"])
+        price = Decimal(rng.randint(9950, 9990) if side == "buy" else rng.randint(10010, 10050)) / 100
+        orderbook.add_order(Order(order_id, "limit", side, price, rng.randint(1, 100), "SPY"))
+
+    quantities = [1, 7, 150, 999, 5000, 10**6]
+    for side in ("buy", "sell"):
+        estimates = orderbook.estimate_fills(side, quantities)
+        for row, quantity in enumerate(quantities):
+            estimate = orderbook.estimate_fill(side, quantity)
+            _, fills = copy.deepcopy(orderbook).add_order(Order(-1, "market", side, None, quantity, "SPY"))
+
+            filled = sum(fill[1] for fill in fills)
+            assert estimate.filled_quantity == filled == estimates.filled_quantity[row]
+            assert estimate.average_price == sum(fill[1] * fill[2] for fill in fills) / filled
+            assert estimate.worst_price == fills[-1][2]
+            assert estimate.levels_consumed == len({fill[2] for fill in fills}) == estimates.levels_consumed[row]
+            assert estimate.shortfall == quantity - filled == estimates.shortfall[row]
+            assert estimates.average_price[row] == pytest.approx(float(estimate.average_price))
+            assert estimates.worst_price[row] == pytest.approx(float(estimate.worst_price))
@@ -0,0 +1,92 @@
+import pytest
+import numpy as np
+from decimal import Decimal
+from src.ingest import (read_csv, write_binary, read_binary, read_binary_ticker, read_ahead, feed,
+                        EVENT_DTYPE)
+from src.event_journal import OP_LIMIT, OP_MARKET, OP_CANCEL, OP_MODIFY
+from src.orderbook import Orderbook
+from src.compact_orderbook import CompactOrderbook
+from src.order import Order
+from src.ticker import Ticker
+from src.exceptions import InvalidEventFileException, OrderNotFoundException
+
+CSV = """timestamp,op,side,order_id,price,quantity
+1.5,limit,buy,1,99.98,10
+1.6,limit,sell,2,100.02,5
+1.7,limit,sell,3,100.01,7
+1.8,market,buy,4,,9
+1.9,modify,,2,,3
+2.0,cancel,,3,,
+2.1,cancel,,99,,
+2.2,limit,buy,5,100.02,4
+"""
+
+@pytest.fixture
+def ticker():
+    return Ticker("SPY", "0.01")
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "events.csv"
+    path.write_text(CSV)
+    return str(path)
+
+def test_read_csv_produces_typed_events(csv_path, ticker):
+    chunks = list(read_csv(csv_path, ticker, chunk_size=3))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 2]
+    events = np.concatenate(chunks)
+    assert events.dtype == EVENT_DTYPE
+    assert events['op'].tolist() == [OP_LIMIT, OP_LIMIT, OP_LIMIT, OP_MARKET, OP_MODIFY, OP_CANCEL, OP_CANCEL, OP_LIMIT]
+    assert events['side'].tolist()[:4] == [0, 1, 1, 0]
+    assert events['tick'].tolist()[:4] == [9998, 10002, 10001, 0]
+    assert events['quantity'].tolist() == [10, 5, 7, 9, 3, 0, 0, 4]
+    assert events['timestamp'][0] == 1.5
+
+def test_binary_round_trip_in_chunks(tmp_path, csv_path, ticker):
+    path = str(tmp_path / "events.bin")
+    assert write_binary(path, ticker, read_csv(csv_path, ticker, chunk_size=2)) == 8
+    assert read_binary_ticker(path).tick_size == Decimal("0.01")
+    expected = np.concatenate(list(read_csv(csv_path, ticker)))
+    for chunk_size in (1, 3, 100):
+        chunks = list(read_binary(path, chunk_size))
+        assert max(len(chunk) for chunk in chunks) <= chunk_size
+        assert (np.concatenate(chunks) == expected).all()
+
+@pytest.mark.parametrize("book_class", [Orderbook, CompactOrderbook])
+def test_feed_matches_order_by_order_processing(csv_path, ticker, book_class):
+    orderbook = book_class(ticker)
+    result = feed(orderbook, read_ahead(read_csv(csv_path, ticker, chunk_size=3), depth=1))
+    assert result == (8, 2)
+
+    expected = book_class(ticker)
+    expected.add_order(Order(1, "limit", "buy", Decimal("99.98"), 10, "SPY"))
+    expected.add_order(Order(2, "limit", "sell", Decimal("100.02"), 5, "SPY"))
+    expected.add_order(Order(3, "limit", "sell", Decimal("100.01"), 7, "SPY"))
+    expected.add_order(Order(4, "market", "buy", None, 9, "SPY"))
+    expected.modify_order(2, 3)
+    with pytest.raises(OrderNotFoundException):
+        expected.cancel_order(3)
+    expected.add_order(Order(5, "limit", "buy", Decimal("100.02"), 4, "SPY"))
+    assert orderbook.get_order_book_snapshot(10) == expected.get_order_book_snapshot(10)
+    assert orderbook.current_version == expected.current_version
+
+def test_read_ahead_propagates_errors():
+    def chunks():
+        yield np.zeros(2, dtype=EVENT_DTYPE)
+        raise InvalidEventFileException("broken")
+
+    reader = read_ahead(chunks())
+    assert len(next(reader)) == 2
+    with pytest.raises(InvalidEventFileException):
+        next(reader)
+
+def test_invalid_inputs(tmp_path, ticker):
+    path = tmp_path / "bad.csv"
+    path.write_text("op,side,order_id,price\nlimit,buy,1,100\n")
+    with pytest.raises(InvalidEventFileException):
+        list(read_csv(str(path), ticker))
+    path.write_text("op,side,order_id,price,quantity\nlimit,long,1,100,1\n")
+    with pytest.raises(InvalidEventFileException):
+        list(read_csv(str(path), ticker))
+    with pytest.raises(InvalidEventFileException):
+        list(read_binary(str(path)))
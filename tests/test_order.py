@@ -1,5 +1,5 @@
 from decimal import Decimal
-from src.order import Order
+from src.order import Order, OrderPool
 
 def test_order_creation():
     order = Order(1, "limit", "buy", "100.50", 10, "SPY")
@@ -29,4 +29,27 @@ def test_is_filled():
 def test_market_order():
     order = Order(1, "market", "buy", None, 10, "SPY")
     assert order.price is None
-    assert order.quantity == 10
\ No newline at end of file
+    assert order.quantity == 10
+
+def test_order_has_no_instance_dict():
+    order = Order(1, "limit", "buy", "100.50", 10, "SPY")
+    assert not hasattr(order, "__dict__")
+
+def test_order_pool_recycles_orders():
+    pool = OrderPool(capacity=1)
+    order = pool.acquire(1, "limit", "buy", "100.50", 10, "SPY")
+    order.filled_quantity = 10
+    order.tick = 10050
+    pool.release(order)
+    pool.release(Order(2, "limit", "buy", "100.50", 10, "SPY"))
+    assert len(pool) == 1
+
+    recycled = pool.acquire(3, "limit", "sell", "101.00", 5, "SPY")
+    assert recycled is order
+    assert recycled.id == 3
+    assert recycled.side == "sell"
+    assert recycled.price == Decimal("101.00")
+    assert recycled.quantity == 5
+    assert recycled.filled_quantity == 0
+    assert recycled.tick is None
+    assert len(pool) == 0
@@ -0,0 +1,86 @@
+import pytest
+import random
+from decimal import Decimal
+import numpy as np
+from src.orderbook import Orderbook
+from src.compact_orderbook import CompactOrderbook
+from src.order import Order, OrderPool
+from src.order_batch import OrderBatch
+from src.ticker import Ticker
+from src.exceptions import InvalidOrderException, InvalidQuantityException, InvalidTickSizeException
+
+@pytest.fixture(params=[None, ("90", "110")], ids=["tree", "ladder"])
+def ticker(request):
+    return Ticker("SPY", "0.01", request.param)
+
+def random_flow(seed, count):
+    rng = random.Random(seed)
+    flow = []
+    for order_id in range(count):
+        order_type = "market" if rng.random() > 0.9 else "limit"
+        price = Decimal(rng.randint(9900, 10100)) / 100 if order_type == "limit" else None
+        flow.append((order_id, order_type, rng.choice(["buy", "sell"]), price, rng.randint(1, 50)))
+    return flow
+
+def test_add_orders_matches_single_order_path(ticker):
+    flow = random_flow(7, 2000)
+    reference = Orderbook(ticker)
+    expected = [reference.add_order(Order(*params, "SPY")) for params in flow]
+
+    batched = Orderbook(ticker)
+    result = batched.add_orders([Order(*params, "SPY") for params in flow[:1500]])
+    columns = list(zip(*flow[1500:]))
+    tail = batched.add_orders(OrderBatch(columns[0], columns[1], columns[2], columns[4], prices=columns[3]))
+
+    actual = [(result.order_ids[row], result.for_order(row)) for row in range(len(result.order_ids))]
+    actual += [(tail.order_ids[row], tail.for_order(row)) for row in range(len(tail.order_ids))]
+    assert actual == expected
+    assert batched.get_order_book_snapshot(500) == reference.get_order_book_snapshot(500)
+    assert batched.get_updates_since(0) == reference.get_updates_since(0)
+
+def test_columnar_ticks_and_filled_quantities(ticker):
+    orderbook = Orderbook(ticker, order_pool=OrderPool())
+    orderbook.add_order(Order(1, "limit", "sell", "100.00", 10, "SPY"))
+    orderbook.add_order(Order(2, "limit", "sell", "100.01", 10, "SPY"))
+
+    batch = OrderBatch(np.array([3, 4, 5]), ["limit", "market", "limit"], ["buy", "buy", "buy"],
+                       np.array([4, 12, 3]), ticks=np.array([10000, 0, 9990]))
+    result = orderbook.add_orders(batch)
+
+    assert result.order_ids == [3, 4, 5]
+    assert result.for_order(0) == [(1, 4, Decimal("100.00"))]
+    assert result.for_order(1) == [(1, 6, Decimal("100.00")), (2, 6, Decimal("100.01"))]
+    assert result.filled_quantities().tolist() == [4, 12, 0]
+    assert orderbook.get_order_book_snapshot(1) == {"bids": [(Decimal("99.90"), 3)], "asks": [(Decimal("100.01"), 4)]}
+
+@pytest.mark.parametrize("row, exception", [
+    (dict(quantity=0), InvalidQuantityException),
+    (dict(type="stop"), InvalidOrderException),
+    (dict(side="hold"), InvalidOrderException),
+    (dict(price="100.005"), InvalidTickSizeException),
+])
+def test_add_orders_rejects_whole_batch(ticker, row, exception):
+    orderbook = Orderbook(ticker)
+    params = dict(id=3, type="limit", side="buy", price="100.00", quantity=5)
+    params.update(row)
+    batch = [Order(1, "limit", "sell", "100.00", 5, "SPY"),
+             Order(2, "limit", "buy", "99.00", 5, "SPY"),
+             Order(params["id"], params["type"], params["side"], params["price"], params["quantity"], "SPY")]
+
+    with pytest.raises(exception):
+        orderbook.add_orders(batch)
+    assert not orderbook.orders
+    assert orderbook.current_version == 0
+
+def test_float_prices_are_checked_against_tick_size():
+    ticker = Ticker("SPY", "0.01")
+    assert ticker.to_ticks_array(np.array([100.0, 100.01, 99.99])).tolist() == [10000, 10001, 9999]
+    with pytest.raises(InvalidTickSizeException):
+        ticker.to_ticks_array(np.array([100.0, 100.005]))
+
+def test_compact_orderbook_rejects_batch_with_non_integer_ids():
+    orderbook = CompactOrderbook(Ticker("SPY", "0.01"))
+    with pytest.raises(InvalidOrderException):
+        orderbook.add_orders([Order(1, "limit", "buy", "100.00", 5, "SPY"),
+                              Order("b", "limit", "buy", "100.00", 5, "SPY")])
+    assert not orderbook.orders
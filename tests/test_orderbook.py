@@ -2,14 +2,16 @@ import pytest
 from decimal import Decimal
 import threading
 import time
+import numpy as np
 from src.orderbook import Orderbook
-from src.order import Order
+from src.compact_orderbook import CompactOrderbook
+from src.order import Order, OrderPool
 from src.ticker import Ticker
-from src.exceptions import InvalidOrderException, InsufficientLiquidityException, OrderNotFoundException, InvalidTickSizeException, InvalidQuantityException
+from src.exceptions import InvalidOrderException, InsufficientLiquidityException, OrderNotFoundException, InvalidTickSizeException, InvalidQuantityException, VersionOutOfRangeException
 
-@pytest.fixture
-def orderbook():
-    ticker = Ticker("SPY", "0.01")
+@pytest.fixture(params=[None, ("90", "110")], ids=["tree", "ladder"])
+def orderbook(request):
+    ticker = Ticker("SPY", "0.01", request.param)
     return Orderbook(ticker)
 
 def test_add_limit_order(orderbook):
@@ -17,7 +19,7 @@ def test_add_limit_order(orderbook):
     order_id, filled_orders = orderbook.add_order(order)
     assert order_id == 1
     assert orderbook.orders[order_id] == order
-    assert orderbook.bids.find(Decimal("100.50")).head_order == order
+    assert orderbook.bids.find(orderbook.ticker.to_ticks("100.50")).head_order == order
     assert len(filled_orders) == 0
     assert orderbook.version == 1
     changes = orderbook.get_updates_since(0)
@@ -47,14 +49,14 @@ def test_cancel_order(orderbook):
     order_id, _ = orderbook.add_order(order)
     orderbook.cancel_order(order_id)
     assert order_id not in orderbook.orders
-    assert orderbook.bids.find(Decimal("100.50")) is None
+    assert orderbook.bids.find(orderbook.ticker.to_ticks("100.50")) is None
     assert orderbook.version == 2
     changes = orderbook.get_updates_since(0)
     assert len(changes) == 2
     assert changes[1]['action'] == 'delete'
     assert changes[1]['side'] == 'buy'
     assert changes[1]['price'] == Decimal("100.50")
-    assert changes[1]['quantity'] == 10
+    assert changes[1]['quantity'] == 0
 
 def test_cancel_nonexistent_order(orderbook):
     with pytest.raises(OrderNotFoundException):
@@ -90,8 +92,9 @@ def test_clear_changes(orderbook):
     orderbook.add_order(order)
     assert orderbook.version == 1
     orderbook.clear_changes()
-    changes = orderbook.get_updates_since(0)
-    assert len(changes) == 0
+    with pytest.raises(VersionOutOfRangeException):
+        orderbook.get_updates_since(0)
+    assert orderbook.get_updates_since(1) == []
 
 def test_get_updates_since(orderbook):
     order1 = Order(1, "limit", "buy", "100.50", "10", "SPY")
@@ -130,7 +133,159 @@ def test_process_market_order(orderbook):
     assert order_id == 2
     assert len(filled_orders) == 1
     assert filled_orders[0] == (1, 5, Decimal("100.50"))
-    assert orderbook.current_version == 3  # 1 for sell order, 1 for buy order, 1 for partial fill
+    assert orderbook.current_version == 2
+    change = orderbook.get_updates_since(1)[0]
+    assert (change['action'], change['side'], change['price'], change['quantity']) == ('update', 'sell', Decimal("100.50"), 5)
+
+def test_limit_orders_match_on_ticks(orderbook):
+    orderbook.add_order(Order(1, "limit", "buy", "100.40", "10", "SPY"))
+    orderbook.add_order(Order(2, "limit", "buy", "100.50", "10", "SPY"))
+    sell_order = Order(3, "limit", "sell", "100.45", "15", "SPY")
+    order_id, filled_orders = orderbook.add_order(sell_order)
+
+    assert sell_order.tick == 10045
+    assert filled_orders == [(2, 10, Decimal("100.50"))]
+    assert orderbook.best_bid_ask == (Decimal("100.40"), Decimal("100.45"))
+    assert orderbook.asks.find(10045).total_volume == 5
+
+def test_best_bid_ask_after_cancel(orderbook):
+    orderbook.add_order(Order(1, "limit", "buy", "100.40", "10", "SPY"))
+    orderbook.add_order(Order(2, "limit", "buy", "100.50", "10", "SPY"))
+    orderbook.cancel_order(2)
+    assert orderbook.best_bid == Decimal("100.40")
+    assert orderbook.best_ask is None
+
+def test_order_pool_receives_filled_and_cancelled_orders():
+    pool = OrderPool()
+    orderbook = Orderbook(Ticker("SPY", "0.01"), order_pool=pool)
+    orderbook.add_order(pool.acquire(1, "limit", "sell", "100.50", 10, "SPY"))
+    orderbook.add_order(pool.acquire(2, "limit", "sell", "100.60", 10, "SPY"))
+    assert len(pool) == 0
+
+    orderbook.add_order(pool.acquire(3, "market", "buy", None, 10, "SPY"))
+    assert len(pool) == 2
+
+    orderbook.cancel_order(2)
+    assert len(pool) == 3
+    assert not orderbook.orders
+
+def test_order_pool_leaves_caller_orders_alone():
+    pool = OrderPool()
+    orderbook = Orderbook(Ticker("SPY", "0.01"), order_pool=pool)
+    resting = Order(1, "limit", "sell", "100.50", 10, "SPY")
+    cancelled = Order(2, "limit", "sell", "100.60", 10, "SPY")
+    aggressor = Order(3, "market", "buy", None, 10, "SPY")
+    for order in (resting, cancelled, aggressor):
+        orderbook.add_order(order)
+    orderbook.cancel_order(2)
+    assert len(pool) == 0
+
+    orderbook.add_order(pool.acquire(4, "limit", "buy", "100.00", 5, "SPY"))
+    orderbook.add_order(pool.acquire(5, "limit", "sell", "100.00", 5, "SPY"))
+    assert len(pool) == 2
+    assert pool.acquire(6, "limit", "buy", "99.00", 1, "SPY") not in (resting, cancelled, aggressor)
+    assert (resting.id, resting.quantity, cancelled.id, aggressor.id) == (1, 0, 2, 3)
+
+def test_get_updates_since_reports_evicted_versions():
+    orderbook = Orderbook(Ticker("SPY", "0.01"), journal_capacity=2)
+    for i in range(1, 4):
+        orderbook.add_order(Order(i, "limit", "buy", "100.50", "10", "SPY"))
+
+    assert [update['version'] for update in orderbook.get_updates_since(1)] == [2, 3]
+    with pytest.raises(VersionOutOfRangeException):
+        orderbook.get_updates_since(0)
+
+def test_sweeping_whole_levels_matches_walking_orders(orderbook):
+    walking = Orderbook(orderbook.ticker)
+    walking._match_orders_at_level = walking._walk_level
+    for book in (orderbook, walking):
+        for i, price in enumerate(["100.50", "100.50", "100.60", "100.70", "100.70"]):
+            book.add_order(Order(i, "limit", "sell", price, 10 + i, "SPY"))
+
+    swept = [orderbook.orders[0], orderbook.orders[1], orderbook.orders[2]]
+    expected = walking.add_order(Order(5, "limit", "buy", "100.70", 45, "SPY"))
+    assert orderbook.add_order(Order(5, "limit", "buy", "100.70", 45, "SPY")) == expected
+    assert expected[1][:3] == [(0, 10, Decimal("100.50")), (1, 11, Decimal("100.50")), (2, 12, Decimal("100.60"))]
+    assert all(order.parent_level is None and order.quantity == 0 for order in swept)
+    assert sorted(orderbook.orders) == sorted(walking.orders) == [3, 4]
+    assert orderbook.get_order_book_snapshot(5) == walking.get_order_book_snapshot(5)
+    assert orderbook.get_updates_since(0) == walking.get_updates_since(0)
+
+@pytest.mark.parametrize("depth_index", [False, True])
+def test_clone_is_independent(orderbook, depth_index):
+    orderbook = Orderbook(orderbook.ticker, depth_index=depth_index)
+    for i, (side, price) in enumerate([("buy", "100.40"), ("buy", "100.40"), ("buy", "100.30"),
+                                        ("sell", "100.50"), ("sell", "100.60"), ("sell", "100.60")]):
+        orderbook.add_order(Order(i, "limit", side, price, 10 + i, "SPY"))
+
+    clone = orderbook.clone()
+    assert clone.get_order_book_snapshot(5) == orderbook.get_order_book_snapshot(5)
+    assert clone.get_updates_since(0) == orderbook.get_updates_since(0)
+    assert clone.orders.keys() == orderbook.orders.keys()
+    assert all(clone.orders[i] is not orderbook.orders[i] for i in clone.orders)
+
+    snapshot = orderbook.get_order_book_snapshot(5)
+    _, fills = clone.add_order(Order(10, "market", "buy", None, 20, "SPY"))
+    assert fills == [(3, 13, Decimal("100.50")), (4, 7, Decimal("100.60"))]
+    clone.cancel_order(0)
+    clone.modify_order(2, 1)
+    assert orderbook.get_order_book_snapshot(5) == snapshot
+    assert orderbook.current_version == 6
+    assert clone.estimate_fill("sell", 12) == (12, Decimal("100.3916666666666666666666667"), Decimal("100.30"), 2, 0)
+    assert orderbook.estimate_fill("sell", 12) == (12, Decimal("100.40"), Decimal("100.40"), 1, 0)
+
+def test_sweep_emits_one_delta_per_level(orderbook):
+    for order_id in range(50):
+        orderbook.add_order(Order(order_id, "limit", "sell", Decimal("100.50") + Decimal(order_id % 5) / 100, 10, "SPY"))
+    orderbook.add_order(Order(99, "limit", "buy", "100.00", 7, "SPY"))
+    version = orderbook.current_version
+
+    _, filled_orders = orderbook.add_order(Order(100, "limit", "buy", "100.53", 450, "SPY"))
+    assert len(filled_orders) == 40
+    changes = orderbook.get_updates_since(version)
+    assert [(change['action'], change['side'], change['price'], change['quantity']) for change in changes] == [
+        ('delete', 'sell', Decimal("100.50"), 0), ('delete', 'sell', Decimal("100.51"), 0),
+        ('delete', 'sell', Decimal("100.52"), 0), ('delete', 'sell', Decimal("100.53"), 0),
+        ('add', 'buy', Decimal("100.53"), 50)]
+
+    _, filled_orders = orderbook.add_order(Order(101, "market", "sell", None, 20, "SPY"))
+    assert orderbook.get_updates_since(version + 5) == [
+        {'version': version + 6, 'action': 'update', 'side': 'buy', 'price': Decimal("100.53"), 'quantity': 30}]
+
+@pytest.mark.parametrize("book_class", [Orderbook, CompactOrderbook])
+def test_level_deltas_rebuild_the_book(orderbook, book_class):
+    orderbook = book_class(orderbook.ticker)
+    rng = np.random.default_rng(42)
+    levels = {}
+    for order_id in range(2000):
+        version = orderbook.current_version
+        operation = rng.integers(0, 10) if orderbook.orders else 0
+        if operation < 6:
+            side = "buy" if rng.integers(0, 2) else "sell"
+            if operation == 5:
+                orderbook.add_order(Order(order_id, "market", side, None, int(rng.integers(1, 200)), "SPY"))
+            else:
+                tick = int(rng.integers(9990, 10010))
+                orderbook.add_order(Order(order_id, "limit", side, Decimal(tick) / 100, int(rng.integers(1, 50)), "SPY"))
+        elif operation < 8:
+            orderbook.cancel_order(int(rng.choice(list(orderbook.orders))))
+        else:
+            orderbook.modify_order(int(rng.choice(list(orderbook.orders))), int(rng.integers(1, 50)))
+
+        changes = orderbook.get_updates_since(version)
+        touched = [(change['side'], change['price']) for change in changes]
+        assert len(touched) == len(set(touched))
+        for change in changes:
+            key = (change['side'], change['price'])
+            assert (key in levels) == (change['action'] != 'add')
+            if change['action'] == 'delete':
+                assert change['quantity'] == 0
+                del levels[key]
+            else:
+                levels[key] = change['quantity']
+        snapshot = orderbook.get_order_book_snapshot(100)
+        assert levels == {**{("buy", price): quantity for price, quantity in snapshot["bids"]},
+                          **{("sell", price): quantity for price, quantity in snapshot["asks"]}}
 
 if __name__ == '__main__':
     pytest.main()
\ No newline at end of file
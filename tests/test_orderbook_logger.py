@@ -0,0 +1,46 @@
+import io
+import json
+import logging
+import pytest
+from src.orderbook import Orderbook
+from src.order import Order
+from src.ticker import Ticker
+from src.orderbook_logger import (OrderBookLogger, JsonLinesLogSink, TextLogSink, configure_logging,
+                                  shutdown_logging, LOGGER_NAME)
+
+@pytest.fixture
+def stream():
+    stream = io.StringIO()
+    yield stream
+    configure_logging(level=logging.INFO)
+
+def test_json_lines_sink_records_changes(stream):
+    configure_logging(JsonLinesLogSink(stream), level=logging.INFO)
+    orderbook = Orderbook(Ticker("SPY", "0.01"))
+    orderbook.add_order(Order(1, "limit", "buy", "100.50", 10, "SPY"))
+    orderbook.cancel_order(1)
+    shutdown_logging()
+
+    entries = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [(entry['action'], entry['side'], entry['quantity'], entry['price']) for entry in entries] == [
+        ('ADD', 'buy', 10, '100.50'), ('DELETE', 'buy', 0, '100.50')]
+    assert entries[0]['logger'] == f"{LOGGER_NAME}.SPY"
+
+def test_books_for_same_symbol_share_one_handler(stream):
+    configure_logging(TextLogSink(stream), level=logging.INFO)
+    first = Orderbook(Ticker("SPY", "0.01"))
+    Orderbook(Ticker("SPY", "0.01"))
+    first.add_order(Order(1, "limit", "buy", "100.50", 10, "SPY"))
+    shutdown_logging()
+
+    assert stream.getvalue().count("SPY - ADD: buy 10 @ 100.50") == 1
+    assert not logging.getLogger(f"{LOGGER_NAME}.SPY").handlers
+
+def test_disabled_level_skips_logging(stream):
+    configure_logging(TextLogSink(stream), level=logging.WARNING)
+    orderbook = Orderbook(Ticker("SPY", "0.01"))
+    assert not orderbook.logger.is_enabled()
+    orderbook.add_order(Order(1, "limit", "buy", "100.50", 10, "SPY"))
+    shutdown_logging()
+
+    assert stream.getvalue() == ""
@@ -2,6 +2,7 @@ import pytest
 from decimal import Decimal
 from src.orderbook_manager import OrderBookManager
 from src.order import Order
+from src.exceptions import VersionOutOfRangeException
 
 @pytest.fixture
 def manager():
@@ -37,7 +38,7 @@ def test_process_market_order(manager):
     assert order_id == "2"
     assert len(filled_orders) == 1
     assert filled_orders[0][1] == 50  # Quantity filled
-    assert version == 3  # 1 for limit order, 1 for market order, 1 for partial fill
+    assert version == 2
 
 def test_get_order_book_snapshot(manager):
     order = Order("1", "limit", "buy", Decimal("150.00"), 100, "AAPL")
@@ -74,9 +75,9 @@ def test_get_order_book_update(manager):
 
     # Check that we get only the new update
     latest_updates, latest_version = manager.get_order_book_update("AAPL")
-    assert len(latest_updates) == 1
-    assert latest_updates[0]['action'] == 'add' and latest_updates[0]['side'] == 'buy'
-    assert latest_version == 3
+    assert [(update['action'], update['side'], update['price'], update['quantity']) for update in latest_updates] == [
+        ('delete', 'sell', Decimal("151.00"), 0), ('add', 'buy', Decimal("152.00"), 25)]
+    assert latest_version == 4
 
 def test_get_order_book_snapshot_clears_changes(manager):
     order = Order("1", "limit", "buy", Decimal("150.00"), 100, "AAPL")
@@ -111,5 +112,33 @@ def test_multiple_symbols(manager):
     assert googl_snapshot["bids"][0] == (Decimal("2500.00"), 10)
     assert googl_version == 1
 
+def test_get_order_book_update_resyncs_after_gap(manager):
+    manager.process_order(Order("1", "limit", "buy", Decimal("150.00"), 100, "AAPL"))
+    manager.get_order_book("AAPL").clear_changes()
+    manager.process_order(Order("2", "limit", "buy", Decimal("150.00"), 100, "AAPL"))
+
+    with pytest.raises(VersionOutOfRangeException):
+        manager.get_order_book_update("AAPL")
+
+    updates, version = manager.get_order_book_update("AAPL")
+    assert updates == []
+    assert version == 2
+
+def test_process_orders_groups_by_symbol(manager):
+    manager.create_order_book("MSFT", Decimal("0.01"))
+    results = manager.process_orders([
+        Order("1", "limit", "sell", Decimal("150.00"), 100, "AAPL"),
+        Order("2", "limit", "sell", Decimal("300.00"), 10, "MSFT"),
+        Order("3", "market", "buy", None, 40, "AAPL"),
+        Order("4", "limit", "buy", Decimal("1.00"), 10, "UNKNOWN"),
+    ])
+
+    assert set(results) == {"AAPL", "MSFT"}
+    fills, version = results["AAPL"]
+    assert fills.order_ids == ["1", "3"]
+    assert fills.for_order(1) == [("1", 40, Decimal("150.00"))]
+    assert version == manager.get_order_book("AAPL").current_version
+    assert results["MSFT"][0].filled_quantities().tolist() == [0]
+
 if __name__ == '__main__':
-    pytest.main()
\ No newline at end of file
+    pytest.main()
@@ -0,0 +1,202 @@
+import pytest
+import queue
+from concurrent import futures
+from decimal import Decimal
+import grpc
+from src.orderbook_server import OrderBookServer, OrderBookServerV2, add_servicer_to_server
+from src.orderbook_client import OrderEntrySession
+from src import orderbook_service_v2_pb2 as pb2_v2
+from src.orderbook_service_pb2 import SubscriptionRequest, Order, OrderBookUpdate, Side, Action
+from src.order import Order as BookOrder
+from src.orderbook_service_pb2_grpc import OrderBookServiceStub, add_OrderBookServiceServicer_to_server
+from src.orderbook_service_v2_pb2_grpc import OrderBookServiceStub as OrderBookServiceStubV2, \
+    add_OrderBookServiceServicer_to_server as add_v2_servicer_to_server
+
+CONFIG = {"server_port": 0, "instruments": {"AAPL": {"tick_size": "0.01"}, "BOND": {"tick_size": "0.25"}}}
+
+@pytest.fixture
+def servers():
+    server = OrderBookServer(CONFIG)
+    yield server, OrderBookServerV2(server=server)
+    server.close()
+
+def subscribe(servicer, symbol):
+    requests = queue.Queue()
+    requests.put(SubscriptionRequest(symbol=symbol, subscribe=True))
+    return requests, servicer.SubscribeOrderBook(iter(requests.get, None), None)
+
+def test_v2_orders_and_market_data_match_v1(servers):
+    v1, v2 = servers
+    v1_requests, v1_stream = subscribe(v1, "BOND")
+    v2_requests, v2_stream = subscribe(v2, "BOND")
+    assert next(v2_stream).tick_size == "0.25"
+    next(v1_stream)
+
+    response = v2.PlaceOrder(pb2_v2.Order(symbol="BOND", order_id=1, side=pb2_v2.BUY, type=pb2_v2.LIMIT,
+                                          price_ticks=398, quantity=10), None)
+    assert (response.order_id, response.status) == (1, pb2_v2.PLACED)
+    v1.PlaceOrder(Order(symbol="BOND", order_id="2", side="sell", type="limit", price="100.25", quantity=4), None)
+
+    v1_changes = []
+    while len(v1_changes) < 2:
+        v1_changes.extend(next(v1_stream).changes)
+    v2_changes = []
+    while len(v2_changes) < 2:
+        update = next(v2_stream)
+        v2_changes.extend(zip(update.change_sides, update.change_actions, update.change_ticks, update.change_quantities))
+    assert [(change.side == Side.ASK, Action.Name(change.action), Decimal(change.price), change.quantity)
+            for change in v1_changes] == \
+           [(side == pb2_v2.SELL, pb2_v2.Action.Name(action), tick * Decimal("0.25"), quantity)
+            for side, action, tick, quantity in v2_changes]
+
+    v1_snapshot, v2_snapshot = v1._create_snapshot("BOND"), v2._create_snapshot("BOND")
+    assert [(Decimal(level.price), level.quantity) for level in v1_snapshot.bids] == \
+           [(tick * Decimal("0.25"), quantity) for tick, quantity in zip(v2_snapshot.bid_ticks, v2_snapshot.bid_quantities)]
+    assert list(v2_snapshot.ask_ticks) == [401] and list(v2_snapshot.ask_quantities) == [4]
+    v1_requests.put(None)
+    v2_requests.put(None)
+
+def test_order_entry_fills_against_v1_string_ids(servers):
+    v1, v2 = servers
+    v1.PlaceOrder(Order(symbol="AAPL", order_id="abc", side="sell", type="limit", price="100.00", quantity=5), None)
+    v1.PlaceOrder(Order(symbol="AAPL", order_id="7", side="sell", type="limit", price="100.00", quantity=5), None)
+    request = pb2_v2.OrderRequest(client_sequence=1, request_type=pb2_v2.NEW_ORDER, symbol="AAPL", order_id=1,
+                                  side=pb2_v2.BUY, type=pb2_v2.LIMIT, price_ticks=10000, quantity=8)
+    report, = v2._submit_requests("AAPL", [request]).result(timeout=5)
+    assert report.status == pb2_v2.PLACED
+    assert list(zip(report.fill_order_ids, report.fill_quantities, report.fill_ticks)) == [(-1, 5, 10000), (7, 3, 10000)]
+
+def test_order_entry_rejects_invalid_requests_in_batch(servers):
+    _, v2 = servers
+    order = dict(symbol="AAPL", side=pb2_v2.BUY, type=pb2_v2.LIMIT, price_ticks=9900, quantity=2)
+    requests = [pb2_v2.OrderRequest(client_sequence=1, request_type=pb2_v2.NEW_ORDER, order_id=1, **order),
+                pb2_v2.OrderRequest(client_sequence=2, request_type=pb2_v2.NEW_ORDER, order_id=2, **dict(order, side=7)),
+                pb2_v2.OrderRequest(client_sequence=3, order_id=1, symbol="AAPL", quantity=5),
+                pb2_v2.OrderRequest(client_sequence=4, request_type=pb2_v2.NEW_ORDER, order_id=3, **dict(order, type=9)),
+                pb2_v2.OrderRequest(client_sequence=5, request_type=pb2_v2.MODIFY_ORDER, order_id=1, symbol="AAPL",
+                                    quantity=5)]
+    reports = v2._submit_requests("AAPL", requests).result(timeout=5)
+    assert [(report.client_sequence, report.status) for report in reports] == \
+           [(1, pb2_v2.PLACED), (2, pb2_v2.REJECTED), (3, pb2_v2.REJECTED), (4, pb2_v2.REJECTED), (5, pb2_v2.MODIFIED)]
+    assert [reports[1].reason, reports[2].reason, reports[3].reason] == \
+           ["Invalid side 7", "Invalid request type 0", "Invalid order type 9"]
+    assert list(v2._create_snapshot("AAPL").bid_quantities) == [5]
+
+def test_v2_rejects_unknown_symbol(servers):
+    _, v2 = servers
+    response = v2.PlaceOrder(pb2_v2.Order(symbol="NOPE", order_id=7, side=pb2_v2.SELL, type=pb2_v2.MARKET, quantity=1), None)
+    assert (response.order_id, response.status) == (7, pb2_v2.REJECTED)
+
+def test_v2_rejects_unspecified_enums(servers):
+    _, v2 = servers
+    response = v2.PlaceOrder(pb2_v2.Order(symbol="AAPL", order_id=8, type=pb2_v2.LIMIT, price_ticks=10000, quantity=1), None)
+    assert (response.order_id, response.status) == (8, pb2_v2.REJECTED)
+    response = v2.PlaceOrder(pb2_v2.Order(symbol="AAPL", order_id=9, side=pb2_v2.BUY, price_ticks=10000, quantity=1), None)
+    assert (response.order_id, response.status) == (9, pb2_v2.REJECTED)
+    assert v2._create_snapshot("AAPL").bid_ticks == []
+
+@pytest.fixture
+def loopback(servers):
+    v1, v2 = servers
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    add_OrderBookServiceServicer_to_server(v1, server)
+    add_v2_servicer_to_server(v2, server)
+    port = server.add_insecure_port('127.0.0.1:0')
+    server.start()
+    yield v1, port
+    server.stop(None)
+
+def test_both_schemas_share_books_over_loopback(loopback):
+    v1, port = loopback
+    with grpc.insecure_channel(f'127.0.0.1:{port}') as channel:
+        stub = OrderBookServiceStubV2(channel)
+        instruments = stub.ListInstruments(pb2_v2.InstrumentsRequest()).instruments
+        assert {(instrument.symbol, instrument.tick_size) for instrument in instruments} == {("AAPL", "0.01"), ("BOND", "0.25")}
+        stub.PlaceOrder(pb2_v2.Order(symbol="AAPL", order_id=1, side=pb2_v2.SELL, type=pb2_v2.LIMIT, price_ticks=15001, quantity=3))
+    snapshot, _ = v1.order_book_manager.get_order_book_snapshot("AAPL")
+    assert snapshot["asks"] == [(Decimal("150.01"), 3)]
+
+def test_order_entry_stream_pipelines_requests(loopback):
+    v1, port = loopback
+    with grpc.insecure_channel(f'127.0.0.1:{port}') as channel:
+        with OrderEntrySession(OrderBookServiceStubV2(channel), max_batch=16) as session:
+            quotes = [session.place_order("AAPL", order_id, "sell", "limit", 10000 + order_id % 5, 10) for order_id in range(100)]
+            sweep = session.place_order("AAPL", 1000, "buy", "limit", 10001, 25)
+            modify = session.modify_order("AAPL", 2, 4)
+            cancel = session.cancel_order("AAPL", 3)
+            missing = session.cancel_order("AAPL", 3)
+            unknown = session.place_order("NOPE", 2000, "buy", "market", None, 1)
+            reports = [future.result(timeout=5) for future in quotes]
+
+            assert [report.status for report in reports] == [pb2_v2.PLACED] * 100
+            assert [report.version for report in reports] == list(range(1, 101))
+            fill = sweep.result(timeout=5)
+            assert list(zip(fill.fill_order_ids, fill.fill_quantities, fill.fill_ticks)) == [(0, 10, 10000), (5, 10, 10000), (10, 5, 10000)]
+            assert (modify.result(timeout=5).status, cancel.result(timeout=5).status) == (pb2_v2.MODIFIED, pb2_v2.CANCELLED)
+            assert (missing.result(timeout=5).status, missing.result().reason) == (pb2_v2.REJECTED, "Order not found")
+            assert unknown.result(timeout=5).status == pb2_v2.REJECTED
+
+    snapshot, _ = v1.order_book_manager.get_order_book_snapshot("AAPL")
+    assert snapshot["asks"][:4] == [(Decimal("100.00"), 175), (Decimal("100.01"), 200), (Decimal("100.02"), 194), (Decimal("100.03"), 190)]
+
+def test_replaced_book_does_not_reuse_encoded_snapshots(servers):
+    v1, _ = servers
+    v1.encode_updates = True
+    v1.PlaceOrder(Order(symbol="AAPL", order_id="1", side="buy", type="limit", price="99.50", quantity=10), None)
+    snapshot, version = v1._snapshot_response("AAPL")
+    generation = v1.order_book_manager.get_order_book("AAPL").generation
+
+    v1.order_book_manager.create_order_book("AAPL", Decimal("0.01"))
+    v1.order_book_manager.process_order(BookOrder("2", "limit", "sell", Decimal("101.00"), 3, "AAPL"))
+    assert v1.order_book_manager.get_order_book("AAPL").generation != generation
+    replaced, replaced_version = v1._snapshot_response("AAPL")
+    assert replaced_version == version
+    assert [(level.price, level.quantity) for level in OrderBookUpdate.FromString(replaced).asks] == [("101.00", 3)]
+    assert replaced != snapshot
+
+def test_subscribers_share_encoded_updates(servers):
+    v1, v2 = servers
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=8))
+    add_servicer_to_server(v1, server)
+    add_servicer_to_server(v2, server, pb2_v2)
+    port = server.add_insecure_port('127.0.0.1:0')
+    server.start()
+    try:
+        with grpc.insecure_channel(f'127.0.0.1:{port}') as channel:
+            stub = OrderBookServiceStub(channel)
+            streams = []
+            for _ in range(5):
+                requests = queue.Queue()
+                requests.put(SubscriptionRequest(symbol="AAPL", subscribe=True))
+                streams.append((requests, stub.SubscribeOrderBook(iter(requests.get, None))))
+            snapshots = [next(stream) for _, stream in streams]
+            assert all(snapshot == snapshots[0] for snapshot in snapshots)
+            misses = v1.update_cache.misses
+
+            v1.PlaceOrder(Order(symbol="AAPL", order_id="1", side="buy", type="limit", price="99.50", quantity=10), None)
+            updates = [next(stream) for _, stream in streams]
+            assert all(update == updates[0] for update in updates)
+            assert [(change.price, change.quantity) for change in updates[0].changes] == [("99.50", 10)]
+            assert v1.update_cache.misses - misses == 1
+
+            requests, stream = streams[0]
+            requests.put(SubscriptionRequest(symbol="AAPL", subscribe=False))
+            requests.put(None)
+            assert (next(stream).is_snapshot, next(stream, None)) == (True, None)
+
+            v2_stub = OrderBookServiceStubV2(channel)
+            v2_requests = queue.Queue()
+            v2_requests.put(pb2_v2.SubscriptionRequest(symbol="AAPL", subscribe=True))
+            v2_stream = v2_stub.SubscribeOrderBook(iter(v2_requests.get, None))
+            assert list(next(v2_stream).bid_ticks) == [9950]
+            v2_stub.PlaceOrder(pb2_v2.Order(symbol="AAPL", order_id=2, side=pb2_v2.BUY, type=pb2_v2.LIMIT,
+                                            price_ticks=9960, quantity=5))
+            update = next(v2_stream)
+            assert list(zip(update.change_actions, update.change_ticks, update.change_quantities)) == [(pb2_v2.ADD, 9960, 5)]
+            v2_requests.put(None)
+            v2_stream.cancel()
+            for requests, stream in streams:
+                requests.put(None)
+                stream.cancel()
+    finally:
+        server.stop(None)
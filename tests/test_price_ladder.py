@@ -0,0 +1,95 @@
+import pytest
+from decimal import Decimal
+from src.price_ladder import PriceLadder
+from src.price_level import PriceLevel
+from src.orderbook import Orderbook
+from src.order import Order
+from src.ticker import Ticker
+
+def walk(ladder):
+    prices = []
+    level = ladder.min()
+    while level:
+        prices.append(level.price)
+        level = ladder.next_level(level)
+    return prices
+
+def walk_reverse(ladder):
+    prices = []
+    level = ladder.max()
+    while level:
+        prices.append(level.price)
+        level = ladder.previous_level(level)
+    return prices
+
+def test_ladder_find_or_create_reuses_slots():
+    ladder = PriceLadder(9000, 11000)
+    level = ladder.find_or_create(10050)
+    assert ladder.find(10050) is level
+    ladder.delete(10050)
+    assert ladder.find(10050) is None
+    assert ladder.find_or_create(10050) is level
+    assert len(ladder) == 1
+
+def test_ladder_tracks_best_levels():
+    ladder = PriceLadder(9000, 11000)
+    for price in (10010, 9990, 10020, 9980):
+        ladder.find_or_create(price)
+    assert ladder.min().price == 9980
+    assert ladder.max().price == 10020
+
+    ladder.delete(9980)
+    ladder.delete(10020)
+    assert ladder.min().price == 9990
+    assert ladder.max().price == 10010
+
+    ladder.delete(9990)
+    ladder.delete(10010)
+    assert ladder.min() is None
+    assert ladder.max() is None
+    assert len(ladder) == 0
+
+def test_ladder_falls_back_outside_band():
+    ladder = PriceLadder(9000, 11000)
+    for price in (12000, 10000, 8000, 11000, 9000, 7000, 13000):
+        ladder.find_or_create(price)
+    assert walk(ladder) == [7000, 8000, 9000, 10000, 11000, 12000, 13000]
+    assert walk_reverse(ladder) == [13000, 12000, 11000, 10000, 9000, 8000, 7000]
+    assert ladder.min().price == 7000
+    assert ladder.max().price == 13000
+
+    ladder.delete(7000)
+    ladder.delete(8000)
+    ladder.delete(12000)
+    ladder.delete(13000)
+    assert walk(ladder) == [9000, 10000, 11000]
+    assert len(ladder) == 3
+
+def test_ladder_insert_level():
+    ladder = PriceLadder(9000, 11000)
+    level = PriceLevel(9500)
+    ladder.insert(level)
+    assert ladder.find(9500) is level
+    assert ladder.min() is level
+
+def test_ladder_rejects_inverted_band():
+    with pytest.raises(ValueError):
+        PriceLadder(11000, 9000)
+
+def test_orderbook_uses_ladder_for_band():
+    orderbook = Orderbook(Ticker("SPY", "0.01", ("90", "110")))
+    assert isinstance(orderbook.bids, PriceLadder)
+    assert orderbook.bids.band == (9000, 11000)
+
+    orderbook.add_order(Order(1, "limit", "buy", "100.00", 10, "SPY"))
+    orderbook.add_order(Order(2, "limit", "buy", "80.00", 10, "SPY"))
+    orderbook.add_order(Order(3, "limit", "sell", "120.00", 10, "SPY"))
+    orderbook.add_order(Order(4, "limit", "sell", "100.01", 10, "SPY"))
+
+    snapshot = orderbook.get_order_book_snapshot(5)
+    assert snapshot["bids"] == [(Decimal("100.00"), 10), (Decimal("80.00"), 10)]
+    assert snapshot["asks"] == [(Decimal("100.01"), 10), (Decimal("120.00"), 10)]
+
+    _, filled_orders = orderbook.add_order(Order(5, "market", "buy", None, 15, "SPY"))
+    assert filled_orders == [(4, 10, Decimal("100.01")), (3, 5, Decimal("120.00"))]
+    assert orderbook.best_bid_ask == (Decimal("100.00"), Decimal("120.00"))
@@ -1,6 +1,7 @@
 import pytest
+import random
 from decimal import Decimal
-from src.price_level import PriceLevel
+from src.price_level import PriceLevel, PriceLevelTree
 from src.order import Order
 
 def test_price_level_creation():
@@ -105,4 +106,125 @@ def test_update_order_quantity():
     assert level.total_volume == Decimal('15')
     assert level.order_count == 1
     assert level.head_order == order
-    assert level.tail_order == order
\ No newline at end of file
+    assert level.tail_order == order
+
+def check_red_black(tree):
+    def walk(node, low, high):
+        if node is None:
+            return 1
+        assert low is None or node.price > low
+        assert high is None or node.price < high
+        if node.is_red:
+            assert not (node.left_child and node.left_child.is_red)
+            assert not (node.right_child and node.right_child.is_red)
+        for child in (node.left_child, node.right_child):
+            if child:
+                assert child.parent is node
+        left_height = walk(node.left_child, low, node.price)
+        right_height = walk(node.right_child, node.price, high)
+        assert left_height == right_height
+        return left_height + (0 if node.is_red else 1)
+
+    if tree.root:
+        assert tree.root.parent is None
+        assert not tree.root.is_red
+    walk(tree.root, None, None)
+
+    count = 0
+    node = tree.min()
+    while node:
+        assert tree.find(node.price) is node
+        count += 1
+        node = tree.next_level(node)
+    assert count == len(tree)
+
+def tree_height(node):
+    if node is None:
+        return 0
+    return 1 + max(tree_height(node.left_child), tree_height(node.right_child))
+
+def test_tree_stays_balanced_on_monotonic_ladder():
+    tree = PriceLevelTree()
+    for i in range(1024):
+        tree.insert(PriceLevel(Decimal(i)))
+    check_red_black(tree)
+    assert tree_height(tree.root) <= 2 * 11
+    assert tree.min().price == Decimal(0)
+    assert tree.max().price == Decimal(1023)
+
+def test_tree_delete_keeps_levels_and_order_links():
+    tree = PriceLevelTree()
+    levels = {}
+    for i in range(1, 8):
+        level = PriceLevel(Decimal(i))
+        order = Order(i, "limit", "buy", Decimal(i), 10, "SPY")
+        level.add_order(order)
+        tree.insert(level)
+        levels[i] = level
+
+    tree.delete(tree.root.price)
+    check_red_black(tree)
+    for i, level in levels.items():
+        if tree.find(Decimal(i)):
+            assert tree.find(Decimal(i)) is level
+            assert level.head_order.parent_level is level
+
+def test_tree_random_insert_delete_matches_sorted_reference():
+    rng = random.Random(7)
+    tree = PriceLevelTree()
+    prices = set()
+    for _ in range(2000):
+        price = Decimal(rng.randint(0, 300))
+        if price in prices and rng.random() < 0.6:
+            tree.delete(price)
+            prices.remove(price)
+        elif price not in prices:
+            tree.insert(PriceLevel(price))
+            prices.add(price)
+    check_red_black(tree)
+
+    ordered = sorted(prices)
+    assert tree.min().price == ordered[0]
+    assert tree.max().price == ordered[-1]
+    node = tree.min()
+    walked = []
+    while node:
+        walked.append(node.price)
+        node = tree._successor(node)
+    assert walked == ordered
+
+def test_tree_delete_last_level():
+    tree = PriceLevelTree()
+    tree.insert(PriceLevel(Decimal('100.50')))
+    tree.delete(Decimal('100.50'))
+    assert tree.find(Decimal('100.50')) is None
+    assert len(tree) == 0
+    assert tree.root is None
+    assert tree.min() is None
+    assert tree.max() is None
+
+def test_tree_find_or_create():
+    tree = PriceLevelTree()
+    level = tree.find_or_create(10050)
+    assert tree.find_or_create(10050) is level
+    assert tree.find(10050) is level
+    assert len(tree) == 1
+    tree.delete(10050)
+    tree.delete(10050)
+    assert tree.find(10050) is None
+
+def test_clone_builds_balanced_red_black_tree():
+    for size in list(range(0, 40)) + [255, 256, 1000]:
+        tree = PriceLevelTree()
+        for i in range(size):
+            tree.insert(PriceLevel(i))
+        clone = tree.clone(lambda level: PriceLevel(level.price))
+        check_red_black(clone)
+        assert tree_height(clone.root) == size.bit_length()
+        assert [level.price for level in clone._levels.values()] == list(range(size))
+
+        for i in range(0, size, 3):
+            clone.delete(i)
+        clone.insert(PriceLevel(size + 1))
+        check_red_black(clone)
+        assert len(tree) == size
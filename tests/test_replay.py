@@ -0,0 +1,47 @@
+import json
+import pytest
+from decimal import Decimal
+from src.replay import replay, json_records, load_records, state_hash, main
+from src.orderbook_manager import OrderBookManager
+from src.event_journal import OP_LIMIT, OP_CANCEL
+from src.order import Order
+
+@pytest.fixture
+def data_path(tmp_path):
+    orders = [{"id": i, "side": "buy" if i % 2 else "sell", "price": f"{100 + (i % 7) - 3}.{i % 100:02d}",
+               "quantity": 1 + i % 50} for i in range(1, 401)]
+    operations = ["add", "cancel", "modify", "market", "best_bid_ask", "snapshot"] * 60
+    path = tmp_path / "test_data.json"
+    path.write_text(json.dumps({"orders": orders, "operations": operations}))
+    return str(path)
+
+def test_json_records_pick_cancels_without_repeats(data_path):
+    records = list(json_records(data_path, initial_orders=100))
+    assert sum(record.op == OP_LIMIT for record in records) == 160
+    cancelled = [record.order_id for record in records if record.op == OP_CANCEL]
+    assert len(cancelled) == 60
+    assert len(set(cancelled)) == len(cancelled)
+
+def test_replay_is_deterministic(data_path):
+    first = replay(json_records(data_path, initial_orders=100))
+    second = replay(json_records(data_path, initial_orders=100), OrderBookManager(journal_capacity=None),
+                    measure_latency=False)
+    assert first.state_hash == second.state_hash
+    assert first.events == second.events == 461
+    assert first.rejected == second.rejected
+    assert set(first.latencies) == {"define", "limit", "market", "cancel", "modify", "best_bid_ask", "snapshot"}
+    assert second.latencies == {}
+
+def test_replay_of_event_journal_matches_live_book(tmp_path):
+    journal_path = str(tmp_path / "events.wal")
+    manager = OrderBookManager.recover(journal_path)
+    manager.create_order_book("AAPL", Decimal("0.01"))
+    for order_id in range(200):
+        manager.process_order(Order(order_id, "limit", "buy" if order_id % 3 else "sell",
+                                    Decimal(9990 + order_id % 20) / 100, 10, "AAPL"))
+    manager.cancel_order("AAPL", next(iter(manager.order_books["AAPL"].orders)))
+    manager.journal.close()
+
+    result = main([journal_path, "--no-latency"])
+    assert result.state_hash == state_hash(manager)
+    assert replay(load_records(journal_path)).state_hash == result.state_hash
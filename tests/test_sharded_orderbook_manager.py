@@ -0,0 +1,81 @@
+import pytest
+import random
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from decimal import Decimal
+from src.sharded_orderbook_manager import ShardedOrderBookManager, ConsistentHashRing
+from src.orderbook_manager import OrderBookManager
+from src.order import Order
+from src.order_batch import OrderBatch
+from src.exceptions import InvalidTickSizeException, OrderNotFoundException
+
+SYMBOLS = [f"SYM{i}" for i in range(12)]
+
+@pytest.fixture(scope="module")
+def sharded():
+    with ShardedOrderBookManager(3) as manager:
+        for symbol in SYMBOLS:
+            manager.create_order_book(symbol, Decimal("0.01"))
+        yield manager
+
+def test_ring_is_stable_and_spreads_keys():
+    ring = ConsistentHashRing(4)
+    assert [ring.node_for(symbol) for symbol in SYMBOLS] == [ConsistentHashRing(4).node_for(symbol) for symbol in SYMBOLS]
+    counts = Counter(ring.node_for(f"SYM{i}") for i in range(1000))
+    assert set(counts) == {0, 1, 2, 3}
+    assert min(counts.values()) > 150
+
+    grown = ConsistentHashRing(5)
+    moved = sum(ring.node_for(f"SYM{i}") != grown.node_for(f"SYM{i}") for i in range(1000))
+    assert moved < 350
+
+def test_matches_in_process_manager(sharded):
+    local = OrderBookManager()
+    for symbol in SYMBOLS:
+        local.create_order_book(symbol, Decimal("0.01"))
+    rng = random.Random(7)
+    orders = []
+    for order_id in range(600):
+        order_type = "market" if rng.random() > 0.9 else "limit"
+        price = Decimal(rng.randint(9900, 10100)) / 100 if order_type == "limit" else None
+        orders.append((order_id, order_type, rng.choice(["buy", "sell"]), price, rng.randint(1, 20), rng.choice(SYMBOLS)))
+
+    for fields in orders[:300]:
+        assert sharded.process_order(Order(*fields)) == local.process_order(Order(*fields))
+    batch_results = sharded.process_orders([Order(*fields) for fields in orders[300:]])
+    local_results = local.process_orders([Order(*fields) for fields in orders[300:]])
+    assert batch_results == local_results
+
+    for symbol in SYMBOLS:
+        assert sharded.get_order_book_snapshot(symbol) == local.get_order_book_snapshot(symbol)
+
+def test_columnar_batch_and_order_maintenance(sharded):
+    results = sharded.process_orders(OrderBatch([10001, 10002], ["limit", "limit"], ["buy", "buy"], [5, 6],
+                                                ticks=[5000, 5001]), symbol="SYM0")
+    fills, version = results["SYM0"]
+    assert fills.order_ids == [10001, 10002]
+    assert sharded.modify_order("SYM0", 10001, 2) == version + 1
+    assert sharded.cancel_order("SYM0", 10002) == version + 2
+    with pytest.raises(OrderNotFoundException):
+        sharded.cancel_order("SYM0", 10002)
+
+def test_errors_are_raised_in_caller(sharded):
+    with pytest.raises(InvalidTickSizeException):
+        sharded.process_order(Order(1, "limit", "buy", Decimal("100.001"), 1, "SYM1"))
+    assert sharded.get_order_book_snapshot("SYM1")[1] >= 0
+
+def test_concurrent_callers_get_their_own_replies(sharded):
+    def place(thread_id):
+        symbol = SYMBOLS[thread_id % 3]
+        replies = []
+        for i in range(200):
+            order_id = 20000 + thread_id * 1000 + i
+            if i % 2:
+                replies.append(sharded.process_order(Order(order_id, "limit", "buy", Decimal("1.00"), 1, symbol))[0] == order_id)
+            else:
+                fills, _ = sharded.process_orders([Order(order_id, "limit", "buy", Decimal("1.00"), 1, symbol)])[symbol]
+                replies.append(fills.order_ids == [order_id])
+        return all(replies)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(place, range(8)))
@@ -1,12 +1,18 @@
 import pytest
 from decimal import Decimal
 from src.ticker import Ticker
+from src.exceptions import InvalidTickSizeException
 
 def test_ticker_creation():
     ticker = Ticker("SPY", "0.01")
     assert ticker.symbol == "SPY"
     assert ticker.tick_size == Decimal("0.01")
 
+def test_price_band():
+    assert Ticker("SPY", "0.01").price_band is None
+    ticker = Ticker("SPY", "0.01", ("90", "110"))
+    assert ticker.price_band == (Decimal("90"), Decimal("110"))
+
 def test_valid_price():
     ticker = Ticker("SPY", "0.01")
     assert ticker.is_valid_price("100.00") == True
@@ -17,4 +23,16 @@ def test_invalid_price():
     ticker = Ticker("SPY", "0.05")
     assert ticker.is_valid_price("100.00") == True
     assert ticker.is_valid_price("100.05") == True
-    assert ticker.is_valid_price("100.02") == False
\ No newline at end of file
+    assert ticker.is_valid_price("100.02") == False
+
+def test_to_ticks():
+    ticker = Ticker("SPY", "0.05")
+    assert ticker.to_ticks("100.05") == 2001
+    assert ticker.to_ticks(Decimal("100.00")) == 2000
+    with pytest.raises(InvalidTickSizeException):
+        ticker.to_ticks("100.02")
+
+def test_to_price():
+    ticker = Ticker("SPY", "0.01")
+    assert ticker.to_price(10050) == Decimal("100.50")
+    assert ticker.to_price(ticker.to_ticks("99.99")) == Decimal("99.99")
@@ -0,0 +1,43 @@
+import threading
+import time
+import pytest
+from src.update_cache import EncodedUpdateCache
+
+def test_cache_counts_hits_and_misses():
+    cache = EncodedUpdateCache(4)
+    assert cache.get(("delta", "AAPL", 0, 1)) is None
+    assert cache.put(("delta", "AAPL", 0, 1), b"update") == b"update"
+    assert cache.get(("delta", "AAPL", 0, 1)) == b"update"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_cache_evicts_least_recently_used():
+    cache = EncodedUpdateCache(2)
+    cache.put("a", b"1")
+    cache.put("b", b"2")
+    cache.get("a")
+    cache.put("c", b"3")
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (b"1", b"3")
+
+def test_cache_rejects_non_positive_capacity():
+    with pytest.raises(ValueError):
+        EncodedUpdateCache(0)
+
+def test_concurrent_misses_encode_once():
+    cache = EncodedUpdateCache()
+    calls = []
+
+    def encode():
+        calls.append(1)
+        time.sleep(0.05)
+        return b"snapshot"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_put("key", encode))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [b"snapshot"] * 8
+    assert (len(calls), cache.misses, cache.hits) == (1, 1, 7)
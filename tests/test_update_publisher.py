@@ -0,0 +1,91 @@
+import pytest
+import queue
+import threading
+import time
+from decimal import Decimal
+from src.update_publisher import UpdatePublisher, Subscription
+from src.orderbook_manager import OrderBookManager
+from src.orderbook_server import OrderBookServer
+from src.orderbook_service_pb2 import SubscriptionRequest, Order as OrderMessage
+from src.order import Order
+
+CONFIG = {"server_port": 0, "instruments": {"AAPL": {"tick_size": "0.01"}, "MSFT": {"tick_size": "0.01"}}}
+
+class Stream:
+    def __init__(self, server):
+        self.requests = queue.Queue()
+        self.responses = server.SubscribeOrderBook(iter(self.requests.get, None), None)
+
+    def send(self, symbol, subscribe=True):
+        self.requests.put(SubscriptionRequest(symbol=symbol, subscribe=subscribe))
+
+    def end(self):
+        self.requests.put(None)
+
+@pytest.fixture
+def server():
+    server = OrderBookServer(CONFIG)
+    yield server
+    server.close()
+
+def test_publish_wakes_only_subscribed_subscriptions():
+    publisher = UpdatePublisher()
+    first, second = Subscription(), Subscription()
+    publisher.subscribe("AAPL", first)
+    publisher.subscribe("AAPL", second)
+    publisher.subscribe("MSFT", second)
+    publisher.publish("AAPL")
+    publisher.publish("MSFT")
+    assert first.wait(0) == ([], {"AAPL"})
+    assert second.wait(0) == ([], {"AAPL", "MSFT"})
+
+    publisher.unsubscribe("AAPL", first)
+    publisher.publish("AAPL")
+    assert first.wait(0) == ([], set())
+    assert publisher.subscriber_count("AAPL") == 1
+
+def test_manager_publishes_after_each_mutation():
+    manager = OrderBookManager()
+    manager.create_order_book("AAPL", Decimal("0.01"))
+    subscription = Subscription()
+    manager.publisher.subscribe("AAPL", subscription)
+    manager.process_order(Order(1, "limit", "buy", Decimal("100"), 5, "AAPL"))
+    assert subscription.wait(0) == ([], {"AAPL"})
+    manager.cancel_order("AAPL", 1)
+    assert subscription.wait(0)[1] == {"AAPL"}
+    updates, version = manager.get_updates_since("AAPL", 0)
+    assert [update['action'] for update in updates] == ['add', 'delete']
+    assert version == 2
+
+def test_subscribers_keep_independent_cursors(server):
+    first, second = Stream(server), Stream(server)
+    first.send("AAPL")
+    assert next(first.responses).is_snapshot
+    second.send("AAPL")
+    assert next(second.responses).is_snapshot
+
+    start = time.perf_counter()
+    server.PlaceOrder(OrderMessage(symbol="AAPL", order_id="1", side="buy", type="limit", price="100.00", quantity=5), None)
+    update = next(first.responses)
+    assert time.perf_counter() - start < 0.05
+    assert not update.is_snapshot and update.version == 1
+    assert [(change.price, change.quantity) for change in update.changes] == [("100.00", 5)]
+
+    server.PlaceOrder(OrderMessage(symbol="AAPL", order_id="2", side="sell", type="limit", price="101.00", quantity=3), None)
+    assert next(first.responses).version == 2
+    changes = []
+    while not changes or update.version < 2:
+        update = next(second.responses)
+        changes.extend((change.price, change.quantity) for change in update.changes)
+    assert changes == [("100.00", 5), ("101.00", 3)]
+
+def test_unsubscribe_and_end_of_requests_close_stream(server):
+    stream = Stream(server)
+    stream.send("MSFT")
+    assert next(stream.responses).symbol == "MSFT"
+    stream.send("MSFT", subscribe=False)
+    assert next(stream.responses).version == 0
+    stream.end()
+    with pytest.raises(StopIteration):
+        next(stream.responses)
+    assert server.order_book_manager.publisher.subscriber_count("MSFT") == 0